@@ -48,8 +48,6 @@ from gramps.gen.utils.file import rm_tempdir, get_empty_tempdir
 from .clidbman import CLIDbManager, NAME_FILE, find_locker_name
 from gramps.gen.db.utils import make_database
 from gramps.gen.plug import BasePluginManager
-from gramps.gen.plug.report import CATEGORY_BOOK, CATEGORY_CODE, BookList
-from .plug import cl_report, cl_book
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 from gramps.gen.config import config
@@ -602,6 +600,9 @@ class ArgHandler:
         """
         pmgr = BasePluginManager.get_instance()
         if action == "report":
+            # the report modules are only needed for this action
+            from gramps.gen.plug.report import CATEGORY_BOOK, CATEGORY_CODE
+            from .plug import cl_report
             try:
                 options_str_dict = _split_options(options_str)
             except:
@@ -698,6 +699,8 @@ class ArgHandler:
                           file=sys.stderr)
 
         elif action == "book":
+            from gramps.gen.plug.report import BookList
+            from .plug import cl_book
             try:
                 options_str_dict = _split_options(options_str)
             except:
@@ -48,8 +48,9 @@ import logging
 from gramps.gen.plug import BasePluginManager
 from gramps.gen.config import config
 from gramps.gen.constfunc import win
-from gramps.gen.db.dbconst import DBLOGNAME, DBBACKEND
-from gramps.gen.db.utils import make_database, get_dbid_from_path
+from gramps.gen.db.dbconst import DBLOGNAME, DBBACKEND, DBMODE_R
+from gramps.gen.db.utils import (make_database, get_dbid_from_path,
+                                 read_summary, write_summary)
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 
@@ -157,13 +158,18 @@ class CLIDbManager:
         """
         dbid = get_dbid_from_path(dirpath)
         if not self.is_locked(dirpath):
-            try:
-                database = make_database(dbid)
-                database.load(dirpath, None, update=False)
-                retval = database.get_summary()
-                database.close(update=False)
-            except Exception as msg:
-                retval = {_("Unavailable"): str(msg)[:74] + "..."}
+            # use the summary saved when the tree was last closed, if the
+            # tree did not change since
+            retval = read_summary(dirpath)
+            if retval is None:
+                try:
+                    database = make_database(dbid)
+                    database.load(dirpath, None, mode=DBMODE_R, update=False)
+                    retval = database.get_summary()
+                    database.close(update=False)
+                    write_summary(dirpath, retval)
+                except Exception as msg:
+                    retval = {_("Unavailable"): str(msg)[:74] + "..."}
         else:
             retval = {_("Unavailable"): "locked"}
         retval.update({_("Family Tree"): name,
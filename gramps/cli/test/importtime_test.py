@@ -0,0 +1,105 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+""" Tests of the modules imported on the CLI path """
+
+import os
+import sys
+import subprocess
+import unittest
+
+from gramps.gen.const import ROOT_DIR
+
+# modules only needed by some actions, which must be imported on first use
+LAZY_MODULES = ('gramps.cli.plug', 'gramps.gen.plug.report',
+                'gramps.gen.plug.docgen')
+
+CLI_MODULES = ('gramps.cli.grampscli, gramps.cli.arghandler, '
+               'gramps.gen.datehandler')
+
+def import_times(statement):
+    """
+    Run statement in a new interpreter with -X importtime, and return a
+    dictionary of the imported modules with their cumulative import time in
+    microseconds.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(ROOT_DIR)
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        cwd=os.path.dirname(ROOT_DIR), env=env, universal_newlines=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+def date_modules(calendar):
+    """
+    Import the CLI modules in a new interpreter, with calendar as the date
+    locale, and return the names of the imported date handler modules.
+
+    The date handler modules are imported by importlib, which does not show
+    in the output of -X importtime, so sys.modules is checked instead.
+    """
+    statement = '\n'.join([
+        'from gramps.gen.const import GRAMPS_LOCALE',
+        'GRAMPS_LOCALE.calendar = %r' % calendar,
+        'import sys, ' + CLI_MODULES,
+        'print(" ".join(module for module in sys.modules if',
+        '      module.startswith("gramps.gen.datehandler._date_")))'])
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(ROOT_DIR)
+    process = subprocess.run(
+        [sys.executable, '-c', statement],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        cwd=os.path.dirname(ROOT_DIR), env=env, universal_newlines=True)
+    return process.stdout.split()
+
+class ImportTimeTest(unittest.TestCase):
+    """
+    The CLI entry points do not import the subsystems they may not need.
+    """
+
+    def test_cli(self):
+        times = import_times('import ' + CLI_MODULES)
+        if __debug__:
+            print("gramps.cli.grampscli: %.3f seconds" %
+                  (times['gramps.cli.grampscli'] / 1e6))
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, times)
+
+    def test_date_handlers(self):
+        """
+        Only the date handlers of the current language are imported, also
+        for the variants of a language which are not registered by name.
+        """
+        for calendar, modules in (('C', []), ('en_AU', []),
+                                  ('fr_CA', ['gramps.gen.datehandler._date_fr']),
+                                  ('nn_NO', ['gramps.gen.datehandler._date_nb'])):
+            self.assertEqual(date_modules(calendar), modules, calendar)
+
+
+if __name__ == "__main__":
+    unittest.main()
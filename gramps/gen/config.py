@@ -167,6 +167,10 @@ register('database.autobackup', 0)
 register('database.path', os.path.join(HOME_DIR, 'grampsdb'))
 register('database.host', '')
 register('database.port', '')
+register('database.sqlite-profile', 'default')
+register('database.undo-max-transactions', 1000)
+register('database.undo-max-bytes', 64 * 1024 * 1024)
+register('database.signal-rebuild-threshold', 1000)
 
 register('export.proxy-order',
          [["privacy", 0],
@@ -39,45 +39,29 @@ from ..const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
 # import prerequisites for localized handlers
 from ._datehandler import (LANG, LANG_SHORT, LANG_TO_PARSER, LANG_TO_DISPLAY,
-                           locale_tformat, main_locale)
+                           locale_tformat, main_locale, load_datehandler)
 from . import _datestrings
 
-# Import all the localized handlers
-from . import _date_ar
-from . import _date_bg
-from . import _date_ca
-from . import _date_cs
-from . import _date_da
-from . import _date_de
-from . import _date_el
-from . import _date_es
-from . import _date_fi
-from . import _date_fr
-from . import _date_hr
-from . import _date_hu
-from . import _date_is
-from . import _date_it
-from . import _date_ja
-from . import _date_lt
-from . import _date_nb
-from . import _date_nl
-from . import _date_pl
-from . import _date_pt
-from . import _date_ru
-from . import _date_sk
-from . import _date_sl
-from . import _date_sr
-from . import _date_sv
-from . import _date_uk
-from . import _date_zh_CN
-from . import _date_zh_TW
+# Import the localized handlers of the current language, the others are
+# imported on first use
+load_datehandler(LANG)
+load_datehandler(LANG_SHORT)
+
+def _get_handler(registry):
+    """
+    Return the handler of LANG, or else of LANG_SHORT. The other language
+    modules are only imported if neither of them is registered yet.
+    """
+    for lang in (LANG, LANG_SHORT):
+        if dict.__contains__(registry, lang):
+            return dict.__getitem__(registry, lang)
+    if LANG in registry:
+        return registry[LANG]
+    return registry[LANG_SHORT]
 
 # Initialize global parser
 try:
-    if LANG in LANG_TO_PARSER:
-        parser = LANG_TO_PARSER[LANG](plocale=glocale)
-    else:
-        parser = LANG_TO_PARSER[LANG_SHORT](plocale=glocale)
+    parser = _get_handler(LANG_TO_PARSER)(plocale=glocale)
 except:
     logging.warning(
         _("Date parser for '%s' not available, using default") % LANG)
@@ -91,10 +75,7 @@ except:
     val = 0
 
 try:
-    if LANG in LANG_TO_DISPLAY:
-        displayer = LANG_TO_DISPLAY[LANG](val, blocale=glocale)
-    else:
-        displayer = LANG_TO_DISPLAY[LANG_SHORT](val, blocale=glocale)
+    displayer = _get_handler(LANG_TO_DISPLAY)(val, blocale=glocale)
 except:
     logging.warning(
         _("Date displayer for '%s' not available, using default") % LANG)
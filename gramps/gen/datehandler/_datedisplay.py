@@ -49,6 +49,7 @@ log = logging.getLogger(".DateDisplay")
 from ..lib.date import Date
 from ..const import GRAMPS_LOCALE as glocale
 from ..utils.grampslocale import GrampsLocale
+from ..utils.lru import LRU
 from ._datestrings import DateStrings
 
 # _T_ is a gramps-defined keyword -- see po/update_po.py and po/genpot.sh
@@ -103,6 +104,9 @@ class DateDisplay:
     _bce_str = "%s B.C.E."
     # this will be overridden if a locale-specific date displayer exists
 
+    # number of displayed dates kept by display
+    cache_size = 10000
+
     def __init__(self, format=None, blocale=None):
         """
         :param blocale: allow translation of dates and date formats
@@ -117,6 +121,7 @@ class DateDisplay:
             self.dhformat = locale_tformat[self._locale.calendar] # date format
         else:
             self.dhformat = locale_tformat['en_GB'] # something is required
+        self._cache = LRU(self.cache_size)
         self.formats_changed() # allow overriding so a subclass can modify
         self._ds = DateStrings(self._locale)
         calendar = list(self._ds.calendar)
@@ -320,12 +325,43 @@ class DateDisplay:
                 : _("calculated|{short_month} {year}"),
         }
 
+        # The display method of the locale is wrapped by the cache. The
+        # text of the dates only matters for text-only dates.
+        self._display_uncached = self.display
+        self.display = self._display_cached
+
+    def _display_cached(self, date):
+        """
+        Return the text of the date, from the cache if the same date was
+        already displayed with the same format.
+        """
+        mod = date.modifier
+        key = (date.dateval, mod, date.quality, date.calendar, date.newyear,
+               self.format, date.text if mod == Date.MOD_TEXTONLY else None)
+        try:
+            if key in self._cache:
+                return self._cache[key]
+        except TypeError: # unhashable newyear
+            return self._display_uncached(date)
+        text = self._display_uncached(date)
+        self._cache[key] = text
+        return text
+
+    def display_many(self, dates):
+        """
+        Return the list of the texts of the given dates.
+
+        Dates with the same value are only formatted once.
+        """
+        return [self.display(date) for date in dates]
+
     def formats_changed(self):
         """ Allow overriding so a subclass can modify """
         pass
 
     def set_format(self, format):
         self.format = format
+        self._cache.clear()
 
     def format_extras(self, cal, newyear):
         """
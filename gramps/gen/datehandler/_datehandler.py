@@ -29,6 +29,7 @@ Class handling language-specific selection for date parser and displayer.
 #
 #-------------------------------------------------------------------------
 import os
+import importlib
 
 #-------------------------------------------------------------------------
 #
@@ -73,18 +74,101 @@ else:
 LANG = str(LANG)
 LANG_SHORT = str(LANG_SHORT)
 
-LANG_TO_PARSER = {
+# the modules registering the date handlers of the other languages
+LANG_MODULES = ('ar', 'bg', 'ca', 'cs', 'da', 'de', 'el', 'es', 'fi', 'fr',
+                'hr', 'hu', 'is', 'it', 'ja', 'lt', 'nb', 'nl', 'pl', 'pt',
+                'ru', 'sk', 'sl', 'sr', 'sv', 'uk', 'zh_CN', 'zh_TW')
+# the languages registered by the module of another language
+LANG_ALIASES = {'nn': 'nb'}
+_ALL_LOADED = []
+
+def load_datehandler(lang):
+    """
+    Import the module registering the date handlers of a language, if
+    there is one.
+    """
+    if lang in LANG_MODULES:
+        importlib.import_module('._date_' + lang, __package__)
+
+def load_datehandlers_for(lang):
+    """
+    Import the modules which may register the date handlers of lang.
+
+    For a language code like fr, fr_CA or HR, only the modules of that
+    language are imported. For other names, like English_United Kingdom,
+    all of the modules are imported.
+    """
+    short = lang.split('_')[0].lower()
+    if not (short.isalpha() and len(short) in (2, 3)):
+        load_datehandlers()
+        return
+    short = LANG_ALIASES.get(short, short)
+    for module in LANG_MODULES:
+        if module.split('_')[0] == short:
+            load_datehandler(module)
+
+def load_datehandlers():
+    """
+    Import the modules registering the date handlers of all the languages.
+    """
+    if not _ALL_LOADED:
+        _ALL_LOADED.append(True)
+        for lang in LANG_MODULES:
+            load_datehandler(lang)
+
+class _Registry(dict):
+    """
+    A dictionary filled by register_datehandler. Only the language modules
+    of the current locale are imported on startup. The modules of the
+    language of a missing key are imported when it is looked up, and all
+    of them when the dictionary is enumerated.
+    """
+    def __contains__(self, key):
+        if not dict.__contains__(self, key):
+            load_datehandlers_for(key)
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):
+        if not dict.__contains__(self, key):
+            load_datehandlers_for(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        load_datehandlers()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        load_datehandlers()
+        return dict.__len__(self)
+
+    def keys(self):
+        load_datehandlers()
+        return dict.keys(self)
+
+    def values(self):
+        load_datehandlers()
+        return dict.values(self)
+
+    def items(self):
+        load_datehandlers()
+        return dict.items(self)
+
+LANG_TO_PARSER = _Registry({
     'C'                     : DateParser,
-    }
+    })
 
-LANG_TO_DISPLAY = {
+LANG_TO_DISPLAY = _Registry({
     'C'                     : DateDisplayEn,
     'ko_KR'                 : DateDisplay,
-    }
+    })
 
-main_locale = { } # this will be augmented by calls to register_datehandler
+# this will be augmented by calls to register_datehandler
+main_locale = _Registry()
 
-locale_tformat = {} # locale "tformat" (date format) strings
+locale_tformat = _Registry() # locale "tformat" (date format) strings
 
 for no_handler in (
     ('C', ('%d/%m/%Y',)),
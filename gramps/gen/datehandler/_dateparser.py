@@ -49,8 +49,14 @@ log = logging.getLogger(".DateParser")
 from ..lib.date import Date, DateError, Today
 from ..const import GRAMPS_LOCALE as glocale
 from ..utils.grampslocale import GrampsLocale
+from ..utils.lru import LRU
 from ._datestrings import DateStrings
 
+# numeric date formats of the base parser, which can be parsed by the fast
+# path of DateParser.parse
+_NUMERIC = r"((\d+)[/\.]\s*)?((\d+)[/\.]\s*)?(\d+)\s*$"
+_ISO = r"(\d+)(/(\d+))?-(\d+)-(\d+)\s*$"
+
 #-------------------------------------------------------------------------
 #
 # Top-level module functions
@@ -195,6 +201,13 @@ class DateParser:
 
     _dhformat_parse = re.compile(r".*%(\S).*%(\S).*%(\S).*")
 
+    # plain years and ISO dates, see parse
+    _fast_year = re.compile(r"\s*(\d{1,4})\s*$")
+    _fast_iso = re.compile(r"\s*(\d{4})-(\d\d)-(\d\d)\s*$")
+
+    # number of parsed texts kept by parse
+    cache_size = 10000
+
     # RFC-2822 only uses capitalized English abbreviated names, no locales.
     _rfc_days = ('Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat')
     _rfc_mons_to_int = {
@@ -371,6 +384,15 @@ class DateParser:
             self.ymd = False
             self._ddmy = False
 
+        # The fast path gives the same result as set_date, as long as the
+        # parser of the locale reads numeric dates like the base parser.
+        self._fast_path = (not self._ddmy and
+                           self._numeric.pattern == _NUMERIC and
+                           self._iso.pattern == _ISO and
+                           type(self)._get_int is DateParser._get_int)
+        self._cache = LRU(self.cache_size)
+        self._today_used = False
+
     def dhformat_changed(self):
         """ Allow overriding so a subclass can modify it """
         pass
@@ -475,9 +497,8 @@ class DateParser:
                                  % self._smon_str, re.IGNORECASE)
         self._stext2 = re.compile(r'(\d+)?\s+?%s\.?\s*((\d+)(/\d+)?)?\s*$'
                                   % self._smon_str, re.IGNORECASE)
-        self._numeric = re.compile(
-            r"((\d+)[/\.]\s*)?((\d+)[/\.]\s*)?(\d+)\s*$")
-        self._iso = re.compile(r"(\d+)(/(\d+))?-(\d+)-(\d+)\s*$")
+        self._numeric = re.compile(_NUMERIC)
+        self._iso = re.compile(_ISO)
         self._isotimestamp = re.compile(
             r"^\s*?(\d{4})([01]\d)([0123]\d)(?:(?:[012]\d[0-5]\d[0-5]\d)|"
             r"(?:\s+[012]\d:[0-5]\d(?::[0-5]\d)?))?\s*?$")
@@ -715,6 +736,7 @@ class DateParser:
 
         match = self._today.match(text)
         if match:
+            self._today_used = True
             today = Today()
             if cal:
                 today = today.to_calendar(cal)
@@ -945,13 +967,52 @@ class DateParser:
     def invert_year(self, subdate):
         return (subdate[0], subdate[1], -subdate[2], subdate[3])
 
+    def set_date_fast(self, date, text):
+        """
+        Set the date if the text is a plain year or an ISO date, without
+        trying all the other formats.
+
+        Return True on success, False if the text must be parsed by
+        :meth:`set_date`.
+        """
+        if not self._fast_path:
+            return False
+        match = self._fast_year.match(text)
+        if match:
+            value = (0, 0, int(match.group(1)), False)
+        else:
+            match = self._fast_iso.match(text)
+            if not match:
+                return False
+            (year, month, day) = map(int, match.groups())
+            if not gregorian_valid((day, month, year)):
+                return False
+            value = (day, month, year, False)
+        if value == Date.EMPTY:
+            return False
+        date.set_text_value(text.strip())
+        date.set(Date.QUAL_NONE, Date.MOD_NONE, Date.CAL_GREGORIAN, value,
+                 newyear=Date.NEWYEAR_JAN1)
+        return True
+
     def parse(self, text):
         """
         Parses the text, returning a :class:`.Date` object.
+
+        Imports parse the same texts over and over, so the results are kept
+        in a bounded cache, and a copy of the cached date is returned when
+        the same text is parsed again. Dates relative to today are not
+        cached.
         """
+        if text in self._cache:
+            return Date(self._cache[text])
         new_date = Date()
+        self._today_used = False
         try:
-            self.set_date(new_date, text)
+            if not self.set_date_fast(new_date, text):
+                self.set_date(new_date, text)
         except DateError:
             new_date.set_as_text(text)
+        if not self._today_used:
+            self._cache[text] = Date(new_date)
         return new_date
@@ -24,6 +24,7 @@ Deeper testing of some DateParser internals.
 """
 
 import unittest
+from time import perf_counter
 
 from ...utils.grampslocale import GrampsLocale
 from ...lib.date import Date
@@ -146,5 +147,56 @@ class DateDisplayInflectionsTestRU(DateDisplayTest):
             self.assertIn("с мая", self.dd.display(f1945may_t1946may))
             self.assertIn("по май", self.dd.display(f1945may_t1946may))
 
+class DateDisplayCacheTest(DateDisplayTest):
+    def setUp(self):
+        DateDisplayTest.setUp(self)
+        self.dates = []
+        for year in range(1800, 1900):
+            for (mod, quality) in ((Date.MOD_NONE, Date.QUAL_NONE),
+                                   (Date.MOD_ABOUT, Date.QUAL_NONE),
+                                   (Date.MOD_BEFORE, Date.QUAL_ESTIMATED)):
+                date = Date()
+                date.set(quality, mod, Date.CAL_GREGORIAN,
+                         (year % 28 + 1, year % 12 + 1, year, False))
+                self.dates.append(date)
+        text_date = Date()
+        text_date.set_as_text("unknown")
+        self.dates.append(text_date)
+
+    def test_same_as_uncached(self):
+        for format in range(len(self.display.formats)):
+            self.display.set_format(format)
+            for dummy in range(2):
+                self.assertEqual(
+                    self.display.display_many(self.dates),
+                    [self.display._display_uncached(date)
+                     for date in self.dates])
+
+    def test_text_only(self):
+        date = Date()
+        date.set_as_text("unknown")
+        other = Date()
+        other.set_as_text("other")
+        self.assertEqual(self.display.display(date), "unknown")
+        self.assertEqual(self.display.display(other), "other")
+
+    def test_speed(self):
+        """
+        Compare the time needed to display the dates many times with and
+        without the cache.
+        """
+        self.display.set_format(4)
+        dates = self.dates * 20
+        stime = perf_counter()
+        for date in dates:
+            self.display._display_uncached(date)
+        uncached = perf_counter() - stime
+        stime = perf_counter()
+        self.display.display_many(dates)
+        cached = perf_counter() - stime
+        if __debug__:
+            print("%d dates: %.3fs uncached, %.3fs cached" %
+                  (len(dates), uncached, cached))
+
 if __name__ == "__main__":
     unittest.main()
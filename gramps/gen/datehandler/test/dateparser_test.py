@@ -24,6 +24,7 @@ Deeper testing of some DateParser internals.
 """
 
 import unittest
+from time import perf_counter
 
 from ...utils.grampslocale import GrampsLocale
 from ...lib.date import Date
@@ -121,5 +122,68 @@ class Test_generate_variants(unittest.TestCase):
         v = self.month_variants[5]
         self.assertIn("Maj", v)
 
+class ParseCacheTest(unittest.TestCase):
+    """
+    Tests of the parse cache and of the fast path, for all the parsers.
+    """
+    TEXTS = ["1850", " 1850 ", "0", "0000-00-00", "1900-01-31",
+             "1900-02-30", "2000-02-29", "12345", "1850-1-2",
+             "abt 1850", "1 JAN 1900", "bet 1850 and 1860", "from 1 to 2",
+             "2 Feb 1901 (Julian)", "est 1820", "nonsense"]
+
+    @classmethod
+    def setUpClass(cls):
+        from .._datehandler import LANG_TO_PARSER
+        langs = {}
+        for lang, parser_class in sorted(LANG_TO_PARSER.items()):
+            langs.setdefault(parser_class, lang)
+        cls.parsers = [parser_class(plocale=GrampsLocale(lang=lang))
+                       for (parser_class, lang) in langs.items()]
+
+    def test_same_as_set_date(self):
+        for parser in self.parsers:
+            for text in self.TEXTS:
+                date = Date()
+                parser.set_date(date, text)
+                # once parsed, then from the cache
+                for dummy in range(2):
+                    self.assertEqual(parser.parse(text).serialize(),
+                                     date.serialize(),
+                                     msg="%s %r" % (parser.__class__.__name__,
+                                                    text))
+
+    def test_copies(self):
+        parser = self.parsers[0]
+        date = parser.parse("1 JAN 1900")
+        date.set_yr_mon_day(1901, 2, 3)
+        self.assertEqual(parser.parse("1 JAN 1900").get_ymd(), (1900, 1, 1))
+        self.assertIsNot(parser.parse("1850"), parser.parse("1850"))
+
+    def test_today_not_cached(self):
+        parser = self.parsers[0]
+        parser.parse("today")
+        self.assertNotIn("today", parser._cache)
+
+    def test_throughput(self):
+        """
+        Compare the number of dates parsed per second with and without
+        the cache.
+        """
+        texts = self.TEXTS * 100
+        for parser in self.parsers:
+            stime = perf_counter()
+            for text in texts:
+                parser._cache.clear()
+                parser.parse(text)
+            uncached = perf_counter() - stime
+            stime = perf_counter()
+            for text in texts:
+                parser.parse(text)
+            cached = perf_counter() - stime
+            if __debug__:
+                print("%s: %d/s uncached, %d/s cached" %
+                      (parser.__class__.__name__, len(texts) / uncached,
+                       len(texts) / cached))
+
 if __name__ == "__main__":
     unittest.main()
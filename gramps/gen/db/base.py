@@ -123,6 +123,22 @@ class DbReadBase:
         """
         raise NotImplementedError
 
+    def iter_references(self):
+        """
+        Return an iterator over all the references stored in the database,
+        as (obj_class, obj_handle, ref_class, ref_handle) tuples, where the
+        obj is the object holding the reference to ref.
+        """
+        raise NotImplementedError
+
+    def find_person_handles_by_soundex(self, code):
+        """
+        Return a list of the handles of the people having a first name,
+        surname, call name, nickname or family nickname, in their primary
+        or alternate names, with the given soundex code.
+        """
+        raise NotImplementedError
+
     def find_initial_person(self):
         """
         Returns first person in the database
@@ -1416,6 +1432,22 @@ class DbReadBase:
         """
         raise NotImplementedError
 
+    def get_revision(self):
+        """
+        Return a counter which is incremented each time an object is added,
+        changed or removed, so that derived data can be cached for as long
+        as it does not change.
+        """
+        raise NotImplementedError
+
+    def get_changes(self, revision):
+        """
+        Return the set of the (object key, handle) pairs of the objects
+        added, changed or removed since get_revision() returned revision,
+        or None if they are not all known.
+        """
+        raise NotImplementedError
+
     def get_summary(self):
         """
         Returns dictionary of summary item.
@@ -1647,6 +1679,13 @@ class DbWriteBase(DbReadBase):
         """
         raise NotImplementedError
 
+    def set_signal_scheduler(self, scheduler):
+        """
+        Set the function used to delay the emission, and merge the signals,
+        of the committed transactions, for example GLib.idle_add.
+        """
+        raise NotImplementedError
+
     def rebuild_secondary(self, callback):
         """
         Rebuild secondary indices
@@ -29,9 +29,10 @@ Declare constants used by database modules
 #
 #-------------------------------------------------------------------------
 __all__ = ( 'DBPAGE', 'DBMODE', 'DBCACHE', 'DBLOCKS', 'DBOBJECTS', 'DBUNDO',
+            'DBCHANGES',
             'DBEXT', 'DBMODE_R', 'DBMODE_W', 'DBUNDOFN', 'DBLOCKFN',
             'DBRECOVFN','BDBVERSFN', 'DBLOGNAME', 'SCHVERSFN', 'PCKVERSFN',
-            'DBBACKEND',
+            'DBBACKEND', 'DBSUMMARYFN',
             'PERSON_KEY', 'FAMILY_KEY', 'SOURCE_KEY', 'CITATION_KEY',
             'EVENT_KEY', 'MEDIA_KEY', 'PLACE_KEY', 'REPOSITORY_KEY',
             'NOTE_KEY', 'REFERENCE_KEY', 'TAG_KEY',
@@ -45,6 +46,7 @@ DBLOCKFN = "lock"          # File name of lock file
 DBRECOVFN = "need_recover"  # File name of recovery file
 BDBVERSFN = "bdbversion.txt"# File name of Berkeley DB version file
 DBBACKEND = "database.txt"  # File name of Database backend file
+DBSUMMARYFN = "summary.json" # File name of the saved summary of the database
 SCHVERSFN = "schemaversion.txt"# File name of schema version file
 PCKVERSFN = "pickleupgrade.txt" # Indicator that pickle has been upgrade t Python3
 DBLOGNAME = ".Db"           # Name of logger
@@ -56,6 +58,7 @@ DBCACHE = 0x4000000       # Size of the shared memory buffer pool
 DBLOCKS = 100000          # Maximum number of locks supported
 DBOBJECTS = 100000          # Maximum number of simultaneously locked objects
 DBUNDO = 1000            # Maximum size of undo buffer
+DBCHANGES = 10000        # Maximum number of changes given by get_changes
 ARRAYSIZE = 1000            # The arraysize for a SQL cursor
 
 PERSON_KEY = 0
@@ -35,6 +35,9 @@ import ast
 import sys
 import datetime
 import glob
+import io
+from collections import deque
+from itertools import chain, islice
 
 #------------------------------------------------------------------------
 #
@@ -45,8 +48,8 @@ from . import (DbReadBase, DbWriteBase, DbUndo, DBLOGNAME, DBUNDOFN,
                REFERENCE_KEY, PERSON_KEY, FAMILY_KEY,
                CITATION_KEY, SOURCE_KEY, EVENT_KEY, MEDIA_KEY, PLACE_KEY,
                REPOSITORY_KEY, NOTE_KEY, TAG_KEY, TXNADD, TXNUPD, TXNDEL,
-               KEY_TO_NAME_MAP, DBMODE_R, DBMODE_W)
-from .utils import write_lock_file, clear_lock_file
+               KEY_TO_NAME_MAP, DBMODE_R, DBMODE_W, DBCHANGES)
+from .utils import write_lock_file, clear_lock_file, write_summary
 from ..errors import HandleError
 from ..utils.callback import Callback
 from ..updatecallback import UpdateCallback
@@ -57,12 +60,16 @@ from ..lib.researcher import Researcher
 from ..lib import (Tag, Media, Person, Family, Source, Citation, Event,
                    Place, Repository, Note, NameOriginType)
 from ..lib.genderstats import GenderStats
+from ..soundex import soundex
 from ..config import config
 from ..const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 
 LOG = logging.getLogger(DBLOGNAME)
 
+# approximate memory used by the offset and length of one undo record
+_RECORD_OVERHEAD = 100
+
 SIGBASE = ('person', 'family', 'source', 'event', 'media',
            'place', 'repository', 'reference', 'note', 'tag', 'citation')
 
@@ -78,50 +85,167 @@ def touch(fname, mode=0o666, dir_fd=None, **kwargs):
                      dir_fd=None if os.supports_fd else dir_fd, **kwargs)
 
 class DbGenericUndo(DbUndo):
-    def __init__(self, grampsdb, path):
+    """
+    Undo/redo records of a DbGeneric database.
+
+    The pickled records are appended to a log file in the database directory,
+    and only their offset and length are kept in memory; a record is read
+    back when its transaction is undone or redone. Without a database
+    directory, or when the database is read only, the log is kept in
+    memory, so that the log of another session is left alone.
+
+    The oldest transactions are forgotten when there are more than
+    max_transactions of them, or when their records take more than
+    max_bytes. The log is compacted when the forgotten records take more
+    space than the ones still in use.
+    """
+    def __init__(self, grampsdb, path, max_transactions=0, max_bytes=0):
         super(DbGenericUndo, self).__init__(grampsdb)
-        self.undodb = []
+        self.undodb = None
+        self.path = path
+        self.max_transactions = max_transactions
+        self.max_bytes = max_bytes
+        self.created = False    # the log file was created by this instance
+        self.records = []       # (offset, length) of each record in the log
+        self.size = 0           # total length of the records in the log
+        self.unused = 0         # length of the records of forgotten txns
 
     def open(self, value=None):
         """
-        Open the backing storage.  Needs to be overridden in the derived
-        class.
+        Open the log file.
         """
-        pass
+        self.undodb = None
+        self.created = False
+        if (self.path and not getattr(self.db, 'readonly', False) and
+                os.path.isdir(os.path.dirname(self.path))):
+            try:
+                self.undodb = open(self.path, 'w+b')
+                self.created = True
+            except OSError as msg:
+                LOG.warning("Undo log kept in memory: %s", msg)
+        if self.undodb is None:
+            self.undodb = io.BytesIO()
+        self.records = []
+        self.size = 0
+        self.unused = 0
 
     def close(self):
         """
-        Close the backing storage.  Needs to be overridden in the derived
-        class.
+        Close the log, and remove the log file if this instance created it.
         """
-        pass
+        if self.undodb is not None:
+            self.undodb.close()
+            self.undodb = None
+            if self.created and os.path.isfile(self.path):
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+            self.created = False
+        self.records = []
+        self.clear()
+
+    def clear(self):
+        """
+        Clear the undo/redo list, and the records in the log.
+        """
+        super(DbGenericUndo, self).clear()
+        if self.undodb is not None:
+            self.undodb.seek(0)
+            self.undodb.truncate()
+            self.records = []
+            self.size = 0
+            self.unused = 0
 
     def append(self, value):
         """
-        Add a new entry on the end.  Needs to be overridden in the derived
-        class.
+        Add a new entry on the end.
         """
-        self.undodb.append(value)
+        offset = self.undodb.seek(0, io.SEEK_END)
+        self.undodb.write(value)
+        self.records.append((offset, len(value)))
+        self.size += len(value)
+        return len(self.records) - 1
 
     def __getitem__(self, index):
         """
-        Returns an entry by index number.  Needs to be overridden in the
-        derived class.
+        Returns an entry by index number.
         """
-        return self.undodb[index]
+        offset, length = self.records[index]
+        self.undodb.seek(offset)
+        return self.undodb.read(length)
 
     def __setitem__(self, index, value):
         """
-        Set an entry to a value.  Needs to be overridden in the derived class.
+        Set an entry to a value.
         """
-        self.undodb[index] = value
+        self.unused += self.records[index][1]
+        offset = self.undodb.seek(0, io.SEEK_END)
+        self.undodb.write(value)
+        self.records[index] = (offset, len(value))
+        self.size += len(value)
 
     def __len__(self):
         """
-        Returns the number of entries.  Needs to be overridden in the derived
-        class.
+        Returns the number of entries.
+        """
+        return len(self.records)
+
+    def get_memory_usage(self):
+        """
+        Return the number of bytes of records in the log, and the number of
+        bytes of them kept in memory.
+        """
+        in_memory = self.size if isinstance(self.undodb, io.BytesIO) else 0
+        return (self.size - self.unused,
+                in_memory + len(self.records) * _RECORD_OVERHEAD)
+
+    def commit(self, txn, msg):
+        """
+        Commit the transaction, then forget the oldest transactions if the
+        limits are exceeded.
+        """
+        super(DbGenericUndo, self).commit(txn, msg)
+        while len(self.undoq) > 1 and (
+                (self.max_transactions and
+                 len(self.undoq) > self.max_transactions) or
+                (self.max_bytes and self.size - self.unused > self.max_bytes)):
+            old_txn = self.undoq.popleft()
+            self.unused += sum(self.records[recno][1]
+                               for recno in old_txn.get_recnos())
+        if self.unused > self.size - self.unused:
+            self.compact()
+
+    def compact(self):
         """
-        return len(self.undodb)
+        Rewrite the log with only the records of the transactions that can
+        still be undone or redone, numbering them again.
+        """
+        if isinstance(self.undodb, io.BytesIO):
+            new_log = io.BytesIO()
+        else:
+            new_log = open(self.path + '.new', 'w+b')
+        records = []
+        for txn in chain(self.undoq, self.redoq):
+            recnos = txn.get_recnos()
+            if not recnos:
+                continue
+            first = len(records)
+            for recno in recnos:
+                data = self[recno]
+                records.append((new_log.tell(), len(data)))
+                new_log.write(data)
+            txn.first = first
+            txn.last = len(records) - 1
+        self.undodb.close()
+        if not isinstance(new_log, io.BytesIO):
+            new_log.close()
+            os.replace(self.path + '.new', self.path)
+            new_log = open(self.path, 'r+b')
+        self.undodb = new_log
+        self.records = records
+        self.size = sum(length for (offset, length) in records)
+        self.unused = 0
 
     def _redo(self, update_history):
         """
@@ -141,7 +265,7 @@ class DbGenericUndo(DbUndo):
             self.db._txn_begin()
             for record_id in subitems:
                 (key, trans_type, handle, old_data, new_data) = \
-                    pickle.loads(self.undodb[record_id])
+                    pickle.loads(self[record_id])
 
                 if key == REFERENCE_KEY:
                     self.db.undo_reference(new_data, handle)
@@ -190,7 +314,7 @@ class DbGenericUndo(DbUndo):
             self.db._txn_begin()
             for record_id in subitems:
                 (key, trans_type, handle, old_data, new_data) = \
-                        pickle.loads(self.undodb[record_id])
+                        pickle.loads(self[record_id])
 
                 if key == REFERENCE_KEY:
                     self.db.undo_reference(old_data, handle)
@@ -227,6 +351,7 @@ class DbGenericUndo(DbUndo):
         We want to do deletes and adds first
         Note that if 'undo' we swap emits
         """
+        self.db.emit_pending_signals()
         for trans_type in [TXNDEL, TXNADD, TXNUPD]:
             for obj_type in range(11):
                 handles = sigs[obj_type][trans_type]
@@ -537,6 +662,11 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         self.abort_possible = False
         self._bm_changes = 0
         self.has_changed = False
+        self.revision = 0
+        self._changes = deque(maxlen=DBCHANGES)
+        self._pending_signals = {}
+        self._signal_scheduler = None
+        self._signal_scheduled = False
         self.surname_list = []
         self.genderStats = GenderStats() # can pass in loaded stats as dict
         self.owner = Researcher()
@@ -591,10 +721,23 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
 
         # run backend-specific code:
         self._initialize(directory, username, password)
+        # every object of the previous tree, if any, changed
+        self._changes.clear()
+        self.revision += 1
 
         if not self._schema_exists():
             self._create_schema()
             self._set_metadata('version', str(self.VERSION[0]))
+        self._update_schema()
+
+        if not update:
+            # only opened for its summary, see read_summary
+            self._set_save_path(directory)
+            self.undolog = None
+            self.undodb = DbGenericUndo(self, None)
+            self.undodb.open()
+            self.db_is_open = True
+            return
 
         # Load metadata
         self.name_formats = self._get_metadata('name_formats')
@@ -630,8 +773,9 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         self.event_attributes = self._get_metadata('eattr_names', set())
         self.place_types = self._get_metadata('place_types', set())
 
-        # surname list
-        self.surname_list = self.get_surname_list()
+        # surname list and gender statistics, loaded on first use
+        self.surname_list = None
+        self._gender_stats = None
 
         self._set_save_path(directory)
 
@@ -639,13 +783,12 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
             self.undolog = os.path.join(self._directory, DBUNDOFN)
         else:
             self.undolog = None
-        self.undodb = DbGenericUndo(self, self.undolog)
+        self.undodb = DbGenericUndo(
+            self, self.undolog,
+            config.get('database.undo-max-transactions'),
+            config.get('database.undo-max-bytes'))
         self.undodb.open()
 
-        # Other items to load
-        gstats = self.get_gender_stats()
-        self.genderStats = GenderStats(gstats)
-
         # Indexes:
         self.cmap_index = self._get_metadata('cmap_index', 0)
         self.smap_index = self._get_metadata('smap_index', 0)
@@ -659,6 +802,13 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
 
         self.db_is_open = True
 
+    def _update_schema(self):
+        """
+        Add the parts of the schema introduced after the creation of an
+        existing database. Backend-specific.
+        """
+        pass
+
     def _close(self):
         """
         Close database backend.
@@ -670,6 +820,9 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         Close the database.
         if update is False, don't change access times, etc.
         """
+        # the listeners must not fetch changed objects from a closed database
+        self._pending_signals = {}
+        summary = None
         if self._directory != ":memory:":
             if update and not self.readonly:
                 # This is just a dummy file to indicate last modified time of
@@ -715,8 +868,8 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
                 self._set_metadata('place_types', self.place_types)
 
                 # Save misc items:
-                if self.has_changed:
-                    self.save_gender_stats(self.genderStats)
+                if self.has_changed and self._gender_stats is not None:
+                    self.save_gender_stats(self._gender_stats)
 
                 # Indexes:
                 self._set_metadata('cmap_index', self.cmap_index)
@@ -728,8 +881,12 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
                 self._set_metadata('omap_index', self.omap_index)
                 self._set_metadata('rmap_index', self.rmap_index)
                 self._set_metadata('nmap_index', self.nmap_index)
+                summary = self.get_summary()
 
             self._close()
+            self.undodb.close()
+            if summary is not None:
+                write_summary(self._directory, summary)
 
             try:
                 clear_lock_file(self.get_save_path())
@@ -749,6 +906,30 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         """
         return self.brief_name
 
+    def get_revision(self):
+        """
+        Return the number of object changes since the database was opened.
+        """
+        return self.revision
+
+    def get_changes(self, revision):
+        """
+        Return the set of the (object key, handle) pairs of the objects
+        added, changed or removed since get_revision() returned revision,
+        or None if they are not all in the log of the last changes.
+        """
+        number = self.revision - revision
+        if number < 0 or number > len(self._changes):
+            return None
+        return set(islice(reversed(self._changes), number))
+
+    def _add_change(self, obj_key, handle):
+        """
+        Increment the revision counter and log the change of an object.
+        """
+        self.revision += 1
+        self._changes.append((obj_key, handle))
+
     def get_dbname(self):
         """
         In DbGeneric, the database is in a text file at the path
@@ -2035,7 +2216,14 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         Remove the Person specified by the database handle from the
         database, preserving the change in the passed transaction.
         """
+        data = None
+        if handle and not self.readonly:
+            data = self._get_raw_data(PERSON_KEY, handle)
         self._do_remove(handle, transaction, PERSON_KEY)
+        if data:
+            person = Person.create(data)
+            self.genderStats.uncount_person(person)
+            self.remove_from_surname_list(person)
 
     def remove_source(self, handle, transaction):
         """
@@ -2292,13 +2480,26 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         """
         Return the list of locale-sorted surnames contained in the database.
         """
+        if self.surname_list is None:
+            self.surname_list = self._get_surname_list()
         return self.surname_list
 
+    def _get_surname_list(self):
+        """
+        Return the sorted list of the surnames of the people, read from the
+        backend.
+        """
+        raise NotImplementedError
+
     def add_to_surname_list(self, person, batch_transaction):
         """
         Add surname to surname list
         """
+        if self.surname_list is None:
+            return
         if batch_transaction:
+            # too many changes, read it again on next use
+            self.surname_list = None
             return
         name = None
         primary_name = person.get_primary_name()
@@ -2323,6 +2524,8 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         If not then we need to remove the name from the list.
         The function must be overridden in the derived class.
         """
+        if self.surname_list is None:
+            return
         name = None
         primary_name = person.get_primary_name()
         if primary_name:
@@ -2341,6 +2544,19 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         """
         raise NotImplementedError
 
+    @property
+    def genderStats(self):
+        """
+        The :class:`.GenderStats` of the database, read on first use.
+        """
+        if self._gender_stats is None:
+            self._gender_stats = GenderStats(self.get_gender_stats())
+        return self._gender_stats
+
+    @genderStats.setter
+    def genderStats(self, gstats):
+        self._gender_stats = gstats
+
     def save_gender_stats(self, gstats):
         raise NotImplementedError
 
@@ -2350,7 +2566,118 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
     def set_researcher(self, owner):
         self.owner.set_from(owner)
 
+    def set_signal_scheduler(self, scheduler):
+        """
+        Set the function used to delay the emission of the signals of the
+        committed transactions, for example GLib.idle_add. It is called with
+        :meth:`emit_pending_signals` as only argument.
+
+        The signals of all the transactions committed before the scheduled
+        call are merged, so that the listeners see each changed object once.
+        Without a scheduler, the signals are emitted at the end of each
+        transaction.
+        """
+        self.emit_pending_signals()
+        self._signal_scheduler = scheduler
+
+    def _queue_signals(self, txn):
+        """
+        Add the changes of a committed transaction to the pending signals,
+        and schedule their emission.
+
+        Across transactions, an object added then deleted is forgotten, an
+        object updated then deleted is only deleted, and an object deleted
+        then added again is updated.
+        """
+        for obj_type in range(11):
+            if obj_type == REFERENCE_KEY:
+                continue
+            deleted = [handle for (handle, data)
+                       in txn.get((obj_type, TXNDEL), [])]
+            changed = {}
+            for trans_type in [TXNADD, TXNUPD]:
+                changed[trans_type] = [
+                    handle for (handle, data)
+                    in txn.get((obj_type, trans_type), [])
+                    if (handle, None) not in txn[(obj_type, TXNDEL)]]
+            if not (deleted or changed[TXNADD] or changed[TXNUPD]):
+                continue
+            pending, seen = self._pending_signals.setdefault(
+                obj_type, ({TXNADD: [], TXNUPD: [], TXNDEL: []},
+                           {TXNADD: set(), TXNUPD: set(), TXNDEL: set()}))
+            if deleted:
+                deleted_set = set(deleted)
+                forgotten = deleted_set & seen[TXNADD]
+                self.__unqueue(pending, seen, TXNADD, forgotten)
+                self.__unqueue(pending, seen, TXNUPD, deleted_set)
+                deleted = [handle for handle in deleted
+                           if handle not in forgotten]
+            readded = (set(changed[TXNADD]) | set(changed[TXNUPD])) \
+                & seen[TXNDEL]
+            self.__unqueue(pending, seen, TXNDEL, readded)
+            pending[TXNDEL].extend(deleted)
+            seen[TXNDEL].update(deleted)
+            for trans_type in [TXNADD, TXNUPD]:
+                for handle in changed[trans_type]:
+                    queue = TXNUPD if handle in readded else trans_type
+                    pending[queue].append(handle)
+                    seen[queue].add(handle)
+        if not self._pending_signals:
+            return
+        if self._signal_scheduler is None:
+            self.emit_pending_signals()
+        elif not self._signal_scheduled:
+            self._signal_scheduled = True
+            self._signal_scheduler(self.emit_pending_signals)
+
+    @staticmethod
+    def __unqueue(pending, seen, trans_type, handles):
+        """
+        Remove the given handles from the pending signals of trans_type.
+        """
+        handles = handles & seen[trans_type]
+        if handles:
+            pending[trans_type] = [handle for handle in pending[trans_type]
+                                   if handle not in handles]
+            seen[trans_type] -= handles
+
+    def emit_pending_signals(self):
+        """
+        Emit the signals of the changes queued by the committed transactions.
+
+        Deletes are emitted first, then adds and updates. When more objects
+        of a type were added or updated than the
+        'database.signal-rebuild-threshold' setting, a single rebuild signal
+        is emitted for the adds and updates of that type instead. Deletes
+        are always emitted, as many listeners only watch for them.
+        """
+        self._signal_scheduled = False
+        pending, self._pending_signals = self._pending_signals, {}
+        threshold = config.get('database.signal-rebuild-threshold')
+        action = {TXNADD: "-add",
+                  TXNUPD: "-update",
+                  TXNDEL: "-delete"}
+        for obj_type in range(11):
+            if obj_type in pending and pending[obj_type][0][TXNDEL]:
+                self.emit(KEY_TO_NAME_MAP[obj_type] + action[TXNDEL],
+                          (pending[obj_type][0][TXNDEL], ))
+        for obj_type in list(pending):
+            changed = pending[obj_type][0]
+            if threshold and (len(changed[TXNADD]) +
+                              len(changed[TXNUPD])) > threshold:
+                del pending[obj_type]
+                self.emit(KEY_TO_NAME_MAP[obj_type] + '-rebuild')
+        for trans_type in [TXNADD, TXNUPD]:
+            for obj_type in range(11):
+                if obj_type not in pending:
+                    continue
+                handles = pending[obj_type][0][trans_type]
+                if handles:
+                    self.emit(KEY_TO_NAME_MAP[obj_type] + action[trans_type],
+                              (handles, ))
+
     def request_rebuild(self):
+        self.emit_pending_signals()
         self.emit('person-rebuild')
         self.emit('family-rebuild')
         self.emit('place-rebuild')
@@ -2454,6 +2781,21 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
                         surname = surname_obj.surname
         return (given_name, surname)
 
+    def _get_person_soundex(self, person):
+        """
+        Given a Person, return the set of soundex codes of the name parts
+        searched by the HasSoundexName rule, without the code of empty names.
+        """
+        codes = set()
+        for name in [person.get_primary_name()] + person.get_alternate_names():
+            parts = [name.get_first_name(), name.get_call_name(),
+                     name.get_nick_name(), name.get_family_nick_name()]
+            parts.extend(surn.get_surname()
+                         for surn in name.get_surname_list())
+            codes.update(soundex(str(part)) for part in parts)
+        codes.discard("Z000")
+        return codes
+
     def _get_place_data(self, place):
         """
         Given a Place, return the first PlaceRef handle.
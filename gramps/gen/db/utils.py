@@ -30,6 +30,7 @@ Database utilites
 #
 #------------------------------------------------------------------------
 import os
+import json
 import logging
 
 #------------------------------------------------------------------------
@@ -41,7 +42,8 @@ from ..plug import BasePluginManager
 from ..const import PLUGINS_DIR, USER_PLUGINS
 from ..constfunc import win, get_env_var
 from ..config import config
-from .dbconst import DBLOGNAME, DBLOCKFN, DBBACKEND
+from ..const import GRAMPS_LOCALE as glocale
+from .dbconst import DBLOGNAME, DBLOCKFN, DBBACKEND, DBSUMMARYFN, DBUNDOFN
 
 #-------------------------------------------------------------------------
 #
@@ -227,3 +229,53 @@ def write_lock_file(name):
         # Save only the username and host, so the massage can be
         # printed with correct locale in DbManager.py when a lock is found
         f.write(text)
+
+def __get_file_stamps(directory):
+    """
+    Return the modification time and size of the files of a database
+    directory, except the files which change without changing the data.
+    """
+    stamps = {}
+    for filename in os.listdir(directory):
+        if filename in (DBSUMMARYFN, DBLOCKFN, DBUNDOFN, "name.txt"):
+            continue
+        stat = os.stat(os.path.join(directory, filename))
+        # read-only SQLite connections leave an empty write-ahead log and
+        # its shared memory index behind
+        if (filename.endswith('-shm') or
+                (filename.endswith('-wal') and stat.st_size == 0)):
+            continue
+        stamps[filename] = [stat.st_mtime_ns, stat.st_size]
+    return stamps
+
+def write_summary(directory, summary):
+    """
+    Save the summary of a closed database in its directory, with the state
+    of the database files, so that read_summary can tell if it is still up
+    to date.
+    """
+    data = {'language': glocale.language[0],
+            'files': __get_file_stamps(directory),
+            'summary': list(summary.items())}
+    try:
+        with open(os.path.join(directory, DBSUMMARYFN), "w",
+                  encoding='utf8') as summary_file:
+            json.dump(data, summary_file)
+    except (OSError, TypeError, ValueError) as msg:
+        _LOG.warning("Cannot save the summary of %s: %s", directory, msg)
+
+def read_summary(directory):
+    """
+    Return the summary saved by write_summary, or None if there is none, or
+    if the database changed since it was saved.
+    """
+    try:
+        with open(os.path.join(directory, DBSUMMARYFN), "r",
+                  encoding='utf8') as summary_file:
+            data = json.load(summary_file)
+        if (data['language'] != glocale.language[0] or
+                data['files'] != __get_file_stamps(directory)):
+            return None
+        return dict(data['summary'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
@@ -70,6 +70,7 @@ from ..const import ARABIC_COMMA, ARABIC_SEMICOLON, GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
 from ..lib.name import Name
 from ..lib.nameorigintype import NameOriginType
+from ..utils.lru import LRU
 
 try:
     from ..config import config
@@ -332,6 +333,9 @@ class NameDisplay:
     format_funcs = {}
     raw_format_funcs = {}
 
+    # number of formatted names kept in each of the caches
+    cache_size = 20000
+
     def __init__(self, xlocale=glocale):
         """
         Initialize the NameDisplay class.
@@ -369,6 +373,10 @@ class NameDisplay:
         self.LNFN_STR = "%s" + COMMAGLYPH + " %s %s"
 
         self.name_formats = {}
+        # formatted names, keyed by the format number, the pa/matronymic
+        # setting and the parts of the name used by the formats
+        self._cache = LRU(self.cache_size)
+        self._raw_cache = LRU(self.cache_size)
 
         if WITH_GRAMPS_CONFIG:
             self.default_format = config.get('preferences.name-format')
@@ -392,6 +400,45 @@ class NameDisplay:
         global PAT_AS_SURN
         PAT_AS_SURN = config.get('preferences.patronimic-surname')
 
+    def clear_cache(self):
+        """
+        Forget the formatted names, after a change of the formats.
+        """
+        self._cache.clear()
+        self._raw_cache.clear()
+
+    def _format_name(self, num, name):
+        """
+        Return the name formatted with format num, from the cache if the
+        same name was already formatted.
+        """
+        key = (num, PAT_AS_SURN, name.first_name,
+               tuple(surn.serialize() for surn in name.surname_list),
+               name.suffix, name.title, name.call, name.nick, name.famnick)
+        if key in self._cache:
+            return self._cache[key]
+        text = self.name_formats[num][_F_FN](name)
+        self._cache[key] = text
+        return text
+
+    def _format_raw_name(self, num, raw_data):
+        """
+        Return the raw name formatted with format num, from the cache if the
+        same name was already formatted.
+        """
+        try:
+            key = (num, PAT_AS_SURN, raw_data[_FIRSTNAME],
+                   tuple(tuple(surn) for surn in raw_data[_SURNAME_LIST]),
+                   raw_data[_SUFFIX], raw_data[_TITLE], raw_data[_CALL],
+                   raw_data[_NICK], raw_data[_FAMNICK])
+            if key in self._raw_cache:
+                return self._raw_cache[key]
+        except TypeError: # lists in the surname data
+            return self.name_formats[num][_F_RAWFN](raw_data)
+        text = self.name_formats[num][_F_RAWFN](raw_data)
+        self._raw_cache[key] = text
+        return text
+
     def get_pat_as_surn(self):
         global PAT_AS_SURN
         return PAT_AS_SURN
@@ -422,6 +469,7 @@ class NameDisplay:
         self.name_formats = {num: value
                              for num, value in self.name_formats.items()
                              if num >= 0}
+        self.clear_cache()
 
     def set_name_format(self, formats):
 
@@ -436,6 +484,7 @@ class NameDisplay:
             func_raw = raw_func_dict.get(num, self._format_raw_fn(fmt_str))
             self.name_formats[num] = (name, fmt_str, act, func, func_raw)
         self.set_default_format(self.get_default_format())
+        self.clear_cache()
 
     def add_name_format(self, name, fmt_str):
         for num in self.name_formats:
@@ -457,6 +506,7 @@ class NameDisplay:
             del self.name_formats[num]
         except:
             pass
+        self.clear_cache()
 
     def set_default_format(self, num):
         if num not in self.name_formats:
@@ -473,6 +523,7 @@ class NameDisplay:
                                        self.name_formats[Name.DEF][_F_ACT],
                                        self.name_formats[num][_F_FN],
                                        self.name_formats[num][_F_RAWFN])
+        self.clear_cache()
 
     def get_default_format(self):
         return self.default_format
@@ -486,6 +537,7 @@ class NameDisplay:
                                       self.name_formats[num][_F_RAWFN])
         except:
             pass
+        self.clear_cache()
 
     def get_name_format(self, also_default=False,
                         only_custom=False,
@@ -853,7 +905,7 @@ class NameDisplay:
         :rtype: str
         """
         num = self._is_format_valid(name.sort_as)
-        return self.name_formats[num][_F_FN](name)
+        return self._format_name(num, name)
 
     def truncate(self, full_name, max_length=15, elipsis="..."):
         name_out = ""
@@ -879,7 +931,7 @@ class NameDisplay:
         :rtype: str
         """
         num = self._is_format_valid(raw_data[_SORT])
-        return self.name_formats[num][_F_RAWFN](raw_data)
+        return self._format_raw_name(num, raw_data)
 
     def display(self, person):
         """
@@ -913,7 +965,7 @@ class NameDisplay:
         @rtype: str
         """
         name = person.get_primary_name()
-        return self.name_formats[num][_F_FN](name)
+        return self._format_name(num, name)
 
     def display_formal(self, person):
         """
@@ -946,7 +998,7 @@ class NameDisplay:
             return ""
 
         num = self._is_format_valid(name.display_as)
-        return self.name_formats[num][_F_FN](name)
+        return self._format_name(num, name)
 
     def raw_display_name(self, raw_data):
         """
@@ -959,7 +1011,23 @@ class NameDisplay:
         :rtype: str
         """
         num = self._is_format_valid(raw_data[_DISPLAY])
-        return self.name_formats[num][_F_RAWFN](raw_data)
+        return self._format_raw_name(num, raw_data)
+
+    def raw_sorted_names(self, raw_data_list):
+        """
+        Return the list of the sort strings of a list of raw names, as
+        returned by :meth:`raw_sorted_name`, for example for all the rows
+        read from a cursor.
+
+        :param raw_data_list: raw unserialized data of the names
+        :type raw_data_list: list
+        :returns: Returns the string representations
+        :rtype: list
+        """
+        is_format_valid = self._is_format_valid
+        format_raw_name = self._format_raw_name
+        return [format_raw_name(is_format_valid(raw_data[_SORT]), raw_data)
+                for raw_data in raw_data_list]
 
     def display_given(self, person):
         return self.format_str(person.get_primary_name(),'%f')
@@ -29,6 +29,7 @@ Class handling displaying of places.
 #---------------------------------------------------------------
 import os
 import xml.dom.minidom
+from weakref import WeakKeyDictionary
 
 #-------------------------------------------------------------------------
 #
@@ -39,6 +40,7 @@ from ..const import PLACE_FORMATS, GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 from ..config import config
 from ..utils.location import get_location_list
+from ..utils.lru import LRU
 from ..lib import PlaceType
 
 #-------------------------------------------------------------------------
@@ -62,8 +64,12 @@ class PlaceFormat:
 #-------------------------------------------------------------------------
 class PlaceDisplay:
 
+    # number of place hierarchies kept in the cache of each database
+    cache_size = 50000
+
     def __init__(self):
         self.place_formats = []
+        self._caches = WeakKeyDictionary()
         self.default_format = config.get('preferences.place-format')
         if os.path.exists(PLACE_FORMATS):
             try:
@@ -94,7 +100,8 @@ class PlaceDisplay:
                 fmt = config.get('preferences.place-format')
             pf = self.place_formats[fmt]
             lang = pf.language
-            all_places = get_location_list(db, place, date, lang)
+            all_places = get_location_list(db, place, date, lang,
+                                           self._get_cache(db))
 
             # Apply format string to place list
             index = _find_populated_place(all_places)
@@ -140,6 +147,25 @@ class PlaceDisplay:
             # TODO for Arabic, should the next line's comma be translated?
             return ", ".join(names)
 
+    def _get_cache(self, db):
+        """
+        Return the cache of the place hierarchies of the database, emptied
+        if the database changed since the last call, or None if changes to
+        the database cannot be tracked.
+        """
+        try:
+            revision = db.get_revision()
+        except NotImplementedError:
+            return None
+        cached = self._caches.get(db)
+        if cached is None:
+            cached = [revision, LRU(self.cache_size)]
+            self._caches[db] = cached
+        elif cached[0] != revision:
+            cached[0] = revision
+            cached[1].clear()
+        return cached[1]
+
     def get_formats(self):
         return self.place_formats
 
@@ -0,0 +1,122 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the cache of the name displayer.
+"""
+import os
+import unittest
+from time import perf_counter
+
+from ...const import DATA_DIR
+from ...db.utils import import_as_dict
+from ...lib import Name, Surname
+from ...user import User
+from ..name import NameDisplay, _F_FN, _F_RAWFN
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+class NameCacheTest(unittest.TestCase):
+    """
+    The cached names are the same as the formatted names.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Import example database.
+        """
+        cls.db = import_as_dict(EXAMPLE, User())
+
+    def setUp(self):
+        self.displayer = NameDisplay()
+
+    def uncached(self, num, name):
+        return self.displayer.name_formats[num][_F_FN](name)
+
+    def raw_uncached(self, num, raw_data):
+        return self.displayer.name_formats[num][_F_RAWFN](raw_data)
+
+    def test_same_names(self):
+        """
+        Cached and uncached formatting give the same names, for all the
+        formats.
+        """
+        for num in self.displayer.name_formats:
+            self.displayer.set_default_format(num)
+            for person in self.db.iter_people():
+                name = person.get_primary_name()
+                raw_data = name.serialize()
+                fmt = self.displayer._is_format_valid(name.display_as)
+                for _loop in range(2):
+                    self.assertEqual(self.displayer.display_name(name),
+                                     self.uncached(fmt, name))
+                    self.assertEqual(
+                        self.displayer.raw_display_name(raw_data),
+                        self.raw_uncached(fmt, raw_data))
+
+    def test_sorted_names(self):
+        """
+        raw_sorted_names gives the same result as raw_sorted_name.
+        """
+        raw_list = [person.get_primary_name().serialize()
+                    for person in self.db.iter_people()]
+        stime = perf_counter()
+        expected = [self.displayer.raw_sorted_name(raw_data)
+                    for raw_data in raw_list]
+        if __debug__:
+            print("raw_sorted_name: %.3f" % (perf_counter() - stime))
+        stime = perf_counter()
+        self.assertEqual(self.displayer.raw_sorted_names(raw_list), expected)
+        if __debug__:
+            print("raw_sorted_names, cached: %.3f" % (perf_counter() - stime))
+
+    def test_changed_name(self):
+        """
+        A name edited in memory is formatted again.
+        """
+        name = Name()
+        name.set_first_name('John')
+        name.add_surname(Surname())
+        name.get_primary_surname().set_surname('Smith')
+        self.assertIn('Smith', self.displayer.display_name(name))
+        name.get_primary_surname().set_surname('Jones')
+        self.assertIn('Jones', self.displayer.display_name(name))
+        self.assertNotIn('Smith', self.displayer.display_name(name))
+
+    def test_format_change(self):
+        """
+        Changing the format clears the cache.
+        """
+        name = Name()
+        name.set_first_name('John')
+        name.add_surname(Surname())
+        name.get_primary_surname().set_surname('Smith')
+        num = self.displayer.add_name_format('Test', 'Given Surname')
+        self.displayer.set_default_format(num)
+        self.assertEqual(self.displayer.display_name(name), 'John Smith')
+        self.displayer.edit_name_format(num, 'Test', 'Surname Given')
+        self.displayer.set_default_format(num)
+        self.assertEqual(self.displayer.display_name(name), 'Smith John')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the cache of the place hierarchies.
+"""
+import os
+import unittest
+from time import perf_counter
+
+from ...const import DATA_DIR
+from ...db import DbTxn
+from ...db.utils import import_as_dict
+from ...lib import Date, PlaceName
+from ...user import User
+from ...utils.location import get_location_list
+from ..place import PlaceDisplay
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+class PlaceCacheTest(unittest.TestCase):
+    """
+    The cached place hierarchies are the same as the walked ones.
+    """
+
+    def setUp(self):
+        self.db = import_as_dict(EXAMPLE, User())
+        self.displayer = PlaceDisplay()
+
+    def compare(self, date=None):
+        cache = self.displayer._get_cache(self.db)
+        for place in self.db.iter_places():
+            self.assertEqual(
+                get_location_list(self.db, place, date, '', cache),
+                get_location_list(self.db, place, date, ''))
+
+    def test_same_list(self):
+        """
+        All the places of the example database, with and without a date.
+        """
+        self.compare()
+        self.compare(Date(1900))
+        stime = perf_counter()
+        for event in self.db.iter_events():
+            self.displayer.display_event(self.db, event)
+        if __debug__:
+            print("display_event: %.3f" % (perf_counter() - stime))
+
+    def test_dated_name(self):
+        """
+        A dated name of an enclosing place is only used for its dates.
+        """
+        parent = None
+        for place in self.db.iter_places():
+            if place.get_placeref_list():
+                parent = self.db.get_place_from_handle(
+                    place.get_placeref_list()[0].ref)
+                break
+        self.assertIsNotNone(parent)
+        name = PlaceName()
+        name.set_value('Old name')
+        date = Date()
+        date.set_yr_mon_day(1800, 0, 0)
+        date.set_modifier(Date.MOD_BEFORE)
+        name.set_date_object(date)
+        parent.add_alternative_name(name)
+        parent.get_name().set_date_object(Date(1900))
+        parent.get_name().get_date_object().set_modifier(Date.MOD_AFTER)
+        with DbTxn('Date name', self.db) as trans:
+            self.db.commit_place(parent, trans)
+        self.compare(Date(1750))
+        self.compare(Date(1950))
+        self.compare()
+
+    def test_invalidate(self):
+        """
+        A changed place is displayed with its new name.
+        """
+        for place in self.db.iter_places():
+            if place.get_placeref_list():
+                break
+        parent = self.db.get_place_from_handle(
+            place.get_placeref_list()[0].ref)
+        title = self.displayer.display(self.db, place)
+        self.assertIn(parent.get_name().get_value(), title)
+        parent.get_name().set_value('Changed')
+        with DbTxn('Rename', self.db) as trans:
+            self.db.commit_place(parent, trans)
+        self.assertIn('Changed', self.displayer.display(self.db, place))
+
+
+if __name__ == "__main__":
+    unittest.main()
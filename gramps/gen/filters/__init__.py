@@ -29,6 +29,7 @@ from ._filterlist import FilterList
 from ._genericfilter import (GenericFilter, GenericFilterFactory,
                              DeferredFilter, DeferredFamilyFilter)
 from ._paramfilter import ParamFilter
+from ._filtercache import FilterCache, filter_cache
 from ._searchfilter import SearchFilter, ExactSearchFilter
 
 def reload_custom_filters():
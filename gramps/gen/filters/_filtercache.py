@@ -0,0 +1,195 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Cache of the results of filters.
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard Python modules
+#
+#-------------------------------------------------------------------------
+from weakref import WeakKeyDictionary
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from ..db.dbconst import CLASS_TO_KEY_MAP, KEY_TO_NAME_MAP
+from ..utils.lru import LRU
+
+#-------------------------------------------------------------------------
+#
+# FilterCache
+#
+#-------------------------------------------------------------------------
+class FilterCache:
+    """
+    Cache of the handles matched by filters applied to whole databases.
+
+    The results are kept per database, and keyed by the definition of the
+    filter, including the definitions of the custom filters it refers to,
+    so that the sidebar, reports, exports and nested filters share them.
+    A result is valid for as long as the revision counter of the database
+    does not change. After changes, the result of a filter whose rules only
+    read the object they are applied to is updated by checking the changed
+    objects again; other filters are run again.
+    """
+
+    # number of filter results kept for each database
+    cache_size = 100
+
+    def __init__(self):
+        self._caches = WeakKeyDictionary()
+
+    def get_key(self, filt, tree=False):
+        """
+        Return the key of the results of filt, or None if they cannot be
+        cached.
+        """
+        key = _filter_key(filt, ())
+        if key is None:
+            return None
+        try:
+            hash(key)
+        except TypeError:
+            # values of a rule which are not strings
+            return None
+        return (tree, key)
+
+    def get_matches(self, db, filt, user=None, tree=False, compute=True):
+        """
+        Return the set of the handles matched by filt in db, from the cache
+        if possible, or None if they cannot be cached.
+
+        If compute is False, None is also returned when the cache has no
+        result that can be updated.
+        """
+        entry = self.__get_entry(db, filt, user, tree, compute)
+        if entry is None:
+            return None
+        return entry[2]
+
+    def get_list(self, db, filt, user=None, tree=False, compute=True):
+        """
+        Return a new list of the handles matched by filt in db, in the
+        order of the cursor, like GenericFilter.apply.
+        """
+        entry = self.__get_entry(db, filt, user, tree, compute)
+        if entry is None:
+            return None
+        return list(entry[1])
+
+    def clear(self, db=None):
+        """
+        Remove the results kept for db, or for all the databases.
+        """
+        if db is None:
+            self._caches.clear()
+        else:
+            self._caches.pop(db, None)
+
+    def __get_entry(self, db, filt, user, tree, compute):
+        """
+        Return the [revision, handle list, handle set] entry of filt in db,
+        up to date, or None.
+        """
+        key = self.get_key(filt, tree)
+        if key is None:
+            return None
+        try:
+            revision = db.get_revision()
+        except NotImplementedError:
+            return None
+        try:
+            entries = self._caches.get(db)
+        except TypeError:
+            # db cannot be weakly referenced
+            return None
+        if entries is None:
+            entries = LRU(self.cache_size)
+            self._caches[db] = entries
+        entry = entries[key] if key in entries else None
+        if entry is not None and entry[0] != revision:
+            entry = self.__update(db, filt, tree, entry, revision)
+        if entry is None:
+            if not compute:
+                return None
+            handles = filt.check_all(db, None, user=user, tree=tree)
+            entry = [revision, handles, set(handles)]
+        entries[key] = entry
+        return entry
+
+    def __update(self, db, filt, tree, entry, revision):
+        """
+        Return the entry of filt updated with the objects changed since
+        the revision of entry, or None if it has to be computed again.
+        """
+        if tree or not all(rule.per_object for rule in filt.flist):
+            return None
+        try:
+            changes = db.get_changes(entry[0])
+        except NotImplementedError:
+            return None
+        if changes is None:
+            return None
+        obj_key = CLASS_TO_KEY_MAP[filt.make_obj().__class__.__name__]
+        if any(key != obj_key for key, handle in changes):
+            # for example a tag renamed, which changes HasTag
+            return None
+        changed = {handle for key, handle in changes}
+        has_handle = getattr(db, 'has_%s_handle' % KEY_TO_NAME_MAP[obj_key])
+        handles = [handle for handle in entry[1] if handle not in changed]
+        handles += filt.check_all(db, [handle for handle in changed
+                                       if has_handle(handle)])
+        return [revision, handles, set(handles)]
+
+def _filter_key(filt, names):
+    """
+    Return a hashable description of the definition of filt, or None if
+    its results cannot be cached. names are the custom filters which refer
+    to filt, to find loops.
+    """
+    rules = []
+    for rule in filt.flist:
+        if not rule.cacheable or any(rule.list[index]
+                                     for index in rule.place_values
+                                     if index < len(rule.list)):
+            return None
+        inner_key = None
+        find_filter = getattr(rule, 'find_filter', None)
+        if find_filter is not None:
+            # a rule using the objects matched by a custom filter
+            inner = find_filter()
+            if inner is not None:
+                name = (inner.__class__.__name__, inner.get_name())
+                if name in names:
+                    return None
+                inner_key = _filter_key(inner, names + (name,))
+                if inner_key is None:
+                    return None
+        rules.append((rule.__class__.__module__, rule.__class__.__name__,
+                      tuple(rule.list), rule.use_regex, inner_key))
+    return (filt.__class__.__name__, filt.logical_op, filt.invert,
+            tuple(rules))
+
+filter_cache = FilterCache()
@@ -40,6 +40,7 @@ from ..lib.media import Media
 from ..lib.note import Note
 from ..lib.tag import Tag
 from ..const import GRAMPS_LOCALE as glocale
+from ._filtercache import filter_cache
 _ = glocale.translation.gettext
 
 #-------------------------------------------------------------------------
@@ -133,6 +134,20 @@ class GenericFilter:
     def find_from_handle(self, db, handle):
         return db.get_person_from_handle(handle)
 
+    def iter_cursor(self, cursor):
+        """
+        Return an iterator over the (handle, object) pairs of cursor.
+
+        The cursors of the proxy databases give the objects they decoded,
+        which are used as they are, instead of serializing and decoding
+        them again.
+        """
+        iter_objects = getattr(cursor, 'iter_objects', None)
+        if iter_objects is not None:
+            return iter_objects()
+        return ((handle, self.make_obj().unserialize(data))
+                for handle, data in cursor)
+
     def get_number(self, db):
         return db.get_number_of_people()
 
@@ -145,9 +160,7 @@ class GenericFilter:
         if id_list is None:
             with (self.get_tree_cursor(db) if tree else
                   self.get_cursor(db)) as cursor:
-                for handle, data in cursor:
-                    person = self.make_obj()
-                    person.unserialize(data)
+                for handle, person in self.iter_cursor(cursor):
                     if user:
                         user.step_progress()
                     if task(db, person) != self.invert:
@@ -176,9 +189,7 @@ class GenericFilter:
         if id_list is None:
             with (self.get_tree_cursor(db) if tree else
                   self.get_cursor(db)) as cursor:
-                for handle, data in cursor:
-                    person = self.make_obj()
-                    person.unserialize(data)
+                for handle, person in self.iter_cursor(cursor):
                     if user:
                         user.step_progress()
                     val = all(rule.apply(db, person) for rule in flist)
@@ -256,9 +267,33 @@ class GenericFilter:
                 do not match the filter, filtered out.
                 if id_list not given, all items in the database that
                 match the filter are returned as a list of handles
+
+        The handles matched by the filter in the whole database are kept in
+        the filter cache, and used while the database does not change.
+        """
+        if id_list is None:
+            matches = filter_cache.get_list(db, self, user, tree)
+            if matches is not None:
+                return matches
+        else:
+            matches = filter_cache.get_matches(db, self, compute=False)
+            if matches is not None:
+                if tupleind is None:
+                    return [data for data in id_list if data in matches]
+                return [data for data in id_list
+                        if data[tupleind] in matches]
+        return self.check_all(db, id_list, tupleind, user, tree)
+
+    def check_all(self, db, id_list, tupleind=None, user=None, tree=False):
+        """
+        Apply the filter using db, like apply, without the filter cache.
         """
         m = self.get_check_func()
         for rule in self.flist:
+            if hasattr(rule, 'compute_matches'):
+                # the matches of another filter are only worth computing
+                # over the whole database if this filter is too
+                rule.compute_matches = id_list is None
             rule.requestprepare(db, user)
         res = m(db, id_list, user, tupleind, tree)
         for rule in self.flist:
@@ -54,6 +54,7 @@ class ChangedSinceBase(Rule):
                     "date/time (yyyy-mm-dd hh:mm:ss) or in range, if a second " \
                     "date/time is given."
     category = _('General filters')
+    per_object = True
 
     def add_time(self, date):
         if re.search(r"\d.*\s+\d{1,2}:\d{2}:\d{2}", date):
@@ -44,6 +44,7 @@ class Everything(Rule):
     name = 'Every object'
     category = _('General filters')
     description = 'Matches every object in the database'
+    per_object = True
 
     def is_empty(self):
         return True
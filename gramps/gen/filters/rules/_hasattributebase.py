@@ -50,6 +50,7 @@ class HasAttributeBase(Rule):
                    "of a particular value"
     category = _('General filters')
     allow_regex = True
+    per_object = True
 
     def apply(self, db, obj):
         if not self.list[0]:
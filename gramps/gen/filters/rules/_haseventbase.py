@@ -55,6 +55,7 @@ class HasEventBase(Rule):
     description = "Matches events with particular parameters"
     category = _('Event filters')
     allow_regex = True
+    place_values = (2,)
 
     def prepare(self, db, user):
         self.date = None
@@ -46,6 +46,7 @@ class HasGrampsId(Rule):
     name = 'Object with <Id>'
     description = "Matches objects with a specified Gramps ID"
     category = _('General filters')
+    per_object = True
 
     def apply(self, db, obj):
         """
@@ -50,6 +50,7 @@ class HasTagBase(Rule):
     name = 'Objects with the <tag>'
     description = "Matches objects with the given tag"
     category = _('General filters')
+    per_object = True
 
     def prepare(self, db, user):
         """
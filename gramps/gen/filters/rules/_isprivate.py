@@ -40,6 +40,7 @@ class IsPrivate(Rule):
     name = 'Objects marked private'
     description = "Matches objects that are indicated as private"
     category = _('General filters')
+    per_object = True
 
     def apply(self, db, obj):
         return obj.get_privacy()
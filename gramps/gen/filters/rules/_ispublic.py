@@ -37,6 +37,7 @@ class IsPublic(Rule):
     name = 'Objects not marked private'
     description = "Matches objects that are not indicated as private"
     category = _('General filters')
+    per_object = True
 
     def apply(self, db, obj):
         return not obj.get_privacy()
@@ -56,13 +56,21 @@ class MatchesFilterBase(Rule):
     description = "Matches objects matched by the specified filter name"
     category = _('General filters')
 
+    # the handles matched by the filter, from the filter cache
+    matches = None
+    # if False, the matches are only used if the filter cache has them
+    compute_matches = True
+
     def prepare(self, db, user):
         if gramps.gen.filters.CustomFilters:
             filters = gramps.gen.filters.CustomFilters.get_filters_dict(self.namespace)
             if self.list[0] in filters:
                 filt = filters[self.list[0]]
-                for rule in filt.flist:
-                    rule.requestprepare(db, user)
+                self.matches = gramps.gen.filters.filter_cache.get_matches(
+                    db, filt, user, compute=self.compute_matches)
+                if self.matches is None:
+                    for rule in filt.flist:
+                        rule.requestprepare(db, user)
             else:
                 LOG.warning(_("Can't find filter %s in the defined custom filters")
                                     % self.list[0])
@@ -71,7 +79,9 @@ class MatchesFilterBase(Rule):
                                     % self.list[0])
 
     def reset(self):
-        if gramps.gen.filters.CustomFilters:
+        if self.matches is not None:
+            self.matches = None
+        elif gramps.gen.filters.CustomFilters:
             filters = gramps.gen.filters.CustomFilters.get_filters_dict(self.namespace)
             if self.list[0] in filters:
                 filt = filters[self.list[0]]
@@ -79,11 +89,17 @@ class MatchesFilterBase(Rule):
                     rule.requestreset()
 
     def apply(self, db, obj):
-        if gramps.gen.filters.CustomFilters:
-            filters = gramps.gen.filters.CustomFilters.get_filters_dict(self.namespace)
-            if self.list[0] in filters:
-                filt = filters[self.list[0]]
-                return filt.check(db, obj.handle)
+        return self.check_filter(db, obj.handle)
+
+    def check_filter(self, db, handle):
+        """
+        Return True if the object with handle matches the filter.
+        """
+        if self.matches is not None:
+            return handle in self.matches
+        filt = self.find_filter()
+        if filt is not None:
+            return filt.check(db, handle)
         return False
 
     def find_filter(self):
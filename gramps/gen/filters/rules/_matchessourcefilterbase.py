@@ -64,6 +64,6 @@ class MatchesSourceFilterBase(MatchesFilterBase):
         for citation_handle in object.get_citation_list():
             citation = db.get_citation_from_handle(citation_handle)
             sourcehandle = citation.get_reference_handle()
-            if self.MSF_filt.check(db, sourcehandle):
+            if self.check_filter(db, sourcehandle):
                 return True
         return False
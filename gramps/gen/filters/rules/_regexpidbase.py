@@ -51,6 +51,7 @@ class RegExpIdBase(Rule):
                    "or matches a regular expression"
     category = _('General filters')
     allow_regex = True
+    per_object = True
 
     def apply(self, db, obj):
         return self.match_substring(0, obj.gramps_id)
@@ -55,6 +55,16 @@ class Rule:
     category = _('Miscellaneous filters')
     description = _('No description')
     allow_regex = False
+    # the result only depends on the values of the rule and the objects of
+    # the database, so that the results of filters can be cached
+    cacheable = True
+    # the result only depends on the object the rule is applied to, so that
+    # cached results only need the changed objects to be checked again
+    per_object = False
+    # indexes of the values matched against the displayed titles of places,
+    # which depend on the place format preferences: the results are only
+    # cached when these values are empty
+    place_values = ()
 
     def __init__(self, arg, use_regex=False):
         self.list = []
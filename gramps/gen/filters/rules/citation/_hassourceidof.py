@@ -47,6 +47,8 @@ class HasSourceIdOf(HasGrampsId):
     description = _("Matches a citation with a source with a specified Gramps "
                     "ID")
     category = _('Source filters')
+    # the rule reads the source of the citation
+    per_object = False
 
     def apply(self, dbase, citation):
         source = dbase.get_source_from_handle(
@@ -63,6 +63,6 @@ class MatchesSourceFilter(MatchesFilterBase):
             return False
 
         source_handle = object.source_handle
-        if self.MRF_filt.check(db, source_handle):
+        if self.check_filter(db, source_handle):
             return True
         return False
@@ -49,6 +49,8 @@ class RegExpSourceIdOf(RegExpIdBase):
     description = _("Matches citations whose source has a Gramps ID that "
                     "matches the regular expression")
     category = _('Source filters')
+    # the rule reads the source of the citation
+    per_object = False
 
     def apply(self, dbase, citation):
         source = dbase.get_source_from_handle(
@@ -50,6 +50,7 @@ class HasData(Rule):
     description = _("Matches events with data of a particular value")
     category = _('General filters')
     allow_regex = True
+    place_values = (2,)
 
     def prepare(self, db, user):
         self.event_type = self.list[0]
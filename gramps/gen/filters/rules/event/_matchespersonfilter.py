@@ -73,18 +73,18 @@ class MatchesPersonFilter(MatchesFilterBase):
         if filt:
             for (classname, handle) in db.find_backlink_handles(
                                             event.get_handle(), ['Person']):
-                if filt.check(db, handle):
+                if self.check_filter(db, handle):
                     return True
             if self.MPF_famevents :
                 #also include if family event of the person
                 for (classname, handle) in db.find_backlink_handles(
                                             event.get_handle(), ['Family']):
                     family = db.get_family_from_handle(handle)
-                    if family.father_handle and filt.check(db,
-                                                    family.father_handle):
+                    if family.father_handle and self.check_filter(
+                            db, family.father_handle):
                         return True
-                    if family.mother_handle and filt.check(db,
-                                                    family.mother_handle):
+                    if family.mother_handle and self.check_filter(
+                            db, family.mother_handle):
                         return True
 
         return False
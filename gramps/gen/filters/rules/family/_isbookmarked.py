@@ -44,6 +44,8 @@ class IsBookmarked(Rule):
     name = _('Bookmarked families')
     category = _('General filters')
     description = _("Matches the families on the bookmark list")
+    # the bookmarks are not objects of the database
+    cacheable = False
 
     def prepare(self, db, user):
         self.bookmarks = db.get_family_bookmarks().get()
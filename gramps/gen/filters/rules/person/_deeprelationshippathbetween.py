@@ -140,6 +140,12 @@ class DeepRelationshipPathBetween(Rule):
                     " target people.  Each path is not necessarily"
                     " the shortest path.")
 
+    def find_filter(self):
+        """
+        Return the custom filter the rule refers to, or None.
+        """
+        return MatchesFilter(self.list[1:2]).find_filter()
+
     def prepare(self, db, user):
         root_person_id = self.list[0]
         root_person = db.get_person_from_gramps_id(root_person_id)
@@ -45,6 +45,7 @@ class HasAlternateName(Rule):
     name = _('People with an alternate name')
     description = _("Matches people with an alternate name")
     category = _('General filters')
+    per_object = True
 
     def apply(self, db, person):
         if person.get_alternate_names():
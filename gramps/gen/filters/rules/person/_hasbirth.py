@@ -50,6 +50,7 @@ class HasBirth(Rule):
     description = _("Matches people with birth data of a particular value")
     category = _('Event filters')
     allow_regex = True
+    place_values = (1,)
 
     def prepare(self, db, user):
         if self.list[0]:
@@ -54,6 +54,12 @@ class HasCommonAncestorWithFilterMatch(HasCommonAncestorWith):
         HasCommonAncestorWith.__init__(self, list, use_regex)
         self.ancestor_cache = {}
 
+    def find_filter(self):
+        """
+        Return the custom filter the rule refers to, or None.
+        """
+        return MatchesFilter(self.list[0:1]).find_filter()
+
     def prepare(self, db, user):
         self.db = db
         # For each(!) person we keep track of who their ancestors
@@ -53,6 +53,7 @@ class HasFamilyEvent(Rule):
     description = _("Matches people with a family event of a particular value")
     category = _('Event filters')
     allow_regex = True
+    place_values = (2,)
 
     def prepare(self, db, user):
         self.date = None
@@ -58,6 +58,7 @@ class HasNameOf(Rule):
     description = _("Matches people with a specified (partial) name")
     category = _('General filters')
     allow_regex = True
+    per_object = True
 
     def apply(self, db, person):
         for name in [person.get_primary_name()] + person.get_alternate_names():
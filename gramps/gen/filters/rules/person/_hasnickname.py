@@ -45,6 +45,7 @@ class HasNickname(Rule):
     name = _('People with a nickname')
     description = _("Matches people with a nickname")
     category = _('General filters')
+    per_object = True
 
     def apply(self, db, person):
         if person.get_nick_name():
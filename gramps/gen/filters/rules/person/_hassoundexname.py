@@ -46,8 +46,26 @@ class HasSoundexName(Rule):
     category = _('General filters')
     allow_regex = False
 
-    def apply(self, db, person):
+    def prepare(self, db, user):
+        """
+        Look up the matching people in the soundex table of the database,
+        when it has one. The code of empty names is not indexed.
+        """
         self.sndx = soundex(self.list[0])
+        self.handles = None
+        if self.list[0] and self.sndx != "Z000":
+            try:
+                self.handles = set(db.find_person_handles_by_soundex(
+                    self.sndx))
+            except NotImplementedError:
+                pass
+
+    def reset(self):
+        self.handles = None
+
+    def apply(self, db, person):
+        if self.handles is not None:
+            return person.handle in self.handles
         for name in [person.get_primary_name()] + person.get_alternate_names():
             if self._match_name(name):
                 return True
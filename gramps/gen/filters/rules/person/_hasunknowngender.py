@@ -45,6 +45,7 @@ class HasUnknownGender(Rule):
     name = _('People with unknown gender')
     category = _('General filters')
     description = _('Matches all people with unknown gender')
+    per_object = True
 
     def apply(self,db,person):
         return person.gender == Person.UNKNOWN
@@ -49,6 +49,12 @@ class IsAncestorOfFilterMatch(IsAncestorOf):
     description = _("Matches people that are ancestors "
                     "of anybody matched by a filter")
 
+    def find_filter(self):
+        """
+        Return the custom filter the rule refers to, or None.
+        """
+        return MatchesFilter(self.list[0:1]).find_filter()
+
     def prepare(self, db, user):
         self.db = db
         self.map = set()
@@ -45,6 +45,8 @@ class IsBookmarked(Rule):
     name = _('Bookmarked people')
     category = _('General filters')
     description = _("Matches the people on the bookmark list")
+    # the bookmarks are not objects of the database
+    cacheable = False
 
     def prepare(self, db, user):
         self.bookmarks = db.get_bookmarks().get()
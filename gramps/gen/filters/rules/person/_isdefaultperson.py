@@ -44,6 +44,8 @@ class IsDefaultPerson(Rule):
     name = _('Default person')
     category = _('General filters')
     description = _("Matches the default person")
+    # the default person is not an object of the database
+    cacheable = False
 
     def prepare(self, db, user):
         p = db.get_default_person()
@@ -45,6 +45,7 @@ class IsFemale(Rule):
     name = _('Females')
     category = _('General filters')
     description = _('Matches all females')
+    per_object = True
 
     def apply(self,db,person):
         return person.gender == Person.FEMALE
@@ -54,6 +54,8 @@ class IsLessThanNthGenerationAncestorOfBookmarked(Rule):
     category = _('Ancestral filters')
     description = _("Matches ancestors of the people on the bookmark list "
                     "not more than N generations away")
+    # the bookmarks are not objects of the database
+    cacheable = False
 
     def prepare(self, db, user):
         self.db = db
@@ -49,6 +49,8 @@ class IsLessThanNthGenerationAncestorOfDefaultPerson(Rule):
     category = _('Ancestral filters')
     description = _("Matches ancestors of the default person "
                     "not more than N generations away")
+    # the default person is not an object of the database
+    cacheable = False
 
     def prepare(self, db, user):
         self.db = db
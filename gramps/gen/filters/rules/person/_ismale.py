@@ -45,6 +45,7 @@ class IsMale(Rule):
     name = _('Males')
     category = _('General filters')
     description = _('Matches all males')
+    per_object = True
 
     def apply(self,db,person):
         return person.gender == Person.MALE
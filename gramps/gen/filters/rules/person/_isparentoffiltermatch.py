@@ -48,6 +48,12 @@ class IsParentOfFilterMatch(Rule):
     category = _('Family filters')
     description = _("Matches parents of anybody matched by a filter")
 
+    def find_filter(self):
+        """
+        Return the custom filter the rule refers to, or None.
+        """
+        return MatchesFilter(self.list[0:1]).find_filter()
+
     def prepare(self, db, user):
         self.db = db
         self.map = set()
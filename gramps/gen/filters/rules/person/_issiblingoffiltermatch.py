@@ -47,6 +47,12 @@ class IsSiblingOfFilterMatch(Rule):
     category = _('Family filters')
     description = _("Matches siblings of anybody matched by a filter")
 
+    def find_filter(self):
+        """
+        Return the custom filter the rule refers to, or None.
+        """
+        return MatchesFilter(self.list[0:1]).find_filter()
+
     def prepare(self, db, user):
         self.db = db
         self.map = set()
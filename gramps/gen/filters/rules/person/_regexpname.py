@@ -48,6 +48,7 @@ class RegExpName(Rule):
                     "matching a regular expression")
     category = _('General filters')
     allow_regex = True
+    per_object = True
 
     def apply(self,db,person):
         for name in [person.get_primary_name()] + person.get_alternate_names():
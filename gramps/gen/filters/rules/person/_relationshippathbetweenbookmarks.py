@@ -53,6 +53,8 @@ class RelationshipPathBetweenBookmarks(Rule):
     description = _("Matches the ancestors of bookmarked individuals "
                     "back to common ancestors, producing the relationship "
                     "path(s) between bookmarked persons.")
+    # the bookmarks are not objects of the database
+    cacheable = False
 
     def prepare(self, db, user):
         self.db = db
@@ -50,6 +50,7 @@ class HasTitle(Rule):
     description = _('Matches places with a particular title')
     category = _('General filters')
     allow_regex = True
+    place_values = (0,)
 
     def apply(self, db, place):
         if not self.match_substring(0, displayer.display(db, place)):
@@ -59,6 +59,6 @@ class MatchesEventFilter(MatchesFilterBase):
         filt = self.find_filter()
         if filt:
             for (classname, handle) in db.find_backlink_handles(event.get_handle(), ['Event']):
-                if filt.check(db, handle):
+                if self.check_filter(db, handle):
                     return True
         return False
@@ -0,0 +1,249 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest of the cache of the results of filters
+"""
+import os
+import unittest
+from time import perf_counter
+
+from ... import filters as filter_module
+from .. import GenericFilter, filter_cache
+from ..rules.person import (IsMale, HasNameOf, HasBirth,
+                            IsChildOfFilterMatch, MatchesFilter)
+from ...db import DbTxn
+from ...db.utils import make_database
+from ...lib import Person, Name, Surname, Family, ChildRef, Tag
+from ...proxy import PrivateProxyDb
+
+class CountingIsMale(IsMale):
+    """
+    IsMale, counting the people it is applied to.
+    """
+    count = 0
+
+    def apply(self, db, person):
+        CountingIsMale.count += 1
+        return IsMale.apply(self, db, person)
+
+def make_person(number):
+    """
+    Return a new person, male if number is even.
+    """
+    person = Person()
+    name = Name()
+    name.set_first_name('Given%d' % number)
+    surname = Surname()
+    surname.set_surname('Surname%d' % (number % 10))
+    name.add_surname(surname)
+    person.set_primary_name(name)
+    person.set_gender(Person.MALE if number % 2 == 0 else Person.FEMALE)
+    return person
+
+def make_filter(*rules):
+    """
+    Return a person filter with the given rules.
+    """
+    filter_ = GenericFilter()
+    for rule in rules:
+        filter_.add_rule(rule)
+    return filter_
+
+class FilterCacheTest(unittest.TestCase):
+    """
+    Filter cache tests.
+    """
+    PEOPLE = 100
+    CUSTOM = ('Fathers', 'Males', 'Loop')
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Load the custom filters, unless another test already did.
+        """
+        if filter_module.CustomFilters is None:
+            filter_module.reload_custom_filters()
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        with DbTxn('Add people', self.db) as trans:
+            self.handles = [self.db.add_person(make_person(number), trans)
+                            for number in range(self.PEOPLE)]
+        CountingIsMale.count = 0
+
+    def tearDown(self):
+        self.db.close()
+        filter_cache.clear()
+        filters = filter_module.CustomFilters.get_filters_dict('Person')
+        for name in self.CUSTOM:
+            filters.pop(name, None)
+
+    def males(self):
+        """
+        Return the handles of the males of the database.
+        """
+        return {person.handle for person in self.db.iter_people()
+                if person.gender == Person.MALE}
+
+    def test_cached(self):
+        filter_ = make_filter(CountingIsMale([]))
+        self.assertEqual(set(filter_.apply(self.db)), self.males())
+        self.assertEqual(CountingIsMale.count, self.PEOPLE)
+        # a new filter with the same definition shares the result
+        filter_ = make_filter(CountingIsMale([]))
+        self.assertEqual(set(filter_.apply(self.db)), self.males())
+        self.assertEqual(filter_.apply(self.db, self.handles[:4]),
+                         self.handles[0:4:2])
+        self.assertEqual(CountingIsMale.count, self.PEOPLE)
+        # another definition does not
+        make_filter(CountingIsMale([]), HasNameOf(['Given99'] + [''] * 10)
+                   ).apply(self.db)
+        self.assertEqual(CountingIsMale.count, 2 * self.PEOPLE)
+
+    def test_changes(self):
+        filter_ = make_filter(CountingIsMale([]))
+        filter_.apply(self.db)
+        with DbTxn('Change people', self.db) as trans:
+            person = self.db.get_person_from_handle(self.handles[0])
+            person.set_gender(Person.FEMALE)
+            self.db.commit_person(person, trans)
+            self.db.remove_person(self.handles[2], trans)
+            self.db.add_person(make_person(self.PEOPLE), trans)
+        CountingIsMale.count = 0
+        self.assertEqual(set(filter_.apply(self.db)), self.males())
+        # only the changed people still in the database are checked
+        self.assertEqual(CountingIsMale.count, 2)
+
+        # other objects may change the result of the rules
+        with DbTxn('Add tag', self.db) as trans:
+            tag = Tag()
+            tag.set_name('Tag')
+            self.db.add_tag(tag, trans)
+        CountingIsMale.count = 0
+        self.assertEqual(set(filter_.apply(self.db)), self.males())
+        self.assertEqual(CountingIsMale.count, self.PEOPLE)
+
+    def test_not_per_object(self):
+        with DbTxn('Add family', self.db) as trans:
+            family = Family()
+            family.set_father_handle(self.handles[0])
+            self.db.add_family(family, trans)
+            father = self.db.get_person_from_handle(self.handles[0])
+            father.add_family_handle(family.handle)
+            self.db.commit_person(father, trans)
+        filters = filter_module.CustomFilters.get_filters_dict('Person')
+        filters['Fathers'] = make_filter(HasNameOf(['Given0'] + [''] * 10))
+        filter_ = make_filter(IsChildOfFilterMatch(['Fathers']))
+        self.assertEqual(filter_.apply(self.db), [])
+        with DbTxn('Add child', self.db) as trans:
+            family = self.db.get_family_from_handle(family.handle)
+            child_ref = ChildRef()
+            child_ref.set_reference_handle(self.handles[1])
+            family.add_child_ref(child_ref)
+            self.db.commit_family(family, trans)
+            child = self.db.get_person_from_handle(self.handles[1])
+            child.add_parent_family_handle(family.handle)
+            self.db.commit_person(child, trans)
+        self.assertEqual(filter_.apply(self.db), [self.handles[1]])
+        # a new definition of the custom filter is a new filter
+        filters['Fathers'] = make_filter(HasNameOf(['Given2'] + [''] * 10))
+        self.assertEqual(filter_.apply(self.db), [])
+
+    def test_nested(self):
+        filters = filter_module.CustomFilters.get_filters_dict('Person')
+        filters['Males'] = make_filter(CountingIsMale([]))
+        filter_ = make_filter(MatchesFilter(['Males']),
+                              HasNameOf(['Given99'] + [''] * 10))
+        filter_.set_logical_op('or')
+        self.assertEqual(set(filter_.apply(self.db)),
+                         self.males() | {self.handles[99]})
+        self.assertEqual(CountingIsMale.count, self.PEOPLE)
+        # the inner filter is not applied again
+        filters['Males'].apply(self.db)
+        make_filter(MatchesFilter(['Males'])).apply(self.db, self.handles)
+        self.assertEqual(CountingIsMale.count, self.PEOPLE)
+
+        # applied to a few people, the inner filter is not applied to the
+        # whole database
+        filter_cache.clear()
+        CountingIsMale.count = 0
+        self.assertEqual(filter_.apply(self.db, self.handles[:4]),
+                         self.handles[0:4:2])
+        self.assertEqual(CountingIsMale.count, 4)
+        self.assertIsNone(filter_cache.get_matches(self.db, filters['Males'],
+                                                   compute=False))
+
+        # filters referring to themselves are not cached
+        filters['Loop'] = make_filter(MatchesFilter(['Loop']))
+        self.assertIsNone(filter_cache.get_key(filters['Loop']))
+
+    def test_proxy(self):
+        proxy = PrivateProxyDb(self.db)
+        filter_ = make_filter(CountingIsMale([]))
+        self.assertEqual(set(filter_.apply(proxy)), self.males())
+        with DbTxn('Change person', self.db) as trans:
+            self.db.commit_person(
+                self.db.get_person_from_handle(self.handles[0]), trans)
+        # the objects of a proxy may depend on other objects
+        CountingIsMale.count = 0
+        filter_.apply(proxy)
+        self.assertEqual(CountingIsMale.count, self.PEOPLE)
+
+    def test_uncached(self):
+        filter_ = make_filter(CountingIsMale([]))
+        filter_.apply(self.db, self.handles[:10])
+        self.assertEqual(CountingIsMale.count, 10)
+        filter_.apply(self.db, self.handles[:10])
+        self.assertEqual(CountingIsMale.count, 20)
+
+    def test_place_format(self):
+        # the displayed place titles depend on the place format preferences
+        filter_ = make_filter(HasBirth(['', 'Paris', '']))
+        self.assertIsNone(filter_cache.get_key(filter_))
+        filter_ = make_filter(HasBirth(['1900', '', '']))
+        self.assertIsNotNone(filter_cache.get_key(filter_))
+
+    @unittest.skipUnless(os.environ.get('GRAMPS_BENCHMARK'),
+                         "Set GRAMPS_BENCHMARK to run the benchmarks")
+    def test_time(self):
+        with DbTxn('Add people', self.db) as trans:
+            for number in range(self.PEOPLE, 50 * self.PEOPLE):
+                self.db.add_person(make_person(number), trans)
+        filters = filter_module.CustomFilters.get_filters_dict('Person')
+        filters['Males'] = make_filter(IsMale([]))
+        filter_ = make_filter(MatchesFilter(['Males']))
+        for label in ('first', 'cached'):
+            stime = perf_counter()
+            filter_.apply(self.db)
+            if __debug__:
+                print("%s: %.3f" % (label, perf_counter() - stime))
+        with DbTxn('Change person', self.db) as trans:
+            self.db.commit_person(
+                self.db.get_person_from_handle(self.handles[0]), trans)
+        stime = perf_counter()
+        filters['Males'].apply(self.db)
+        if __debug__:
+            print("updated: %.3f" % (perf_counter() - stime))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,12 +48,16 @@ class GenderStats:
         else:
             # Current use of GenderStats is such that a shallow copy suffices.
             self.stats = stats
+        # names whose counts changed since they were last saved, or None if
+        # all the names must be saved
+        self.changed = set()
 
     def save_stats(self):
         return self.stats
 
     def clear_stats(self):
         self.stats = {}
+        self.changed = None
         return self.stats
 
     def name_stats(self, name):
@@ -61,15 +65,15 @@ class GenderStats:
             return self.stats[name]
         return (0, 0, 0)
 
-    def count_name(self, name, gender):
+    def count_name(self, name, gender, count=1):
         """
-        Count a given name under gender in the gender stats.
+        Count a given name under gender in the gender stats, count times.
         """
         keyname = _get_key_from_name(name)
         if not keyname:
             return
 
-        self._set_stats(keyname, gender)
+        self._set_stats(keyname, gender, count=count)
 
     def count_person(self, person, undo=0):
         if not person:
@@ -83,12 +87,12 @@ class GenderStats:
         gender = person.get_gender()
         self._set_stats(keyname, gender, undo)
 
-    def _set_stats(self, keyname, gender, undo=0):
+    def _set_stats(self, keyname, gender, undo=0, count=1):
         (male, female, unknown) = self.name_stats(keyname)
         if not undo:
-            increment = 1
+            increment = count
         else:
-            increment = -1
+            increment = -count
 
         if gender == Person.MALE:
             male += increment
@@ -104,6 +108,8 @@ class GenderStats:
                 unknown = 0
 
         self.stats[keyname] = (male, female, unknown)
+        if self.changed is not None:
+            self.changed.add(keyname)
 
     def uncount_person(self, person):
         return self.count_person(person, undo=1)
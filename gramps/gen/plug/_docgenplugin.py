@@ -24,7 +24,6 @@ This module provides the Plugin class for document generator plugins.
 """
 
 from . import Plugin
-from .docgen import TextDoc, DrawDoc
 
 class DocGenPlugin(Plugin):
     """
@@ -121,6 +120,9 @@ class DocGenPlugin(Plugin):
         :return: bool: True if :class:`.TextDoc` is supported; False if
                        :class:`.TextDoc` is not supported.
         """
+        # docgen is imported here, as most sessions never use a document
+        # generator
+        from .docgen import TextDoc
         return bool(issubclass(self.__basedoc, TextDoc))
 
     def get_draw_support(self):
@@ -130,4 +132,5 @@ class DocGenPlugin(Plugin):
         :return: bool: True if :class:`.DrawDoc` is supported; False if
                        :class:`.DrawDoc` is not supported.
         """
+        from .docgen import DrawDoc
         return bool(issubclass(self.__basedoc, DrawDoc))
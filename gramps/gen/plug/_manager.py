@@ -40,6 +40,8 @@ import sys
 import re
 import logging
 import importlib
+from collections import deque
+from time import perf_counter
 LOG = logging.getLogger('._manager')
 LOG.progagate = True
 from ..const import GRAMPS_LOCALE as glocale
@@ -61,6 +63,40 @@ from ..constfunc import win
 #-------------------------------------------------------------------------
 _UNAVAILABLE = _("No description was provided")
 
+#-------------------------------------------------------------------------
+#
+# Functions
+#
+#-------------------------------------------------------------------------
+def sort_on_dependencies(plugins):
+    """
+    Sort plugins so that each plugin comes after the plugins it depends on,
+    keeping the given order otherwise.
+
+    :returns: The sorted plugins, and the plugins whose dependencies are not
+              in the list (or are circular), which are left out.
+    """
+    waiting = {}    # plugin id -> plugins depending on it
+    missing = {}    # plugin id -> number of dependencies not yet sorted
+    ready = deque()
+    for plugin in plugins:
+        depends_on = set(plugin.depends_on)
+        missing[plugin.id] = len(depends_on)
+        for depend in depends_on:
+            waiting.setdefault(depend, []).append(plugin)
+        if not depends_on:
+            ready.append(plugin)
+    plugins_sorted = []
+    while ready:
+        plugin = ready.popleft()
+        plugins_sorted.append(plugin)
+        for other in waiting.get(plugin.id, []):
+            missing[other.id] -= 1
+            if missing[other.id] == 0:
+                ready.append(other)
+    unresolved = [plugin for plugin in plugins if missing[plugin.id]]
+    return plugins_sorted, unresolved
+
 #-------------------------------------------------------------------------
 #
 # BasePluginManager
@@ -128,6 +164,7 @@ class BasePluginManager:
         #             " been_here=%s, pahte exists:%s", direct, load_on_reg,
         #             direct in self.__scanned_dirs, os.path.isdir(direct))
 
+        stime = perf_counter()
         if os.path.isdir(direct) and direct not in self.__scanned_dirs:
             self.__scanned_dirs.append(direct)
             for (dirpath, dirnames, filenames) in os.walk(direct,
@@ -139,8 +176,12 @@ class BasePluginManager:
                         dirnames.remove(dirname)
                 # LOG.warning("Plugin dir scanned: %s", dirpath)
                 self.__pgr.scan_dir(dirpath, filenames, uistate=uistate)
+            self.__pgr.save_code_cache()
+            LOG.debug("Registration of %s: %.3f seconds", direct,
+                      perf_counter() - stime)
 
         if load_on_reg:
+            stime = perf_counter()
             # Run plugins that request to be loaded on startup and
             # have a load_on_reg callable.
             # first, remove hidden
@@ -151,33 +192,12 @@ class BasePluginManager:
                     continue
                 plugins_to_load.append(plugin)
             # next, sort on dependencies
-            # Probably a more efficient method to get dependency graph:
-            plugins_sorted = []
-            count = 0
-            max_count = len(plugins_to_load)
-            while plugins_to_load:
-                for plugin in plugins_to_load[:]: # copy of list
-                    # LOG.warning("\nDependencies for %s at registration",
-                    #             plugin.id)
-                    delay = False
-                    for depend in plugin.depends_on:
-                        if depend not in [p.id for p in plugins_sorted]:
-                            delay = True
-                            break
-                    if delay:
-                        pass # wait till next loop
-                    else:
-                        if plugin not in plugins_sorted:
-                            plugins_sorted.append(plugin)
-                        if plugin in plugins_to_load:
-                            plugins_to_load.remove(plugin)
-                count += 1
-                if count > max_count:
-                    print("Cannot resolve the following plugin dependencies:")
-                    for plugin in plugins_to_load:
-                        print("   Plugin '%s' requires: %s" % (
-                            plugin.id, plugin.depends_on))
-                    break
+            plugins_sorted, unresolved = sort_on_dependencies(plugins_to_load)
+            if unresolved:
+                print("Cannot resolve the following plugin dependencies:")
+                for plugin in unresolved:
+                    print("   Plugin '%s' requires: %s" % (
+                        plugin.id, plugin.depends_on))
             # now load them:
             for plugin in plugins_sorted:
                 # next line shouldn't be necessary, but this gets called a lot
@@ -198,6 +218,8 @@ class BasePluginManager:
                         plugin.data += results
                     except:
                         plugin.data = results
+            LOG.debug("Loading of %d plugins on registration: %.3f seconds",
+                      len(plugins_sorted), perf_counter() - stime)
         # Get the addon rules and import them and make them findable
         for plugin in self.__pgr.rule_plugins():
             mod = self.load_plugin(plugin)  # load the addon rule
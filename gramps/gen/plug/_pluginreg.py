@@ -33,6 +33,8 @@ import os
 import sys
 import re
 import traceback
+import marshal
+from importlib.util import MAGIC_NUMBER
 
 #-------------------------------------------------------------------------
 #
@@ -40,12 +42,15 @@ import traceback
 #
 #-------------------------------------------------------------------------
 from ...version import VERSION as GRAMPSVERSION, VERSION_TUPLE
-from ..const import IMAGE_DIR
+from ..const import IMAGE_DIR, VERSION_DIR
 from ..const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 import logging
 LOG = logging.getLogger('._manager')
 
+# compiled registration files, kept between sessions
+CODE_CACHE = os.path.join(VERSION_DIR, "plugin_registrations.cache")
+
 #-------------------------------------------------------------------------
 #
 # PluginData
@@ -1143,6 +1148,57 @@ class PluginRegister:
             self.stable_only = False
         self.__plugindata = []
         self.__id_to_pdata = {}
+        self.__code_cache = None
+        self.__code_cache_changed = False
+
+    def __load_code_cache(self):
+        """
+        Read the compiled registration files saved by a previous session.
+        The cache is ignored if it was written by another Python version.
+        """
+        self.__code_cache = {}
+        try:
+            with open(CODE_CACHE, "rb") as cache_file:
+                magic, code_cache = marshal.load(cache_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if magic == MAGIC_NUMBER and isinstance(code_cache, dict):
+            self.__code_cache = code_cache
+
+    def save_code_cache(self):
+        """
+        Write the compiled registration files, if any was compiled since the
+        cache was read. Entries of removed files are dropped.
+        """
+        if not self.__code_cache_changed:
+            return
+        code_cache = {path: entry for path, entry in self.__code_cache.items()
+                      if os.path.isfile(path)}
+        try:
+            with open(CODE_CACHE, "wb") as cache_file:
+                marshal.dump((MAGIC_NUMBER, code_cache), cache_file)
+        except OSError as msg:
+            LOG.warning("Cannot write the plugin cache: %s", msg)
+        self.__code_cache_changed = False
+
+    def __get_code(self, full_filename, filename):
+        """
+        Return the compiled code of a registration file, from the cache if
+        the file did not change since it was compiled.
+        """
+        if self.__code_cache is None:
+            self.__load_code_cache()
+        stat = os.stat(full_filename)
+        entry = self.__code_cache.get(full_filename)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        with open(full_filename, "r", encoding='utf-8') as fd:
+            stream = fd.read()
+        code = compile(stream, filename, 'exec')
+        self.__code_cache[full_filename] = (stat.st_mtime_ns, stat.st_size,
+                                            code)
+        self.__code_cache_changed = True
+        return code
 
     def add_plugindata(self, plugindata):
         """ This is used to add an entry to the registration list.  The way it
@@ -1172,8 +1228,7 @@ class PluginRegister:
             lenpd = len(self.__plugindata)
             full_filename = os.path.join(dir, filename)
             try:
-                with open(full_filename, "r", encoding='utf-8') as fd:
-                    stream = fd.read()
+                code = self.__get_code(full_filename, filename)
             except Exception as msg:
                 print(_('ERROR: Failed reading plugin registration %(filename)s') % \
                             {'filename' : filename})
@@ -1192,7 +1247,7 @@ class PluginRegister:
             else:
                 local_gettext = glocale.translation.gettext
             try:
-                exec (compile(stream, filename, 'exec'),
+                exec (code,
                       make_environment(_=local_gettext), {'uistate': uistate})
                 for pdata in self.__plugindata[lenpd:]:
                     # should not be duplicate IDs in different plugins
@@ -29,7 +29,6 @@ Option class representing a document style.
 #
 #-------------------------------------------------------------------------
 from . import EnumeratedListOption
-from ..docgen import StyleSheetList
 
 #-------------------------------------------------------------------------
 #
@@ -54,6 +53,8 @@ class StyleOption(EnumeratedListOption): # TODO this is likely dead code
         :type module_name: string
         :return: nothing
         """
+        # imported here, to keep docgen out of the plug package imports
+        from ..docgen import StyleSheetList
         EnumeratedListOption.__init__(self, label, "default")
 
         self.__default_style = default_style
@@ -74,6 +75,7 @@ class StyleOption(EnumeratedListOption): # TODO this is likely dead code
 
     def get_style(self):
         """ Get the selected style """
+        from ..docgen import StyleSheetList
         style_list = StyleSheetList(self.__style_file,
                                             self.__default_style)
         return style_list.get_style_sheet(self.get_value())
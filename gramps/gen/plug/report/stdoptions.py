@@ -34,7 +34,8 @@ from ...display.name import displayer as global_name_display
 from ...lib.date import Today
 from ...display.place import displayer as _pd
 from ..menu import EnumeratedListOption, BooleanOption, NumberOption
-from ...proxy import PrivateProxyDb, LivingProxyDb
+from ...proxy import PrivateProxyDb, LivingProxyDb, FlatProxyDb
+from ...proxy.proxybase import ProxyDbBase
 from ...utils.grampslocale import GrampsLocale
 from ...const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
@@ -201,6 +202,9 @@ def run_living_people_option(report, menu, llocale=glocale):
     If llocale is passed in (a :class:`.GrampsLocale`), then (insofar as
     possible) the translated values will be returned instead.
 
+    If the database is proxied, the resulting stack of proxies is flattened
+    by a :class:`.FlatProxyDb`.
+
     :param llocale: allow deferred translation of "[Living]"
     :type llocale: a :class:`.GrampsLocale` instance
     """
@@ -211,6 +215,9 @@ def run_living_people_option(report, menu, llocale=glocale):
         report.database = LivingProxyDb(report.database, living_value,
                                         years_after_death=years_past_death,
                                         llocale=llocale)
+    if isinstance(report.database, ProxyDbBase):
+        # the privacy and living proxies are evaluated once per object
+        report.database = FlatProxyDb(report.database)
     return option
 
 def add_date_format_option(menu, category, localization_option):
@@ -0,0 +1,62 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest of the dependency sort of the plugins loaded on registration
+"""
+import unittest
+
+from .._manager import sort_on_dependencies
+from .._pluginreg import PluginData
+
+def make_plugin(id_, *depends_on):
+    """
+    Return a PluginData with the given id and dependencies.
+    """
+    pdata = PluginData()
+    pdata.id = id_
+    pdata.depends_on = list(depends_on)
+    return pdata
+
+class SortTest(unittest.TestCase):
+    """
+    Tests of sort_on_dependencies.
+    """
+
+    def test_order(self):
+        plugins = [make_plugin('a', 'c'), make_plugin('b'),
+                   make_plugin('c', 'b'), make_plugin('d')]
+        plugins_sorted, unresolved = sort_on_dependencies(plugins)
+        self.assertEqual([plugin.id for plugin in plugins_sorted],
+                         ['b', 'd', 'c', 'a'])
+        self.assertEqual(unresolved, [])
+
+    def test_unresolved(self):
+        plugins = [make_plugin('a', 'missing'), make_plugin('b', 'a'),
+                   make_plugin('c', 'd'), make_plugin('d', 'c'),
+                   make_plugin('e')]
+        plugins_sorted, unresolved = sort_on_dependencies(plugins)
+        self.assertEqual([plugin.id for plugin in plugins_sorted], ['e'])
+        self.assertEqual([plugin.id for plugin in unresolved],
+                         ['a', 'b', 'c', 'd'])
+
+
+if __name__ == "__main__":
+    unittest.main()
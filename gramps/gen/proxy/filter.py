@@ -80,40 +80,45 @@ class FilterProxyDb(ProxyDbBase):
         If no such Person exists, None is returned.
         """
         if handle in self.plist:
-            person = self.db.get_person_from_handle(handle)
-            if person is None:
-                return None
-            person.set_person_ref_list(
-                [ ref for ref in person.get_person_ref_list()
-                  if ref.ref in self.plist ])
+            return self.__filter_person(self.db.get_person_from_handle(handle))
+        else:
+            return None
 
-            person.set_family_handle_list(
-                [ hndl for hndl in person.get_family_handle_list()
-                  if hndl in self.flist ])
+    def __filter_person(self, person):
+        """
+        Remove the references to the filtered out objects from a person.
+        """
+        if person is None:
+            return None
+        person.set_person_ref_list(
+            [ ref for ref in person.get_person_ref_list()
+              if ref.ref in self.plist ])
 
-            person.set_parent_family_handle_list(
-                [ hndl for hndl in person.get_parent_family_handle_list()
-                  if hndl in self.flist ])
+        person.set_family_handle_list(
+            [ hndl for hndl in person.get_family_handle_list()
+              if hndl in self.flist ])
 
-            eref_list = person.get_event_ref_list()
-            bref = person.get_birth_ref()
-            dref = person.get_death_ref()
+        person.set_parent_family_handle_list(
+            [ hndl for hndl in person.get_parent_family_handle_list()
+              if hndl in self.flist ])
 
-            new_eref_list = [ ref for ref in eref_list
-                              if ref.ref in self.elist]
+        eref_list = person.get_event_ref_list()
+        bref = person.get_birth_ref()
+        dref = person.get_death_ref()
 
-            person.set_event_ref_list(new_eref_list)
-            if bref in new_eref_list:
-                person.set_birth_ref(bref)
-            if dref in new_eref_list:
-                person.set_death_ref(dref)
+        new_eref_list = [ ref for ref in eref_list
+                          if ref.ref in self.elist]
 
-            # Filter notes out
-            self.sanitize_person(person)
+        person.set_event_ref_list(new_eref_list)
+        if bref in new_eref_list:
+            person.set_birth_ref(bref)
+        if dref in new_eref_list:
+            person.set_death_ref(dref)
 
-            return person
-        else:
-            return None
+        # Filter notes out
+        self.sanitize_person(person)
+
+        return person
 
     def include_person(self, handle):
         return handle in self.plist
@@ -132,8 +137,12 @@ class FilterProxyDb(ProxyDbBase):
         Finds a Source in the database from the passed Gramps ID.
         If no such Source exists, None is returned.
         """
-        source = self.db.get_source_from_handle(handle)
+        return self.__filter_source(self.db.get_source_from_handle(handle))
 
+    def __filter_source(self, source):
+        """
+        Remove the filtered out notes from a source.
+        """
         if source:
             # Filter notes out
             self.sanitize_notebase(source)
@@ -156,7 +165,13 @@ class FilterProxyDb(ProxyDbBase):
         Finds a Citation in the database from the passed Gramps ID.
         If no such Citation exists, None is returned.
         """
-        citation = self.db.get_citation_from_handle(handle)
+        return self.__filter_citation(
+            self.db.get_citation_from_handle(handle))
+
+    def __filter_citation(self, citation):
+        """
+        Remove the filtered out notes from a citation.
+        """
         # Filter notes out
         self.sanitize_notebase(citation)
         return citation
@@ -166,8 +181,12 @@ class FilterProxyDb(ProxyDbBase):
         Finds a Media in the database from the passed Gramps handle.
         If no such Object exists, None is returned.
         """
-        media = self.db.get_media_from_handle(handle)
+        return self.__filter_media(self.db.get_media_from_handle(handle))
 
+    def __filter_media(self, media):
+        """
+        Remove the filtered out notes from a media object.
+        """
         if media:
             # Filter notes out
             self.sanitize_notebase(media)
@@ -183,8 +202,12 @@ class FilterProxyDb(ProxyDbBase):
         Finds a Place in the database from the passed Gramps handle.
         If no such Place exists, None is returned.
         """
-        place = self.db.get_place_from_handle(handle)
+        return self.__filter_place(self.db.get_place_from_handle(handle))
 
+    def __filter_place(self, place):
+        """
+        Remove the filtered out notes from a place.
+        """
         if place:
             # Filter notes out
             self.sanitize_notebase(place)
@@ -204,74 +227,90 @@ class FilterProxyDb(ProxyDbBase):
         If no such Event exists, None is returned.
         """
         if handle in self.elist:
-            event = self.db.get_event_from_handle(handle)
-            # Filter all notes out
-            self.sanitize_notebase(event)
-            return event
+            return self.__filter_event(self.db.get_event_from_handle(handle))
         else:
             return None
 
+    def __filter_event(self, event):
+        """
+        Remove the filtered out notes from an event.
+        """
+        # Filter all notes out
+        self.sanitize_notebase(event)
+        return event
+
     def get_family_from_handle(self, handle):
         """
         Finds a Family in the database from the passed Gramps ID.
         If no such Family exists, None is returned.
         """
         if handle in self.flist:
-            family = self.db.get_family_from_handle(handle)
-            if family is None:
-                return None
-            eref_list = [ eref for eref in family.get_event_ref_list()
-                          if eref.ref in self.elist ]
-            family.set_event_ref_list(eref_list)
+            return self.__filter_family(self.db.get_family_from_handle(handle))
+        else:
+            return None
 
-            if family.get_father_handle() not in self.plist:
-                family.set_father_handle(None)
+    def __filter_family(self, family):
+        """
+        Remove the references to the filtered out objects from a family.
+        """
+        if family is None:
+            return None
+        eref_list = [ eref for eref in family.get_event_ref_list()
+                      if eref.ref in self.elist ]
+        family.set_event_ref_list(eref_list)
 
-            if family.get_mother_handle() not in self.plist:
-                family.set_mother_handle(None)
+        if family.get_father_handle() not in self.plist:
+            family.set_father_handle(None)
 
-            clist = [ cref for cref in family.get_child_ref_list()
-                      if cref.ref in self.plist ]
-            family.set_child_ref_list(clist)
+        if family.get_mother_handle() not in self.plist:
+            family.set_mother_handle(None)
 
-            # Filter notes out
-            for cref in clist:
-                self.sanitize_notebase(cref)
+        clist = [ cref for cref in family.get_child_ref_list()
+                  if cref.ref in self.plist ]
+        family.set_child_ref_list(clist)
 
-            self.sanitize_notebase(family)
+        # Filter notes out
+        for cref in clist:
+            self.sanitize_notebase(cref)
 
-            attributes = family.get_attribute_list()
-            for attr in attributes:
-                self.sanitize_notebase(attr)
+        self.sanitize_notebase(family)
 
-            event_ref_list = family.get_event_ref_list()
-            for event_ref in event_ref_list:
-                self.sanitize_notebase(event_ref)
-                attributes = event_ref.get_attribute_list()
-                for attribute in attributes:
-                    self.sanitize_notebase(attribute)
+        attributes = family.get_attribute_list()
+        for attr in attributes:
+            self.sanitize_notebase(attr)
 
-            media_ref_list = family.get_media_list()
-            for media_ref in media_ref_list:
-                self.sanitize_notebase(media_ref)
-                attributes = media_ref.get_attribute_list()
-                for attribute in attributes:
-                    self.sanitize_notebase(attribute)
+        event_ref_list = family.get_event_ref_list()
+        for event_ref in event_ref_list:
+            self.sanitize_notebase(event_ref)
+            attributes = event_ref.get_attribute_list()
+            for attribute in attributes:
+                self.sanitize_notebase(attribute)
 
-            lds_ord_list = family.get_lds_ord_list()
-            for lds_ord in lds_ord_list:
-                self.sanitize_notebase(lds_ord)
+        media_ref_list = family.get_media_list()
+        for media_ref in media_ref_list:
+            self.sanitize_notebase(media_ref)
+            attributes = media_ref.get_attribute_list()
+            for attribute in attributes:
+                self.sanitize_notebase(attribute)
 
-            return family
-        else:
-            return None
+        lds_ord_list = family.get_lds_ord_list()
+        for lds_ord in lds_ord_list:
+            self.sanitize_notebase(lds_ord)
+
+        return family
 
     def get_repository_from_handle(self, handle):
         """
         Finds a Repository in the database from the passed Gramps ID.
         If no such Repository exists, None is returned.
         """
-        repository = self.db.get_repository_from_handle(handle)
+        return self.__filter_repository(
+            self.db.get_repository_from_handle(handle))
+
+    def __filter_repository(self, repository):
+        """
+        Remove the filtered out notes from a repository.
+        """
         # Filter notes out
         self.sanitize_notebase(repository)
         self.sanitize_addressbase(repository)
@@ -287,6 +326,52 @@ class FilterProxyDb(ProxyDbBase):
         else:
             return None
 
+    def cursor_keep(self, obj_type):
+        """
+        Return the membership test of the handles of obj_type matching the
+        filters, if they are known.
+        """
+        if obj_type == 'person':
+            return self.plist.__contains__
+        if obj_type == 'family':
+            return self.flist.__contains__
+        if obj_type == 'event':
+            return self.elist.__contains__
+        if obj_type == 'note':
+            return self.nlist.__contains__
+        return None
+
+    def proxy_object(self, obj_type, obj):
+        """
+        Return obj without the references to the objects which do not match
+        the filters, or None if it does not match them.
+        """
+        if obj_type == 'person':
+            if obj.handle in self.plist:
+                return self.__filter_person(obj)
+            return None
+        if obj_type == 'family':
+            if obj.handle in self.flist:
+                return self.__filter_family(obj)
+            return None
+        if obj_type == 'event':
+            if obj.handle in self.elist:
+                return self.__filter_event(obj)
+            return None
+        if obj_type == 'note':
+            return obj if obj.handle in self.nlist else None
+        if obj_type == 'source':
+            return self.__filter_source(obj)
+        if obj_type == 'citation':
+            return self.__filter_citation(obj)
+        if obj_type == 'media':
+            return self.__filter_media(obj)
+        if obj_type == 'place':
+            return self.__filter_place(obj)
+        if obj_type == 'repository':
+            return self.__filter_repository(obj)
+        return obj
+
     def get_person_from_gramps_id(self, val):
         """
         Finds a Person in the database from the passed Gramps ID.
@@ -0,0 +1,361 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Proxy class for the Gramps databases. Flattens a stack of proxies.
+"""
+
+#-------------------------------------------------------------------------
+#
+# Python libraries
+#
+#-------------------------------------------------------------------------
+from collections import defaultdict
+
+#-------------------------------------------------------------------------
+#
+# Gramps libraries
+#
+#-------------------------------------------------------------------------
+from ..errors import HandleError
+from .proxybase import ProxyDbBase
+from ..utils.lru import LRU
+
+#-------------------------------------------------------------------------
+#
+# FlatProxyDb
+#
+#-------------------------------------------------------------------------
+class FlatProxyDb(ProxyDbBase):
+    """
+    A proxy to a stack of proxies (for example a PrivateProxyDb wrapped in a
+    LivingProxyDb wrapped in a FilterProxyDb).
+
+    Whether a handle is included by the whole stack is decided the first
+    time it is looked up, and remembered. The list of all the included
+    handles of an object type is only made when they are iterated over.
+    Objects are fetched through the stack once, and the sanitized result is
+    kept in a cache, so that later lookups do not go through every layer
+    again.
+
+    Like CacheProxyDb, this should only be used in read-only places (reports
+    and exports), as changes to the database are not tracked.
+    """
+    def __init__(self, db, cache_size=131071):
+        """
+        Create a new FlatProxyDb instance.
+
+        :param db: The database, or proxy stack, to be flattened
+        :type db: DbBase
+        :param cache_size: Maximum number of sanitized objects kept in memory
+        :type cache_size: int
+        """
+        ProxyDbBase.__init__(self, db)
+        self.handles = {}
+        self.included = defaultdict(dict)
+        self.cache = LRU(cache_size)
+
+    def __set_handles(self, obj_type, handles):
+        """
+        Record the list of all the handles of obj_type included by the
+        proxied database.
+        """
+        self.handles[obj_type] = handles
+        self.included[obj_type].update(dict.fromkeys(handles, True))
+
+    def __get_object(self, obj_type, handle):
+        """
+        Return the sanitized object with the given handle, or None if it is
+        not included.
+        """
+        if handle in self.cache:
+            return self.cache[handle]
+        included = self.included[obj_type]
+        if handle in included:
+            if not included[handle]:
+                return None
+        elif obj_type in self.handles:
+            # all the included handles are known
+            return None
+        try:
+            obj = getattr(self.db, 'get_%s_from_handle' % obj_type)(handle)
+        except HandleError:
+            obj = None
+        included[handle] = obj is not None
+        if obj is not None:
+            self.cache[handle] = obj
+        return obj
+
+    def __is_included(self, obj_type, handle):
+        """
+        Return True if the handle of obj_type is included by the proxied
+        database, deciding it on first use.
+        """
+        included = self.included[obj_type].get(handle)
+        if included is None:
+            return self.__get_object(obj_type, handle) is not None
+        return included
+
+    def __iter_handles(self, obj_type):
+        """
+        Return an iterator over the included handles of obj_type.
+        """
+        if obj_type not in self.handles:
+            iter_handles = getattr(self.db, 'iter_%s_handles' % obj_type)
+            self.__set_handles(obj_type, list(iter_handles()))
+        return iter(self.handles[obj_type])
+
+    def __iter_objects(self, obj_type):
+        """
+        Return an iterator over the included objects of obj_type.
+        """
+        for handle in self.__iter_handles(obj_type):
+            yield self.__get_object(obj_type, handle)
+
+    def proxy_object(self, obj_type, obj):
+        """
+        Return the cached object for obj, given by the cursor of the proxied
+        stack, caching obj if there is none yet.
+        """
+        if obj.handle in self.cache:
+            return self.cache[obj.handle]
+        self.included[obj_type][obj.handle] = True
+        self.cache[obj.handle] = obj
+        return obj
+
+    def iter_cursor_objects(self, obj_type, keep=None):
+        """
+        Return an iterator over the included (handle, object) pairs of
+        obj_type. The first full pass streams them from the cursor of the
+        proxied stack and records the included handles; later passes use
+        them and the cache.
+        """
+        if obj_type in self.handles:
+            for handle in self.handles[obj_type]:
+                if keep is None or keep(handle):
+                    yield handle, self.__get_object(obj_type, handle)
+            return
+        handles = []
+        for handle, obj in ProxyDbBase.iter_cursor_objects(self, obj_type):
+            handles.append(handle)
+            if keep is None or keep(handle):
+                yield handle, obj
+        self.__set_handles(obj_type, handles)
+
+    def __get_from_gramps_id(self, obj_type, val):
+        """
+        Return the sanitized object with the given Gramps ID, or None.
+        """
+        obj = getattr(self.basedb, 'get_%s_from_gramps_id' % obj_type)(val)
+        if obj is None:
+            return None
+        return self.__get_object(obj_type, obj.handle)
+
+    def clear_cache(self, handle=None):
+        """
+        Clear the object cache and the included handles.
+        """
+        self.cache.clear()
+        self.handles.clear()
+        self.included.clear()
+
+    # Predicates
+
+    def include_person(self, handle):
+        return self.__is_included('person', handle)
+
+    def include_family(self, handle):
+        return self.__is_included('family', handle)
+
+    def include_event(self, handle):
+        return self.__is_included('event', handle)
+
+    def include_source(self, handle):
+        return self.__is_included('source', handle)
+
+    def include_citation(self, handle):
+        return self.__is_included('citation', handle)
+
+    def include_place(self, handle):
+        return self.__is_included('place', handle)
+
+    def include_media(self, handle):
+        return self.__is_included('media', handle)
+
+    def include_repository(self, handle):
+        return self.__is_included('repository', handle)
+
+    def include_note(self, handle):
+        return self.__is_included('note', handle)
+
+    def include_tag(self, handle):
+        return self.__is_included('tag', handle)
+
+    has_person_handle = include_person
+    has_family_handle = include_family
+    has_event_handle = include_event
+    has_source_handle = include_source
+    has_citation_handle = include_citation
+    has_place_handle = include_place
+    has_media_handle = include_media
+    has_repository_handle = include_repository
+    has_note_handle = include_note
+    has_tag_handle = include_tag
+
+    # Handle iterators
+
+    def iter_person_handles(self):
+        return self.__iter_handles('person')
+
+    def iter_family_handles(self):
+        return self.__iter_handles('family')
+
+    def iter_event_handles(self):
+        return self.__iter_handles('event')
+
+    def iter_source_handles(self):
+        return self.__iter_handles('source')
+
+    def iter_citation_handles(self):
+        return self.__iter_handles('citation')
+
+    def iter_place_handles(self):
+        return self.__iter_handles('place')
+
+    def iter_media_handles(self):
+        return self.__iter_handles('media')
+
+    def iter_repository_handles(self):
+        return self.__iter_handles('repository')
+
+    def iter_note_handles(self):
+        return self.__iter_handles('note')
+
+    def iter_tag_handles(self):
+        return self.__iter_handles('tag')
+
+    # Object iterators
+
+    def iter_people(self):
+        return self.__iter_objects('person')
+
+    def iter_families(self):
+        return self.__iter_objects('family')
+
+    def iter_events(self):
+        return self.__iter_objects('event')
+
+    def iter_sources(self):
+        return self.__iter_objects('source')
+
+    def iter_citations(self):
+        return self.__iter_objects('citation')
+
+    def iter_places(self):
+        return self.__iter_objects('place')
+
+    def iter_media(self):
+        return self.__iter_objects('media')
+
+    def iter_repositories(self):
+        return self.__iter_objects('repository')
+
+    def iter_notes(self):
+        return self.__iter_objects('note')
+
+    def iter_tags(self):
+        return self.__iter_objects('tag')
+
+    # Object lookups
+
+    def get_person_from_handle(self, handle):
+        return self.__get_object('person', handle)
+
+    def get_family_from_handle(self, handle):
+        return self.__get_object('family', handle)
+
+    def get_event_from_handle(self, handle):
+        return self.__get_object('event', handle)
+
+    def get_source_from_handle(self, handle):
+        return self.__get_object('source', handle)
+
+    def get_citation_from_handle(self, handle):
+        return self.__get_object('citation', handle)
+
+    def get_place_from_handle(self, handle):
+        return self.__get_object('place', handle)
+
+    def get_media_from_handle(self, handle):
+        return self.__get_object('media', handle)
+
+    def get_repository_from_handle(self, handle):
+        return self.__get_object('repository', handle)
+
+    def get_note_from_handle(self, handle):
+        return self.__get_object('note', handle)
+
+    def get_tag_from_handle(self, handle):
+        return self.__get_object('tag', handle)
+
+    def get_person_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('person', val)
+
+    def get_family_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('family', val)
+
+    def get_event_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('event', val)
+
+    def get_place_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('place', val)
+
+    def get_source_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('source', val)
+
+    def get_citation_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('citation', val)
+
+    def get_media_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('media', val)
+
+    def get_repository_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('repository', val)
+
+    def get_note_from_gramps_id(self, val):
+        return self.__get_from_gramps_id('note', val)
+
+    def get_default_person(self):
+        """returns the default Person of the database"""
+        return self.get_person_from_handle(self.basedb.get_default_handle())
+
+    def get_default_handle(self):
+        """returns the default Person of the database"""
+        handle = self.basedb.get_default_handle()
+        if handle and self.include_person(handle):
+            return handle
+        return None
+
+    def find_backlink_handles(self, handle, include_classes=None):
+        """
+        Find all objects that hold a reference to the object handle.
+        Returns an iterator over a list of (class_name, handle) tuples.
+        """
+        return self.db.find_backlink_handles(handle, include_classes)
@@ -117,6 +117,20 @@ class LivingProxyDb(ProxyDbBase):
         family = self.__remove_living_from_family(family)
         return family
 
+    def proxy_object(self, obj_type, obj):
+        """
+        Return obj with the data of the living people restricted, or None
+        if it is a living person and they are all excluded.
+        """
+        if obj_type == 'person':
+            if self.__is_living(obj):
+                if self.mode == self.MODE_EXCLUDE_ALL:
+                    return None
+                return self.__restrict_person(obj)
+        elif obj_type == 'family':
+            return self.__remove_living_from_family(obj)
+        return obj
+
     def iter_people(self):
         """
         Protected version of iter_people
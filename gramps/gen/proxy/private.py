@@ -237,6 +237,17 @@ class PrivateProxyDb(ProxyDbBase):
             return note
         return None
 
+    def proxy_object(self, obj_type, obj):
+        """
+        Return obj without its private data, or None if it is private.
+        """
+        if obj_type not in SANITIZERS:
+            return obj
+        if obj.get_privacy():
+            return None
+        sanitize = SANITIZERS[obj_type]
+        return sanitize(self.db, obj) if sanitize else obj
+
     # Define predicate functions for use by default iterator methods
 
     def include_person(self, handle):
@@ -1126,3 +1137,11 @@ def sanitize_repository(db, repository):
     copy_urls(db, repository, new_repository)
 
     return new_repository
+
+# the sanitize functions of the primary objects with a privacy flag, by
+# object type
+SANITIZERS = {'person': sanitize_person, 'family': sanitize_family,
+              'event': sanitize_event, 'source': sanitize_source,
+              'citation': sanitize_citation, 'place': sanitize_place,
+              'media': sanitize_media, 'repository': sanitize_repository,
+              'note': None}
@@ -29,6 +29,7 @@ Proxy class for the Gramps databases. Filter out all data marked private.
 #
 #-------------------------------------------------------------------------
 import types
+from functools import partial
 
 #-------------------------------------------------------------------------
 #
@@ -40,13 +41,23 @@ from ..lib import (Citation, Event, Family, Media, Note, Person, Place,
                    Repository, Source, Tag)
 from ..const import GRAMPS_LOCALE as glocale
 
+# the classes of the primary objects, by object type
+CLASSES = {'person': Person, 'family': Family, 'event': Event,
+           'source': Source, 'citation': Citation, 'place': Place,
+           'media': Media, 'repository': Repository, 'note': Note,
+           'tag': Tag}
+
 class ProxyCursor:
     """
     A cursor for moving through proxied data.
+
+    The objects are streamed from the cursor of the proxied database and
+    pass once through each proxy. Iterating over the cursor gives
+    (handle, raw data) pairs like a database cursor, and iter_objects
+    gives (handle, object) pairs without serializing the objects.
     """
-    def __init__(self, get_raw, get_handles):
-        self.get_raw = get_raw
-        self.get_handles = get_handles
+    def __init__(self, iter_objects):
+        self.iter_objects = iter_objects
 
     def __enter__(self):
         """
@@ -58,8 +69,8 @@ class ProxyCursor:
         pass
 
     def __iter__(self):
-        for handle in self.get_handles():
-            yield handle, self.get_raw(handle)
+        for handle, obj in self.iter_objects():
+            yield handle, obj.serialize()
 
 class ProxyMap:
     """
@@ -78,6 +89,32 @@ class ProxyMap:
         """ return the keys """
         return self.get_keys()
 
+def _iter_db_cursor(db, obj_type, keep=None):
+    """
+    Return an iterator over (handle, object) pairs of the objects of
+    obj_type, from the cursor of a database which is not a ProxyDbBase.
+    Only the objects whose handle is accepted by keep are decoded.
+    """
+    with getattr(db, 'get_%s_cursor' % obj_type)() as cursor:
+        if isinstance(cursor, ProxyCursor):
+            # for example a CacheProxyDb wrapping a proxy
+            pairs = cursor.iter_objects()
+            if keep is None:
+                yield from pairs
+            else:
+                yield from (pair for pair in pairs if keep(pair[0]))
+        else:
+            create = CLASSES[obj_type].create
+            for handle, data in cursor:
+                if keep is None or keep(handle):
+                    yield handle, create(data)
+
+def _keep_both(keep1, keep2, handle):
+    """
+    Return True if handle is accepted by both predicates.
+    """
+    return keep1(handle) and keep2(handle)
+
 class ProxyDbBase(DbReadBase):
     """
     ProxyDbBase is a base class for building a proxy to a Gramps database.
@@ -146,6 +183,59 @@ class ProxyDbBase(DbReadBase):
         # Call function to determine if object should be included or not
         return obj.include()
 
+    def cursor_keep(self, obj_type):
+        """
+        Return a predicate on the handles of obj_type which rejects objects
+        the proxy excludes, without needing the objects, or None.
+
+        The cursors check it before the objects are decoded and sanitized
+        by the proxied databases. The default is the include_<obj_type>
+        predicate, when the proxy does not change the objects.
+        """
+        method = 'get_%s_from_handle' % obj_type
+        if getattr(type(self), method) is getattr(ProxyDbBase, method):
+            return getattr(self, 'include_' + obj_type)
+        return None
+
+    def proxy_object(self, obj_type, obj):
+        """
+        Return obj, an object of obj_type given by the proxied database, as
+        given by this proxy, or None if the proxy does not include it.
+
+        This is used by the cursors of the proxy. The default fetches the
+        object again with get_<obj_type>_from_handle, unless the proxy
+        only defines an include_<obj_type> predicate. Proxies which change
+        the objects override it to work on obj directly.
+        """
+        method = 'get_%s_from_handle' % obj_type
+        if getattr(type(self), method) is getattr(ProxyDbBase, method):
+            include = getattr(self, 'include_' + obj_type)
+            if include is None or include(obj.handle):
+                return obj
+            return None
+        return getattr(self, method)(obj.handle)
+
+    def iter_cursor_objects(self, obj_type, keep=None):
+        """
+        Return an iterator over (handle, object) pairs of the objects of
+        obj_type included by the proxy, streamed from the cursor of the
+        proxied database. Only the objects whose handle is accepted by the
+        keep predicate, if any, are given.
+        """
+        own_keep = self.cursor_keep(obj_type)
+        if keep is None:
+            keep = own_keep
+        elif own_keep is not None:
+            keep = partial(_keep_both, keep, own_keep)
+        if isinstance(self.db, ProxyDbBase):
+            pairs = self.db.iter_cursor_objects(obj_type, keep)
+        else:
+            pairs = _iter_db_cursor(self.db, obj_type, keep)
+        for handle, obj in pairs:
+            obj = self.proxy_object(obj_type, obj)
+            if obj is not None:
+                yield handle, obj
+
     # Define default predicates for each object type
 
     include_person = \
@@ -161,44 +251,34 @@ class ProxyDbBase(DbReadBase):
         None
 
     def get_person_cursor(self):
-        return ProxyCursor(self.get_raw_person_data,
-                           self.get_person_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'person'))
 
     def get_family_cursor(self):
-        return ProxyCursor(self.get_raw_family_data,
-                           self.get_family_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'family'))
 
     def get_event_cursor(self):
-        return ProxyCursor(self.get_raw_event_data,
-                           self.get_event_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'event'))
 
     def get_source_cursor(self):
-        return ProxyCursor(self.get_raw_source_data,
-                           self.get_source_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'source'))
 
     def get_citation_cursor(self):
-        return ProxyCursor(self.get_raw_citation_data,
-                           self.get_citation_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'citation'))
 
     def get_place_cursor(self):
-        return ProxyCursor(self.get_raw_place_data,
-                           self.get_place_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'place'))
 
     def get_media_cursor(self):
-        return ProxyCursor(self.get_raw_media_data,
-                           self.get_media_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'media'))
 
     def get_repository_cursor(self):
-        return ProxyCursor(self.get_raw_repository_data,
-                           self.get_repository_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'repository'))
 
     def get_note_cursor(self):
-        return ProxyCursor(self.get_raw_note_data,
-                           self.get_note_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'note'))
 
     def get_tag_cursor(self):
-        return ProxyCursor(self.get_raw_tag_data,
-                           self.get_tag_handles)
+        return ProxyCursor(partial(self.iter_cursor_objects, 'tag'))
 
     def get_person_handles(self, sort_handles=False, locale=glocale):
         """
@@ -995,3 +1075,16 @@ class ProxyDbBase(DbReadBase):
         """
         return self.basedb.get_dbid()
 
+    def get_revision(self):
+        """
+        Return the revision counter of the real database.
+        """
+        return self.basedb.get_revision()
+
+    def get_changes(self, revision):
+        """
+        Return None, as the objects given by a proxy may change with other
+        objects of the real database.
+        """
+        return None
+
@@ -0,0 +1,108 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that compares the cursors of the proxies with their lookups
+"""
+import os
+import unittest
+from time import perf_counter
+
+from ...db.utils import import_as_dict
+from ...filters import GenericFilter
+from ...filters.rules.person import IsDescendantOf, HasNameOf
+from ...const import DATA_DIR
+from ...user import User
+from .. import PrivateProxyDb, LivingProxyDb, FilterProxyDb, FlatProxyDb
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+OBJ_TYPES = ('person', 'family', 'event', 'place', 'source', 'citation',
+             'repository', 'media', 'note', 'tag')
+
+class ProxyCursorTest(unittest.TestCase):
+    """
+    Proxy cursor tests.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Import example database.
+        """
+        cls.db = import_as_dict(EXAMPLE, User())
+
+    def make_stacks(self):
+        """
+        Return each layer of the stack of proxies used by exports and
+        reports, and the flattened stack.
+        """
+        person_filter = GenericFilter()
+        person_filter.add_rule(IsDescendantOf(['I0044', 1]))
+        private = PrivateProxyDb(self.db)
+        living = LivingProxyDb(private,
+                               LivingProxyDb.MODE_INCLUDE_LAST_NAME_ONLY)
+        filtered = FilterProxyDb(living, person_filter)
+        return (private, living,
+                LivingProxyDb(self.db, LivingProxyDb.MODE_EXCLUDE_ALL),
+                filtered, FlatProxyDb(FilterProxyDb(living, person_filter)))
+
+    def test_same_data(self):
+        """
+        The cursors give the objects given by the lookups of the proxy.
+        """
+        for dbase in self.make_stacks():
+            for obj_type in OBJ_TYPES:
+                get_object = getattr(dbase, 'get_%s_from_handle' % obj_type)
+                with getattr(dbase, 'get_%s_cursor' % obj_type)() as cursor:
+                    data = dict(cursor)
+                handles = set(getattr(dbase, 'iter_%s_handles' % obj_type)())
+                self.assertEqual(set(data), handles,
+                                 (dbase.__class__.__name__, obj_type))
+                for handle in handles:
+                    self.assertEqual(data[handle],
+                                     get_object(handle).serialize())
+
+    def test_filter(self):
+        """
+        A filter run on the cursor of a proxy matches the same people as
+        when run on their handles.
+        """
+        person_filter = GenericFilter()
+        person_filter.add_rule(HasNameOf(['', 'Garner', '', '', '', '', '',
+                                          '', '', '', '']))
+        for dbase in self.make_stacks():
+            stime = perf_counter()
+            found = person_filter.apply(dbase)
+            if __debug__:
+                print("%s cursor: %.3f" % (dbase.__class__.__name__,
+                                           perf_counter() - stime))
+            stime = perf_counter()
+            expected = person_filter.apply(
+                dbase, list(dbase.iter_person_handles()))
+            if __debug__:
+                print("%s handles: %.3f" % (dbase.__class__.__name__,
+                                            perf_counter() - stime))
+            self.assertEqual(sorted(found), sorted(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that compares the flattened proxy with the stack of proxies
+"""
+import os
+import unittest
+from time import perf_counter
+
+from ...db.utils import import_as_dict
+from ...filters import GenericFilter
+from ...filters.rules.person import IsDescendantOf
+from ...const import DATA_DIR, TEMP_DIR
+from ...user import User
+from .. import PrivateProxyDb, LivingProxyDb, FilterProxyDb, FlatProxyDb
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+OBJ_TYPES = ('person', 'family', 'event', 'place', 'source', 'citation',
+             'repository', 'media', 'note', 'tag')
+
+class FlatProxyTest(unittest.TestCase):
+    """
+    FlatProxyDb tests.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Import example database.
+        """
+        cls.db = import_as_dict(EXAMPLE, User())
+
+    def make_stack(self):
+        """
+        Return the stack of proxies used by exports and reports.
+        """
+        person_filter = GenericFilter()
+        person_filter.add_rule(IsDescendantOf(['I0044', 1]))
+        dbase = PrivateProxyDb(self.db)
+        dbase = LivingProxyDb(dbase, LivingProxyDb.MODE_INCLUDE_LAST_NAME_ONLY)
+        return FilterProxyDb(dbase, person_filter)
+
+    def test_same_data(self):
+        """
+        The flattened proxy gives the same objects as the stack.
+        """
+        stack = self.make_stack()
+        flat = FlatProxyDb(self.make_stack())
+        for obj_type in OBJ_TYPES:
+            handles = set(getattr(stack, 'iter_%s_handles' % obj_type)())
+            self.assertEqual(
+                handles, set(getattr(flat, 'iter_%s_handles' % obj_type)()))
+            get_stack = getattr(stack, 'get_%s_from_handle' % obj_type)
+            get_flat = getattr(flat, 'get_%s_from_handle' % obj_type)
+            for handle in handles:
+                self.assertEqual(get_stack(handle).serialize(),
+                                 get_flat(handle).serialize())
+        included = set(stack.iter_person_handles())
+        self.assertEqual([handle for handle in
+                          self.db.get_person_handles(sort_handles=True)
+                          if handle in included],
+                         flat.get_person_handles(sort_handles=True))
+        self.assertEqual(stack.get_number_of_people(),
+                         flat.get_number_of_people())
+
+    def test_excluded(self):
+        """
+        Objects excluded by the stack are excluded by the flattened proxy.
+        """
+        stack = self.make_stack()
+        flat = FlatProxyDb(self.make_stack())
+        for handle in self.db.iter_person_handles():
+            self.assertEqual(stack.has_person_handle(handle),
+                             flat.has_person_handle(handle))
+            if not stack.has_person_handle(handle):
+                self.assertIsNone(flat.get_person_from_handle(handle))
+
+    def test_lookups(self):
+        """
+        Looking up a few objects does not go over the whole stack.
+        """
+        stack = self.make_stack()
+        flat = FlatProxyDb(self.make_stack())
+        person = self.db.get_person_from_gramps_id('I0044')
+        self.assertEqual(flat.get_person_from_handle(person.handle).serialize(),
+                         stack.get_person_from_handle(person.handle).serialize())
+        for handle in person.get_family_handle_list():
+            self.assertEqual(flat.has_family_handle(handle),
+                             stack.has_family_handle(handle))
+        self.assertFalse(flat.has_person_handle('missing'))
+        self.assertEqual(flat.handles, {})
+
+    def test_gedcom_export(self):
+        """
+        Compare the time of a full GEDCOM export through both proxies.
+        """
+        from gramps.plugins.export.exportgedcom import GedcomWriter
+        results = []
+        for dbase in (self.make_stack(), FlatProxyDb(self.make_stack())):
+            filename = os.path.join(TEMP_DIR, "flat_test.ged")
+            stime = perf_counter()
+            GedcomWriter(dbase, User()).write_gedcom_file(filename)
+            if __debug__:
+                print("%s: %.2f\n" % (dbase.__class__.__name__,
+                                      perf_counter() - stime))
+            with open(filename, encoding='utf-8') as ged_file:
+                # skip the header, which contains the time of the export
+                results.append(ged_file.readlines()[12:])
+            os.remove(filename)
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
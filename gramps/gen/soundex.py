@@ -35,6 +35,7 @@ import unicodedata
 #
 #-------------------------------------------------------------------------
 IGNORE = "HW~!@#$%^&*()_+=-`[]\\|;:'/?.,<>\" \t\f\v"
+IGNORE_TABLE = str.maketrans('', '', IGNORE)
 TABLE = bytes.maketrans(b'ABCDEFGIJKLMNOPQRSTUVXYZ',
                         b'012301202245501262301202')
 
@@ -52,8 +53,7 @@ def soundex(strval):
         return "Z000"
     strval = strval.decode('ASCII', 'ignore')
     str2 = strval[0]
-    translator = strval.maketrans('','',IGNORE)
-    strval = strval.translate(translator)
+    strval = strval.translate(IGNORE_TABLE)
     strval = strval.translate(TABLE)
     if not strval:
         return "Z000"
@@ -343,62 +343,26 @@ class Callback:
                        % ((str(signal_name), ) + inspect.stack()[1][1:4]))
             return
 
+        # The arguments are only checked, and the emission only logged, when
+        # running in debug mode or when logging is switched on: with
+        # python -O and logging off, emitting a signal just calls the
+        # callbacks.
+        logging = self.__LOG_ALL or self.__enable_logging
         try:
             self._current_signals.append(signal_name)
 
-            # check that args is a tuple. This is a common programming error.
-            if not (isinstance(args, tuple) or args is None):
-                self._warn("Signal emitted with argument that is not a tuple.\n"
-                           "  emit() takes two arguments, the signal name and a \n"
-                           "  tuple that contains the arguments that are to be \n"
-                           "  passed to the callbacks. If you are passing a signal \n"
-                           "  argument it must be done as a single element tuple \n"
-                           "  e.g. emit('my-signal', (1, )) \n"
-                           "         signal was: %s\n"
-                           "         from: file: %s\n"
-                           "               line: %d\n"
-                           "               func: %s\n"
-                           % ((str(signal_name), ) + inspect.stack()[1][1:4]))
+            if (__debug__ or logging) and \
+                    not self.__check_args(signal_name, args):
                 return
 
-            # type check arguments
-            arg_types = self.__signal_map[signal_name]
-            if arg_types is None and len(args) > 0:
-                self._warn("Signal emitted with "
-                           "wrong number of args: %s\n"
-                           "         from: file: %s\n"
-                           "               line: %d\n"
-                           "               func: %s\n"
-                           % ((str(signal_name), ) + inspect.stack()[1][1:4]))
-                return
-
-            if len(args) > 0:
-                if len(args) != len(arg_types):
-                    self._warn("Signal emitted with "
-                               "wrong number of args: %s\n"
-                               "         from: file: %s\n"
-                               "               line: %d\n"
-                               "               func: %s\n"
-                               % ((str(signal_name), ) + inspect.stack()[1][1:4]))
-                    return
-
-                if arg_types is not None:
-                    for i in range(0, len(arg_types)):
-                        if not isinstance(args[i], arg_types[i]):
-                            self._warn("Signal emitted with "
-                                       "wrong arg types: %s\n"
-                                       "         from: file: %s\n"
-                                       "               line: %d\n"
-                                       "               func: %s\n"
-                                       "    arg passed was: %s, type of arg passed %s,  type should be: %s\n"
-                                       % ((str(signal_name), ) + inspect.stack()[1][1:4] +\
-                                          (args[i], repr(type(args[i])), repr(arg_types[i]))))
-                            return
-            if signal_name in self.__callback_map:
-                self._log("emitting signal: %s\n" % (signal_name, ))
+            callbacks = self.__callback_map.get(signal_name)
+            if callbacks:
                 # Don't bother if there are no callbacks.
-                for (key, fn) in self.__callback_map[signal_name]:
-                    self._log("Calling callback with key: %s\n" % (key, ))
+                if logging:
+                    self._log("emitting signal: %s\n" % (signal_name, ))
+                for (key, fn) in callbacks:
+                    if logging:
+                        self._log("Calling callback with key: %s\n" % (key, ))
                     try:
                         if isinstance(fn, types.FunctionType) or \
                                 isinstance(fn, types.MethodType): # call func
@@ -411,6 +375,61 @@ class Callback:
         finally:
             self._current_signals.remove(signal_name)
 
+    def __check_args(self, signal_name, args):
+        """
+        Check that args match the types declared for the signal. Return
+        False, after a warning, if they don't.
+        """
+        # check that args is a tuple. This is a common programming error.
+        if not (isinstance(args, tuple) or args is None):
+            self._warn("Signal emitted with argument that is not a tuple.\n"
+                       "  emit() takes two arguments, the signal name and a \n"
+                       "  tuple that contains the arguments that are to be \n"
+                       "  passed to the callbacks. If you are passing a signal \n"
+                       "  argument it must be done as a single element tuple \n"
+                       "  e.g. emit('my-signal', (1, )) \n"
+                       "         signal was: %s\n"
+                       "         from: file: %s\n"
+                       "               line: %d\n"
+                       "               func: %s\n"
+                       % ((str(signal_name), ) + inspect.stack()[2][1:4]))
+            return False
+
+        # type check arguments
+        arg_types = self.__signal_map[signal_name]
+        if arg_types is None and len(args) > 0:
+            self._warn("Signal emitted with "
+                       "wrong number of args: %s\n"
+                       "         from: file: %s\n"
+                       "               line: %d\n"
+                       "               func: %s\n"
+                       % ((str(signal_name), ) + inspect.stack()[2][1:4]))
+            return False
+
+        if len(args) > 0:
+            if len(args) != len(arg_types):
+                self._warn("Signal emitted with "
+                           "wrong number of args: %s\n"
+                           "         from: file: %s\n"
+                           "               line: %d\n"
+                           "               func: %s\n"
+                           % ((str(signal_name), ) + inspect.stack()[2][1:4]))
+                return False
+
+            if arg_types is not None:
+                for i in range(0, len(arg_types)):
+                    if not isinstance(args[i], arg_types[i]):
+                        self._warn("Signal emitted with "
+                                   "wrong arg types: %s\n"
+                                   "         from: file: %s\n"
+                                   "               line: %d\n"
+                                   "               func: %s\n"
+                                   "    arg passed was: %s, type of arg passed %s,  type should be: %s\n"
+                                   % ((str(signal_name), ) + inspect.stack()[2][1:4] +\
+                                      (args[i], repr(type(args[i])), repr(arg_types[i]))))
+                        return False
+        return True
+
     #
     # instance signals control methods
     #
@@ -33,6 +33,7 @@ import os
 import sys
 import shutil
 import hashlib
+import threading
 import logging
 LOG = logging.getLogger(".gen.utils.file")
 
@@ -265,3 +266,141 @@ def create_checksum(full_path):
     except UnicodeEncodeError:
         md5sum = ''
     return md5sum
+
+#-------------------------------------------------------------------------
+#
+#  FileCopier
+#
+#-------------------------------------------------------------------------
+COPY_ALWAYS = 'copy'
+COPY_CHANGED = 'changed'
+COPY_LINK = 'link'
+
+COPY_STRATEGIES = (
+    (COPY_ALWAYS, glocale.translation.gettext("Always copy")),
+    (COPY_CHANGED, glocale.translation.gettext("Copy changed files only")),
+    (COPY_LINK, glocale.translation.gettext("Link or copy changed files")),
+    )
+
+def is_unchanged_copy(source, destination):
+    """
+    Return True if destination exists and has the same size and modification
+    time as source, in which case copying it again can be skipped.
+    """
+    try:
+        src = os.stat(source)
+        dst = os.stat(destination)
+    except OSError:
+        return False
+    return (src.st_size == dst.st_size and
+            int(src.st_mtime) == int(dst.st_mtime))
+
+class FileCopier:
+    """
+    Copy files to a destination tree according to a copy strategy, keeping
+    statistics about the files and bytes handled.
+
+    COPY_ALWAYS copies every file. COPY_CHANGED skips files whose destination
+    already has the same size and modification time. COPY_LINK additionally
+    tries to hard link the file when source and destination are on the same
+    filesystem, falling back to a plain copy.
+
+    When workers is larger than 1, the copies are done by a pool of threads;
+    call :meth:`close` to wait for them to finish. The failed copies are
+    listed in errors, as (name, source, message) tuples.
+    """
+    def __init__(self, strategy=COPY_ALWAYS, workers=1):
+        self.strategy = strategy
+        self.copied = 0
+        self.bytes_copied = 0
+        self.linked = 0
+        self.skipped = 0
+        self.bytes_skipped = 0
+        self.errors = []
+        self.__lock = threading.Lock()
+        self.__pool = None
+        self.__futures = []
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            self.__pool = ThreadPoolExecutor(max_workers=workers)
+
+    def copy(self, source, destination, name=None, wait=False):
+        """
+        Copy source to destination, preserving the modification time.
+
+        name identifies the file in errors, like the ID of a media object.
+        Return False if the copy failed. With a pool of threads, the copy
+        is only queued and True is returned; its failure is only listed in
+        errors. If wait is True, the copy is always done before returning,
+        as needed for a temporary source which is removed afterwards.
+        """
+        if self.strategy != COPY_ALWAYS and is_unchanged_copy(source,
+                                                              destination):
+            self.skipped += 1
+            self.bytes_skipped += os.path.getsize(source)
+            return True
+        if self.__pool is None or wait:
+            return self.__copy(source, destination, name)
+        self.__futures.append(self.__pool.submit(self.__copy, source,
+                                                 destination, name))
+        return True
+
+    def __copy(self, source, destination, name):
+        """
+        Do the actual work of linking or copying one file.
+        Return False if it failed.
+        """
+        try:
+            stat = os.stat(source)
+            if self.strategy == COPY_LINK and self.__link(source, destination,
+                                                          stat):
+                with self.__lock:
+                    self.linked += 1
+                return True
+            shutil.copyfile(source, destination)
+            os.utime(destination, (stat.st_mtime, stat.st_mtime))
+            with self.__lock:
+                self.copied += 1
+                self.bytes_copied += stat.st_size
+            return True
+        except (IOError, OSError) as err:
+            LOG.warning("Copying '%s' to '%s' failed: %s",
+                        source, destination, err)
+            with self.__lock:
+                self.errors.append((name, source, str(err)))
+            return False
+
+    def __link(self, source, destination, stat):
+        """
+        Try to hard link source to destination. Return True on success.
+        """
+        try:
+            dest_dir = os.path.dirname(os.path.abspath(destination))
+            if os.stat(dest_dir).st_dev != stat.st_dev:
+                return False
+            if os.path.lexists(destination):
+                os.remove(destination)
+            os.link(source, destination)
+            return True
+        except (OSError, AttributeError, NotImplementedError):
+            return False
+
+    def close(self):
+        """
+        Wait for pending copies and release the worker threads.
+        """
+        if self.__pool is not None:
+            for future in self.__futures:
+                future.result()
+            self.__futures = []
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def get_summary(self):
+        """
+        Return a printable summary of the work done.
+        """
+        return ("%d files copied (%d bytes), %d linked, "
+                "%d skipped as unchanged (%d bytes), %d errors" %
+                (self.copied, self.bytes_copied, self.linked, self.skipped,
+                 self.bytes_skipped, len(self.errors)))
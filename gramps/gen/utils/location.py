@@ -28,21 +28,30 @@ from ..lib.date import Date, Today
 # get_location_list
 #
 #-------------------------------------------------------------------------
-def get_location_list(db, place, date=None, lang=''):
+def get_location_list(db, place, date=None, lang='', cache=None):
     """
     Return a list of place names for display.
+
+    If a cache is given, the names of the places enclosing the place are
+    kept in it, keyed by the handle of the enclosing place, the language and,
+    if names or references in the hierarchy are dated, the date. The cache is
+    only valid for as long as the places of the database do not change.
     """
     if date is None:
         date = __get_latest_date(place)
     visited = [place.handle]
     lines = [(__get_name(place, date, lang), place.get_type())]
+    if cache is not None:
+        handle = __get_enclosing_handle(place, date)
+        if handle is not None:
+            for handle, line in __get_chain(db, handle, date, lang, cache):
+                if handle in visited:
+                    break
+                visited.append(handle)
+                lines.append(line)
+        return lines
     while True:
-        handle = None
-        for placeref in place.get_placeref_list():
-            ref_date = placeref.get_date_object()
-            if ref_date.is_empty() or date.match_exact(ref_date):
-                handle = placeref.ref
-                break
+        handle = __get_enclosing_handle(place, date)
         if handle is None or handle in visited:
             break
         place = db.get_place_from_handle(handle)
@@ -52,6 +61,81 @@ def get_location_list(db, place, date=None, lang=''):
         lines.append((__get_name(place, date, lang), place.get_type()))
     return lines
 
+def __get_enclosing_handle(place, date):
+    for placeref in place.get_placeref_list():
+        ref_date = placeref.get_date_object()
+        if ref_date.is_empty() or date.match_exact(ref_date):
+            return placeref.ref
+    return None
+
+def __get_chain(db, handle, date, lang, cache):
+    """
+    Return the (handle, (name, type)) tuples of the place with the given handle
+    and of the places enclosing it, from the cache where possible.
+
+    Every place walked through is added to the cache with the places above
+    it, so that the hierarchy of a whole tree is only walked once.
+    """
+    date_key = __get_date_key(date)
+    walked = []
+    visited = set()
+    tail = ()
+    tail_dated = False
+    cycle = False
+    while True:
+        if (handle, lang) in cache:
+            tail = cache[(handle, lang)]
+            break
+        if (handle, lang, date_key) in cache:
+            tail = cache[(handle, lang, date_key)]
+            tail_dated = True
+            break
+        if handle in visited:
+            # corrupt hierarchy: the places of a loop are not cached
+            cycle = True
+            break
+        place = db.get_place_from_handle(handle)
+        if place is None:
+            break
+        visited.add(handle)
+        walked.append((handle, (__get_name(place, date, lang),
+                                place.get_type()), __is_dated(place)))
+        handle = __get_enclosing_handle(place, date)
+        if handle is None:
+            break
+
+    chain = tail
+    dated = tail_dated
+    for handle, line, place_dated in reversed(walked):
+        chain = ((handle, line),) + chain
+        dated = dated or place_dated
+        if cycle:
+            continue
+        if dated:
+            cache[(handle, lang, date_key)] = chain
+        else:
+            cache[(handle, lang)] = chain
+    return chain
+
+def __is_dated(place):
+    """
+    Return True if the names or the enclosing places of the place depend on
+    the date.
+    """
+    for place_name in place.get_all_names():
+        if not place_name.get_date_object().is_empty():
+            return True
+    for placeref in place.get_placeref_list():
+        if not placeref.get_date_object().is_empty():
+            return True
+    return False
+
+def __get_date_key(date):
+    if date.modifier == Date.MOD_TEXTONLY:
+        return (Date.MOD_TEXTONLY, date.text)
+    return (date.calendar, date.modifier, date.quality, date.dateval,
+            date.newyear)
+
 def __get_name(place, date, lang):
     endonym = None
     for place_name in place.get_all_names():
@@ -255,6 +255,9 @@ class TestCallback(unittest.TestCase):
         def fn3(s,r=res):
             res.append(s)
         t._warn = fn3
+        # the arguments are not checked with python -O unless logging is on
+        t._log = lambda msg: None
+        t.enable_logging()
         t.connect('test-lots',fn2), t.emit('test-lots',('a','a',[1,2],t,1.2))
         self.assertEqual(res[0][0:6], "Signal", "Type error not detected")
 
@@ -31,6 +31,7 @@ File tests.
 #
 #-------------------------------------------------------------------------
 import os
+import shutil
 import unittest
 
 #-------------------------------------------------------------------------
@@ -39,7 +40,8 @@ import unittest
 #
 #-------------------------------------------------------------------------
 from ...const import TEMP_DIR, USER_HOME, USER_PLUGINS, VERSION
-from ...utils.file import media_path, get_empty_tempdir
+from ...utils.file import (media_path, get_empty_tempdir, FileCopier,
+                           COPY_ALWAYS, COPY_CHANGED, COPY_LINK)
 from ...db.utils import make_database
 
 #-------------------------------------------------------------------------
@@ -106,6 +108,59 @@ class FileTest(unittest.TestCase):
         # Restore environment
         os.environ = old_env
 
+    def test_filecopier(self):
+        """
+        Test the copy strategies of FileCopier.
+        """
+        path = get_empty_tempdir("utils_filecopier_test")
+        source = os.path.join(path, "source.txt")
+        dest = os.path.join(path, "dest.txt")
+        with open(source, "w") as source_file:
+            source_file.write("0123456789")
+
+        copier = FileCopier(COPY_ALWAYS)
+        copier.copy(source, dest)
+        copier.copy(source, dest)
+        self.assertEqual((copier.copied, copier.bytes_copied), (2, 20))
+        self.assertEqual(os.stat(source).st_mtime, os.stat(dest).st_mtime)
+
+        copier = FileCopier(COPY_CHANGED, workers=2)
+        copier.copy(source, dest)
+        os.utime(source, (0, 0))
+        copier.copy(source, dest)
+        copier.close()
+        self.assertEqual((copier.skipped, copier.bytes_skipped), (1, 10))
+        self.assertEqual((copier.copied, copier.bytes_copied), (1, 10))
+
+        os.remove(dest)
+        copier = FileCopier(COPY_LINK)
+        copier.copy(source, dest)
+        self.assertEqual(copier.linked + copier.copied, 1)
+        self.assertEqual(copier.errors, [])
+        with open(dest) as dest_file:
+            self.assertEqual(dest_file.read(), "0123456789")
+
+        # a temporary file is copied before returning, even with a pool
+        temp = os.path.join(path, "temp.txt")
+        shutil.copyfile(source, temp)
+        os.remove(dest)
+        copier = FileCopier(COPY_ALWAYS, workers=2)
+        self.assertTrue(copier.copy(temp, dest, wait=True))
+        os.remove(temp)
+        copier.close()
+        self.assertEqual((copier.copied, copier.errors), (1, []))
+        with open(dest) as dest_file:
+            self.assertEqual(dest_file.read(), "0123456789")
+
+        # a failed copy is reported to the caller, and listed by name
+        missing = os.path.join(path, "missing.txt")
+        copier = FileCopier(COPY_ALWAYS)
+        self.assertFalse(copier.copy(missing, dest, "O0001"))
+        os.remove(dest)
+        self.assertTrue(copier.copy(source, dest))
+        self.assertEqual([error[:2] for error in copier.errors],
+                         [("O0001", missing)])
+
 
 #-------------------------------------------------------------------------
 #
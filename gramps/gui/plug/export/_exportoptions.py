@@ -44,7 +44,9 @@ from ...user import User
 from gramps.gen.proxy import (PrivateProxyDb,
                               LivingProxyDb,
                               FilterProxyDb,
-                              ReferencedBySelectionProxyDb)
+                              ReferencedBySelectionProxyDb,
+                              FlatProxyDb)
+from gramps.gen.proxy.proxybase import ProxyDbBase
 
 #-------------------------------------------------------------------------
 #
@@ -577,6 +579,9 @@ class WriterOptionBox:
                     ngettext("{number_of} Person",
                              "{number_of} People", people_count
                             ).format(number_of=people_count) )
+        if isinstance(dbase, ProxyDbBase):
+            # evaluate the stack of proxies once per object
+            dbase = FlatProxyDb(dbase)
         return dbase
 
     def apply_proxy(self, proxy_name, dbase, progress=None):
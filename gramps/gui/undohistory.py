@@ -119,6 +119,8 @@ class UndoHistory(ManagedWindow):
 
         scrolled_window.add(self.tree)
         self.window.vbox.pack_start(scrolled_window, True, True, 0)
+        self.usage_label = Gtk.Label(halign=Gtk.Align.START)
+        self.window.vbox.pack_start(self.usage_label, False, False, 6)
 
         self.sel_chng_hndlr = self.selection.connect('changed',
                                                      self._selection_changed)
@@ -225,6 +227,11 @@ class UndoHistory(ManagedWindow):
         self.clear_button.set_sensitive(
             self.undodb.undo_count or self.undodb.redo_count
             )
+        if hasattr(self.undodb, 'get_memory_usage'):
+            log_size, memory = self.undodb.get_memory_usage()
+            self.usage_label.set_text(
+                _("Undo log: %(log).1f MB, in memory: %(memory).1f MB") %
+                {'log': log_size / 1048576, 'memory': memory / 1048576})
 
     def _build_model(self):
         self.selection.handler_block(self.sel_chng_hndlr)
@@ -56,6 +56,7 @@ LOG = logging.getLogger(".")
 #-------------------------------------------------------------------------
 from gi.repository import Gtk
 from gi.repository import Gdk
+from gi.repository import GLib
 
 #-------------------------------------------------------------------------
 #
@@ -1019,6 +1020,13 @@ class ViewManager(CLIManager):
             msg = "%s (%s) - Gramps" % (name, _('Read Only'))
         self.uistate.window.set_title(msg)
 
+        # merge the signals of the transactions committed during one
+        # iteration of the main loop
+        try:
+            self.dbstate.db.set_signal_scheduler(GLib.idle_add)
+        except NotImplementedError:
+            pass
+
         if(bool(config.get('behavior.runcheck')) and QuestionDialog2(
            _("Gramps had a problem the last time it was run."),
            _("Would you like to run the Check and Repair tool?"),
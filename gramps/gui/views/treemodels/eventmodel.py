@@ -39,8 +39,8 @@ from gi.repository import Gtk
 # Gramps modules
 #
 #-------------------------------------------------------------------------
-from gramps.gen.datehandler import format_time, get_date, get_date_valid
-from gramps.gen.lib import Event, EventType
+from gramps.gen.datehandler import displayer, format_time
+from gramps.gen.lib import Date, Event, EventType
 from gramps.gen.utils.db import get_participant_from_event
 from gramps.gen.display.place import displayer as place_displayer
 from gramps.gen.config import config
@@ -154,12 +154,11 @@ class EventModel(FlatBaseModel):
 
     def column_date(self,data):
         if data[COLUMN_DATE]:
-            event = Event()
-            event.unserialize(data)
-            date_str = get_date(event)
-            if date_str != "":
-                retval = escape(date_str)
-            if not get_date_valid(event):
+            # only the date is needed, not the whole event
+            date = Date()
+            date.unserialize(data[COLUMN_DATE])
+            retval = escape(displayer.display(date))
+            if not date.get_valid():
                 return INVALID_DATE_FORMAT % retval
             else:
                 return retval
@@ -167,10 +166,10 @@ class EventModel(FlatBaseModel):
 
     def sort_date(self,data):
         if data[COLUMN_DATE]:
-            event = Event()
-            event.unserialize(data)
-            retval = "%09d" % event.get_date_object().get_sort_value()
-            if not get_date_valid(event):
+            date = Date()
+            date.unserialize(data[COLUMN_DATE])
+            retval = "%09d" % date.get_sort_value()
+            if not date.get_valid():
                 return INVALID_DATE_FORMAT % retval
             else:
                 return retval
@@ -53,6 +53,7 @@ It keeps a FlatNodeMap, and obtains data from database as needed
 #-------------------------------------------------------------------------
 import logging
 import bisect
+from itertools import islice
 from time import perf_counter
 
 _LOG = logging.getLogger(".gui.basetreemodel")
@@ -448,6 +449,8 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
     ..Note: glocale.sort_key is applied to the underlying sort key,
             so as to have localized sort
     """
+    # number of rows read from the cursor at once when sorting
+    SORT_BATCH = 1000
 
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(),
@@ -477,6 +480,7 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         # get the function that maps data to sort_keys
         self.sort_func = lambda x: glocale.sort_key(self.smap[col](x))
         self.sort_col = scol
+        self.sort_model_col = col
         self.skip = skip
         self._in_build = False
 
@@ -559,19 +563,36 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         """
         return None
 
+    def sort_values(self, data_list):
+        """
+        Return the values of the sort column for a list of raw data.
+        Inheriting classes can override this to compute the values of many
+        rows at once.
+        """
+        sort_map = self.smap[self.sort_model_col]
+        return [sort_map(data) for data in data_list]
+
     def sort_keys(self):
         """
         Return the (sort_key, handle) list of all data that can maximally
         be shown.
         This list is sorted ascending, via localized string sort.
         """
+        sort_key = glocale.sort_key
+        srt_keys = []
         # use cursor as a context manager
         with self.gen_cursor() as cursor:
-            #loop over database and store the sort field, and the handle
-            srt_keys=[(self.sort_func(data), key)
-                      for key, data in cursor]
-            srt_keys.sort()
-            return srt_keys
+            #loop over database in batches and store the sort field, and the
+            #handle
+            while True:
+                rows = list(islice(cursor, self.SORT_BATCH))
+                if not rows:
+                    break
+                values = self.sort_values([data for key, data in rows])
+                srt_keys.extend((sort_key(value), key)
+                                for value, (key, data) in zip(values, rows))
+        srt_keys.sort()
+        return srt_keys
 
     def _rebuild_search(self, ignore=None):
         """ function called when view must be build, given a search text
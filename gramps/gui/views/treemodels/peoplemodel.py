@@ -171,6 +171,15 @@ class PeopleBaseModel(BaseModel):
             self.set_cached_value(handle, "SORT_NAME", name)
         return name
 
+    def sort_values(self, data_list):
+        """
+        Format the sort names of many rows at once.
+        """
+        if self.smap[self.sort_model_col] == self.sort_name:
+            return name_displayer.raw_sorted_names(
+                [data[COLUMN_NAME] for data in data_list])
+        return super().sort_values(data_list)
+
     def column_name(self, data):
         handle = data[0]
         cached, name = self.get_cached_value(handle, "NAME")
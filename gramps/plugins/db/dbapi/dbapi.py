@@ -35,6 +35,7 @@ import logging
 #
 #------------------------------------------------------------------------
 from gramps.gen.db.dbconst import (DBLOGNAME, DBBACKEND, KEY_TO_NAME_MAP,
+                                   CLASS_TO_KEY_MAP,
                                    KEY_TO_CLASS_MAP, TXNADD, TXNUPD, TXNDEL,
                                    PERSON_KEY, FAMILY_KEY, SOURCE_KEY,
                                    EVENT_KEY, MEDIA_KEY, PLACE_KEY, NOTE_KEY,
@@ -49,10 +50,44 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 LOG = logging.getLogger(".dbapi")
 _LOG = logging.getLogger(DBLOGNAME)
 
+#-------------------------------------------------------------------------
+#
+# SQL statements
+#
+#-------------------------------------------------------------------------
+def _make_statements(table):
+    """
+    Return the statements used on a primary object table, built once so
+    that the backend can reuse their compiled form.
+    """
+    return {
+        'count': "SELECT count(1) FROM %s" % table,
+        'handles': "SELECT handle FROM %s" % table,
+        'gramps_ids': "SELECT gramps_id FROM %s" % table,
+        'iter_raw': "SELECT handle, blob_data FROM %s" % table,
+        'has_handle': "SELECT 1 FROM %s WHERE handle = ?" % table,
+        'has_gramps_id': "SELECT 1 FROM %s WHERE gramps_id = ?" % table,
+        'get_raw': "SELECT blob_data FROM %s WHERE handle = ?" % table,
+        'get_raw_from_id': ("SELECT blob_data FROM %s WHERE gramps_id = ?"
+                            % table),
+        'insert': "INSERT INTO %s (handle, blob_data) VALUES (?, ?)" % table,
+        'update': "UPDATE %s SET blob_data = ? WHERE handle = ?" % table,
+        'delete': "DELETE FROM %s WHERE handle = ?" % table,
+    }
+
+STATEMENTS = {obj_key: _make_statements(table)
+              for obj_key, table in KEY_TO_NAME_MAP.items()}
+
+# UPDATE statements of the secondary columns, by class name
+_SECONDARY_STATEMENTS = {}
+
 class DBAPI(DbGeneric):
     """
     Database backends class for DB-API 2.0 databases
     """
+    _name_groups = None
+    _soundex_index = True
+
     def _initialize(self, directory, username, password):
         raise NotImplementedError
 
@@ -150,6 +185,7 @@ class DBAPI(DbGeneric):
                            'male INTEGER, '
                            'unknown INTEGER'
                            ')')
+        self._create_soundex_table()
 
         self._create_secondary_columns()
 
@@ -195,7 +231,47 @@ class DBAPI(DbGeneric):
 
         self.dbapi.commit()
 
+    def _create_soundex_table(self):
+        """
+        Create the table of the soundex codes of the names of the people.
+        Does not commit.
+        """
+        self.dbapi.execute('CREATE TABLE person_soundex '
+                           '('
+                           'handle VARCHAR(50), '
+                           'code VARCHAR(4)'
+                           ')')
+        self.dbapi.execute('CREATE INDEX person_soundex_code '
+                           'ON person_soundex(code)')
+        self.dbapi.execute('CREATE INDEX person_soundex_handle '
+                           'ON person_soundex(handle)')
+
+    def _update_schema(self):
+        """
+        Add the soundex table and the index of the gender statistics to
+        databases created without them. A read-only database without the
+        soundex table falls back on scanning the people.
+        """
+        self._soundex_index = self.dbapi.table_exists("person_soundex")
+        if self.readonly:
+            return
+        if not self._soundex_index:
+            LOG.info("Creating the soundex table")
+            self.dbapi.begin()
+            self._create_soundex_table()
+            for person in self.iter_people():
+                self._update_person_soundex(person)
+            self.dbapi.commit()
+            self._soundex_index = True
+        if not self._get_metadata('gender_stats_index', False):
+            self._txn_begin()
+            self.dbapi.execute('CREATE INDEX gender_stats_given_name '
+                               'ON gender_stats(given_name)')
+            self._txn_commit()
+            self._set_metadata('gender_stats_index', True)
+
     def _close(self):
+        self._name_groups = None
         self.dbapi.close()
 
     def _txn_begin(self):
@@ -232,44 +308,47 @@ class DBAPI(DbGeneric):
                    "Batch " if transaction.batch else "",
                    hex(id(self)), transaction.get_description())
         self.transaction = transaction
+        # references of the objects committed in a batch transaction, which
+        # are written at the end of the transaction
+        self._batch_references = {}
         self.dbapi.begin()
         return transaction
 
     def transaction_commit(self, txn):
         """
         Executed at the end of a transaction.
+
+        For a batch transaction, the references of the objects committed
+        during the transaction are written now. The whole reference map is
+        only rebuilt if the transaction was created with reindex=True.
         """
         _LOG.debug("    %sDBAPI %s transaction commit for '%s'",
                    "Batch " if txn.batch else "",
                    hex(id(self)), txn.get_description())
 
-        action = {TXNADD: "-add",
-                  TXNUPD: "-update",
-                  TXNDEL: "-delete",
-                  None: "-delete"}
         if txn.batch:
-            # FIXME: need a User GUI update callback here:
-            self.reindex_reference_map(lambda percent: percent)
+            start = time.perf_counter()
+            if getattr(txn, 'reindex', False):
+                # FIXME: need a User GUI update callback here:
+                self.reindex_reference_map(lambda percent: percent)
+                _LOG.debug("    DBAPI %s reference map rebuilt in %.3fs",
+                           hex(id(self)), time.perf_counter() - start)
+            else:
+                self._write_batch_references()
+                _LOG.debug("    DBAPI %s references of %d objects updated "
+                           "in %.3fs", hex(id(self)),
+                           len(self._batch_references),
+                           time.perf_counter() - start)
+            self._batch_references = {}
+        gstats = self._gender_stats
+        if gstats is not None and gstats.changed != set():
+            # changed is None when all the names changed
+            self.save_gender_stats(gstats)
         self.dbapi.commit()
         if not txn.batch:
-            # Now, emit signals:
-            # do deletes and adds first
-            for trans_type in [TXNDEL, TXNADD, TXNUPD]:
-                for obj_type in range(11):
-                    if obj_type != REFERENCE_KEY and \
-                            (obj_type, trans_type) in txn:
-                        if trans_type == TXNDEL:
-                            handles = [handle for (handle, data) in
-                                       txn[(obj_type, trans_type)]]
-                        else:
-                            handles = [handle for (handle, data) in
-                                       txn[(obj_type, trans_type)]
-                                       if (handle, None)
-                                       not in txn[(obj_type, TXNDEL)]]
-                        if handles:
-                            signal = KEY_TO_NAME_MAP[
-                                obj_type] + action[trans_type]
-                            self.emit(signal, (handles, ))
+            # Now, emit signals, possibly merged with those of the next
+            # transactions
+            self._queue_signals(txn)
         self.transaction = None
         msg = txn.get_description()
         self.undodb.commit(txn, msg)
@@ -283,6 +362,7 @@ class DBAPI(DbGeneric):
         """
         self.dbapi.rollback()
         self.transaction = None
+        self._batch_references = {}
         txn.clear()
         txn.first = None
         txn.last = None
@@ -336,16 +416,26 @@ class DBAPI(DbGeneric):
         # not None test below fixes db corrupted by 11011 for export
         return [row[0] for row in rows if row[1] is not None]
 
+    def __get_name_groups(self):
+        """
+        Return a dictionary of the name_group table, read on first use.
+
+        The name group mapping is asked for every row of the person tree
+        view, so the whole table is kept in memory.
+        """
+        if self._name_groups is None:
+            self.dbapi.execute("SELECT name, grouping FROM name_group")
+            self._name_groups = dict(self.dbapi.fetchall())
+        return self._name_groups
+
     def get_name_group_mapping(self, key):
         """
         Return the default grouping name for a surname.
         """
-        self.dbapi.execute(
-            "SELECT grouping FROM name_group WHERE name = ?", [key])
-        row = self.dbapi.fetchone()
-        if row and row[0] is not None:
+        grouping = self.__get_name_groups().get(key)
+        if grouping is not None:
             # not None test fixes db corrupted by 11011
-            return row[0]
+            return grouping
         else:
             return key
 
@@ -556,9 +646,7 @@ class DBAPI(DbGeneric):
         return None
 
     def _get_number_of(self, obj_key):
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT count(1) FROM %s" % table
-        self.dbapi.execute(sql)
+        self.dbapi.execute(STATEMENTS[obj_key]['count'])
         row = self.dbapi.fetchone()
         return row[0]
 
@@ -566,29 +654,28 @@ class DBAPI(DbGeneric):
         """
         Return if a key exists in the name_group table.
         """
-        self.dbapi.execute("SELECT grouping FROM name_group WHERE name = ?",
-                           [key])
-        row = self.dbapi.fetchone()
-        return row and row[0] is not None
+        return self.__get_name_groups().get(key) is not None
 
     def set_name_group_mapping(self, name, grouping):
         """
         Set the default grouping name for a surname.
         """
+        groups = self.__get_name_groups()
         self._txn_begin()
-        self.dbapi.execute("SELECT 1 FROM name_group WHERE name = ?",
-                           [name])
-        row = self.dbapi.fetchone()
-        if row and grouping is not None:
+        exists = name in groups
+        if exists and grouping is not None:
             self.dbapi.execute("UPDATE name_group SET grouping=? "
                                "WHERE name = ?", [grouping, name])
-        elif row and grouping is None:
+            groups[name] = grouping
+        elif exists and grouping is None:
             self.dbapi.execute("DELETE FROM name_group WHERE name = ?", [name])
+            del groups[name]
             grouping = ''
         else:
             self.dbapi.execute(
                 "INSERT INTO name_group (name, grouping) VALUES (?, ?)",
                 [name, grouping])
+            groups[name] = grouping
         self._txn_commit()
         self.emit('person-groupname-rebuild', (name, grouping))
 
@@ -597,25 +684,27 @@ class DBAPI(DbGeneric):
         Commit the specified object to the database, storing the changes as
         part of the transaction.
         """
-        old_data = None
         obj.change = int(change_time or time.time())
-        table = KEY_TO_NAME_MAP[obj_key]
+        statements = STATEMENTS[obj_key]
 
-        if self._has_handle(obj_key, obj.handle):
-            old_data = self._get_raw_data(obj_key, obj.handle)
+        old_data = self._get_raw_data(obj_key, obj.handle)
+        if old_data is not None:
             # update the object:
-            sql = "UPDATE %s SET blob_data = ? WHERE handle = ?" % table
-            self.dbapi.execute(sql,
+            self.dbapi.execute(statements['update'],
                                [pickle.dumps(obj.serialize()),
                                 obj.handle])
         else:
             # Insert the object:
-            sql = ("INSERT INTO %s (handle, blob_data) VALUES (?, ?)") % table
-            self.dbapi.execute(sql,
+            self.dbapi.execute(statements['insert'],
                                [obj.handle,
                                 pickle.dumps(obj.serialize())])
         self._update_secondary_values(obj)
-        if not trans.batch:
+        self._add_change(obj_key, obj.handle)
+        if trans.batch:
+            self._batch_references[obj.handle] = (
+                obj.__class__.__name__,
+                set(obj.get_referenced_handles_recursively()))
+        else:
             self._update_backlinks(obj, trans)
             if old_data:
                 trans.add(obj_key, TXNUPD, obj.handle,
@@ -674,16 +763,36 @@ class DBAPI(DbGeneric):
     def _do_remove(self, handle, transaction, obj_key):
         if self.readonly or not handle:
             return
-        if self._has_handle(obj_key, handle):
-            data = self._get_raw_data(obj_key, handle)
+        data = self._get_raw_data(obj_key, handle)
+        if data is not None:
             obj_class = KEY_TO_CLASS_MAP[obj_key]
             self._remove_backlinks(obj_class, handle, transaction)
-            table = KEY_TO_NAME_MAP[obj_key]
-            sql = "DELETE FROM %s WHERE handle = ?" % table
-            self.dbapi.execute(sql, [handle])
-            if not transaction.batch:
+            self.dbapi.execute(STATEMENTS[obj_key]['delete'], [handle])
+            if obj_key == PERSON_KEY and self._soundex_index:
+                self.dbapi.execute("DELETE FROM person_soundex "
+                                   "WHERE handle = ?", [handle])
+            self._add_change(obj_key, handle)
+            if transaction.batch:
+                self._batch_references.pop(handle, None)
+            else:
                 transaction.add(obj_key, TXNDEL, handle, data, None)
 
+    def _write_batch_references(self):
+        """
+        Replace the references of the objects committed during a batch
+        transaction.
+        """
+        for obj_handle, (obj_class, references) in \
+                self._batch_references.items():
+            self.dbapi.execute("DELETE FROM reference WHERE obj_handle = ?",
+                               [obj_handle])
+            for (ref_class_name, ref_handle) in references:
+                self.dbapi.execute(
+                    "INSERT INTO reference "
+                    "(obj_handle, obj_class, ref_handle, ref_class) "
+                    "VALUES (?, ?, ?, ?)",
+                    [obj_handle, obj_class, ref_handle, ref_class_name])
+
     def _remove_backlinks(self, obj_class, obj_handle, transaction):
         """
         Removes all references from this object (backlinks).
@@ -728,6 +837,33 @@ class DBAPI(DbGeneric):
             if (include_classes is None) or (row[0] in include_classes):
                 yield (row[0], row[1])
 
+    def iter_references(self):
+        """
+        Return an iterator over all the references stored in the database,
+        as (obj_class, obj_handle, ref_class, ref_handle) tuples.
+        """
+        sql = ("SELECT obj_class, obj_handle, ref_class, ref_handle "
+               "FROM reference")
+        with self.dbapi.cursor() as cursor:
+            cursor.execute(sql)
+            rows = cursor.fetchmany()
+            while rows:
+                for row in rows:
+                    yield tuple(row)
+                rows = cursor.fetchmany()
+
+    def find_person_handles_by_soundex(self, code):
+        """
+        Return a list of the handles of the people having a first name,
+        surname, call name, nickname or family nickname, in their primary
+        or alternate names, with the given soundex code.
+        """
+        if not self._soundex_index:
+            raise NotImplementedError
+        self.dbapi.execute("SELECT DISTINCT handle FROM person_soundex "
+                           "WHERE code = ?", [code])
+        return [row[0] for row in self.dbapi.fetchall()]
+
     def find_initial_person(self):
         """
         Returns first person in the database
@@ -746,10 +882,11 @@ class DBAPI(DbGeneric):
     def _iter_handles(self, obj_key):
         """
         Return an iterator over handles in the database
+
+        The handles are read at once, so that the objects added or removed
+        while iterating do not change the iteration.
         """
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT handle FROM %s" % table
-        self.dbapi.execute(sql)
+        self.dbapi.execute(STATEMENTS[obj_key]['handles'])
         rows = self.dbapi.fetchall()
         for row in rows:
             yield row[0]
@@ -758,10 +895,8 @@ class DBAPI(DbGeneric):
         """
         Return an iterator over raw data in the database.
         """
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT handle, blob_data FROM %s" % table
         with self.dbapi.cursor() as cursor:
-            cursor.execute(sql)
+            cursor.execute(STATEMENTS[obj_key]['iter_raw'])
             rows = cursor.fetchmany()
             while rows:
                 for row in rows:
@@ -832,9 +967,10 @@ class DBAPI(DbGeneric):
         index = 1
         for obj_type in ('Person', 'Family', 'Event', 'Place', 'Repository',
                          'Source', 'Citation', 'Media', 'Note', 'Tag'):
-            for handle in self.method('get_%s_handles', obj_type)():
-                obj = self.method('get_%s_from_handle', obj_type)(handle)
-                self._update_secondary_values(obj)
+            class_func = self._get_table_func(obj_type)["class_func"]
+            obj_key = CLASS_TO_KEY_MAP[obj_type]
+            for dummy, data in self._iter_raw_data(obj_key):
+                self._update_secondary_values(class_func.create(data))
             if callback:
                 callback(index)
             index += 1
@@ -842,43 +978,45 @@ class DBAPI(DbGeneric):
         if callback:
             callback(11)
 
-        # Next, rebuild stats:
-        gstats = self.get_gender_stats()
-        self.genderStats = GenderStats(gstats)
+        # Next, rebuild stats from the secondary fields:
+        gstats = GenderStats()
+        with self.dbapi.cursor() as cursor:
+            cursor.execute("SELECT given_name, gender, count(1) "
+                           "FROM person GROUP BY given_name, gender")
+            rows = cursor.fetchmany()
+            while rows:
+                for given_name, gender, count in rows:
+                    gstats.count_name(given_name, gender, count)
+                rows = cursor.fetchmany()
+        gstats.changed = None   # replace all the saved counts
+        self.save_gender_stats(gstats)
+        self.genderStats = gstats
+        self.surname_list = None
         if callback:
             callback(12)
 
     def _has_handle(self, obj_key, handle):
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT 1 FROM %s WHERE handle = ?" % table
-        self.dbapi.execute(sql, [handle])
+        self.dbapi.execute(STATEMENTS[obj_key]['has_handle'], [handle])
         return self.dbapi.fetchone() is not None
 
     def _has_gramps_id(self, obj_key, gramps_id):
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT 1 FROM %s WHERE gramps_id = ?" % table
-        self.dbapi.execute(sql, [gramps_id])
+        self.dbapi.execute(STATEMENTS[obj_key]['has_gramps_id'], [gramps_id])
         return self.dbapi.fetchone() != None
 
     def _get_gramps_ids(self, obj_key):
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT gramps_id FROM %s" % table
-        self.dbapi.execute(sql)
+        self.dbapi.execute(STATEMENTS[obj_key]['gramps_ids'])
         rows = self.dbapi.fetchall()
         return [row[0] for row in rows]
 
     def _get_raw_data(self, obj_key, handle):
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT blob_data FROM %s WHERE handle = ?" % table
-        self.dbapi.execute(sql, [handle])
+        self.dbapi.execute(STATEMENTS[obj_key]['get_raw'], [handle])
         row = self.dbapi.fetchone()
         if row:
             return pickle.loads(row[0])
 
     def _get_raw_from_id_data(self, obj_key, gramps_id):
-        table = KEY_TO_NAME_MAP[obj_key]
-        sql = "SELECT blob_data FROM %s WHERE gramps_id = ?" % table
-        self.dbapi.execute(sql, [gramps_id])
+        self.dbapi.execute(STATEMENTS[obj_key]['get_raw_from_id'],
+                           [gramps_id])
         row = self.dbapi.fetchone()
         if row:
             return pickle.loads(row[0])
@@ -896,16 +1034,38 @@ class DBAPI(DbGeneric):
         return gstats
 
     def save_gender_stats(self, gstats):
+        """
+        Save the counts of the names changed since the last save, or all the
+        counts after the statistics were cleared.
+        """
         self._txn_begin()
-        self.dbapi.execute("DELETE FROM gender_stats")
-        for key in gstats.stats:
-            female, male, unknown = gstats.stats[key]
-            self.dbapi.execute("INSERT INTO gender_stats "
-                               "(given_name, female, male, unknown) "
-                               "VALUES (?, ?, ?, ?)",
-                               [key, female, male, unknown])
+        self._write_gender_stats(gstats)
         self._txn_commit()
 
+    def _write_gender_stats(self, gstats):
+        """
+        Write the changed counts of save_gender_stats, in the current
+        backend transaction.
+        """
+        if gstats.changed is None:
+            self.dbapi.execute("DELETE FROM gender_stats")
+            keys = gstats.stats
+        else:
+            keys = gstats.changed
+        for key in keys:
+            if gstats.changed is not None:
+                self.dbapi.execute("DELETE FROM gender_stats "
+                                   "WHERE given_name = ?", [key])
+            # The columns are swapped since the table was created, but
+            # get_gender_stats reads them back in the same order.
+            female, male, unknown = gstats.name_stats(key)
+            if female or male or unknown:
+                self.dbapi.execute("INSERT INTO gender_stats "
+                                   "(given_name, female, male, unknown) "
+                                   "VALUES (?, ?, ?, ?)",
+                                   [key, female, male, unknown])
+        gstats.changed = set()
+
     def undo_reference(self, data, handle):
         """
         Helper method to undo a reference map entry
@@ -925,31 +1085,66 @@ class DBAPI(DbGeneric):
         Helper method to undo/redo the changes made
         """
         cls = KEY_TO_CLASS_MAP[obj_key]
-        table = cls.lower()
+        statements = STATEMENTS[obj_key]
+        self._add_change(obj_key, handle)
+        old_data = None
+        if obj_key == PERSON_KEY:
+            old_data = self._get_raw_data(obj_key, handle)
         if data is None:
-            sql = "DELETE FROM %s WHERE handle = ?" % table
-            self.dbapi.execute(sql, [handle])
+            self.dbapi.execute(statements['delete'], [handle])
+            if obj_key == PERSON_KEY and self._soundex_index:
+                self.dbapi.execute("DELETE FROM person_soundex "
+                                   "WHERE handle = ?", [handle])
         else:
             if self._has_handle(obj_key, handle):
-                sql = "UPDATE %s SET blob_data = ? WHERE handle = ?" % table
-                self.dbapi.execute(sql, [pickle.dumps(data), handle])
+                self.dbapi.execute(statements['update'],
+                                   [pickle.dumps(data), handle])
             else:
-                sql = "INSERT INTO %s (handle, blob_data) VALUES (?, ?)" % table
-                self.dbapi.execute(sql, [handle, pickle.dumps(data)])
+                self.dbapi.execute(statements['insert'],
+                                   [handle, pickle.dumps(data)])
             obj = self._get_table_func(cls)["class_func"].create(data)
             self._update_secondary_values(obj)
+        if obj_key == PERSON_KEY:
+            self.__undo_person(old_data, data)
 
-    def get_surname_list(self):
+    def __undo_person(self, old_data, data):
+        """
+        Update the gender statistics and the surname list after a change to
+        a person was undone or redone.
         """
-        Return the list of locale-sorted surnames contained in the database.
+        gstats = self.genderStats
+        if old_data is not None:
+            old_person = Person.create(old_data)
+            gstats.uncount_person(old_person)
+            self.remove_from_surname_list(old_person)
+        if data is not None:
+            person = Person.create(data)
+            gstats.count_person(person)
+            self.add_to_surname_list(person, False)
+        if gstats.changed != set():
+            self._write_gender_stats(gstats)
+
+    def _get_surname_list(self):
+        """
+        Return the sorted list of the surnames of the people.
         """
         self.dbapi.execute("SELECT DISTINCT surname "
                            "FROM person "
                            "ORDER BY surname")
-        surname_list = []
-        for row in self.dbapi.fetchall():
-            surname_list.append(row[0])
-        return surname_list
+        return [row[0] for row in self.dbapi.fetchall()]
+
+    def remove_from_surname_list(self, person):
+        """
+        Remove the surname of a person from the surname list, if no other
+        person has it.
+        """
+        if self.surname_list is None:
+            return
+        surname = self._get_person_data(person)[1]
+        self.dbapi.execute("SELECT 1 FROM person WHERE surname = ? LIMIT 1",
+                           [surname])
+        if self.dbapi.fetchone() is None:
+            super().remove_from_surname_list(person)
 
     def _sql_type(self, schema_type, max_length):
         """
@@ -989,32 +1184,45 @@ class DBAPI(DbGeneric):
         Does not commit.
         """
         table = obj.__class__.__name__
-        fields = [field[0] for field in obj.get_secondary_fields()]
-        sets = []
-        values = []
-        for field in fields:
-            sets.append("%s = ?" % field)
-            values.append(getattr(obj, field))
-
-        # Derived fields
+        statement = _SECONDARY_STATEMENTS.get(table)
+        if statement is None:
+            fields = [field[0] for field in obj.get_secondary_fields()]
+            sets = ["%s = ?" % field for field in fields]
+            # Derived fields
+            if table == 'Person':
+                sets += ["given_name = ?", "surname = ?"]
+            if table == 'Place':
+                sets.append("enclosed_by = ?")
+            sql = None
+            if sets:
+                sql = ("UPDATE %s SET %s where handle = ?"
+                       % (table.lower(), ", ".join(sets)))
+            statement = _SECONDARY_STATEMENTS[table] = (fields, sql)
+        fields, sql = statement
+
+        values = [getattr(obj, field) for field in fields]
         if table == 'Person':
-            given_name, surname = self._get_person_data(obj)
-            sets.append("given_name = ?")
-            values.append(given_name)
-            sets.append("surname = ?")
-            values.append(surname)
+            values.extend(self._get_person_data(obj))
+            if self._soundex_index:
+                self._update_person_soundex(obj)
         if table == 'Place':
-            handle = self._get_place_data(obj)
-            sets.append("enclosed_by = ?")
-            values.append(handle)
-
-        if len(values) > 0:
-            table_name = table.lower()
-            self.dbapi.execute("UPDATE %s SET %s where handle = ?"
-                               % (table_name, ", ".join(sets)),
-                               self._sql_cast_list(values)
+            values.append(self._get_place_data(obj))
+
+        if sql:
+            self.dbapi.execute(sql, self._sql_cast_list(values)
                                + [obj.handle])
 
+    def _update_person_soundex(self, person):
+        """
+        Replace the soundex codes of the names of a person.
+        Does not commit.
+        """
+        self.dbapi.execute("DELETE FROM person_soundex WHERE handle = ?",
+                           [person.handle])
+        for code in self._get_person_soundex(person):
+            self.dbapi.execute("INSERT INTO person_soundex (handle, code) "
+                               "VALUES (?, ?)", [person.handle, code])
+
     def _sql_cast_list(self, values):
         """
         Given a list of field names and values, return the values
@@ -32,6 +32,10 @@ import sqlite3
 import os
 import re
 import logging
+import threading
+from urllib.parse import quote
+from contextlib import contextmanager
+from time import perf_counter
 
 #-------------------------------------------------------------------------
 #
@@ -40,11 +44,37 @@ import logging
 #-------------------------------------------------------------------------
 from gramps.plugins.db.dbapi.dbapi import DBAPI
 from gramps.gen.db.dbconst import ARRAYSIZE
+from gramps.gen.config import config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 
 sqlite3.paramstyle = 'qmark'
 
+# number of compiled statements kept by each connection, enough for all the
+# statements of the DBAPI class
+CACHED_STATEMENTS = 256
+
+#-------------------------------------------------------------------------
+#
+# Connection profiles
+#
+#-------------------------------------------------------------------------
+# The pragmas set on each connection, selected with the
+# database.sqlite-profile preference. A negative cache_size is in KiB, a
+# mmap_size is in bytes. The journal mode is only set on the connections
+# which can write, as it is stored in the database file.
+PROFILES = {
+    # the sqlite defaults, with a rollback journal
+    'compatible': {'journal_mode': 'DELETE', 'synchronous': 'FULL',
+                   'cache_size': -2000, 'mmap_size': 0},
+    # WAL, which is durable with synchronous NORMAL except on power loss
+    'default': {'journal_mode': 'WAL', 'synchronous': 'NORMAL',
+                'cache_size': -16000, 'mmap_size': 0},
+    # for large trees, on a local disk
+    'large': {'journal_mode': 'WAL', 'synchronous': 'NORMAL',
+              'cache_size': -64000, 'mmap_size': 256 * 1024 * 1024},
+}
+
 #-------------------------------------------------------------------------
 #
 # SQLite class
@@ -69,7 +99,27 @@ class SQLite(DBAPI):
             path_to_db = ':memory:'
         else:
             path_to_db = os.path.join(directory, 'sqlite.db')
-        self.dbapi = Connection(path_to_db)
+        # a read-only tree is opened read-only, so that the journal mode of
+        # the profile is not written to it
+        self.dbapi = Connection(path_to_db,
+                                profile=config.get('database.sqlite-profile'),
+                                readonly=self.readonly)
+
+    def reader(self):
+        """
+        Return a context manager giving a read-only
+        :class:`Connection` to the database, for use by a worker thread.
+
+        The connection sees the data committed when it starts a query. With
+        the WAL profiles, it does not wait for the transactions of the main
+        connection. With the 'compatible' profile, which uses a rollback
+        journal, readers and commits of the main connection wait for each
+        other, and raise :class:`sqlite3.OperationalError` "database is
+        locked" when the wait is longer than the connection timeout. Worker
+        processes should open their own ``Connection(path, readonly=True)``
+        with the path of :attr:`Connection.path`.
+        """
+        return self.dbapi.reader()
 
 
 #-------------------------------------------------------------------------
@@ -83,25 +133,96 @@ class Connection:
     backend for the DBAPI interface and the sqlite3 python module.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, path, profile='default', readonly=False, **kwargs):
         """
         Create a new Sqlite instance.
 
         This connects to a sqlite3 database and creates a cursor instance.
 
-        :param args: arguments to be passed to the sqlite3 connect class at
-                     creation.
-        :type args: list
+        :param path: path of the database file, or ':memory:'.
+        :type path: str
+        :param profile: name of one of the :data:`PROFILES`, or a dictionary
+                        of pragmas.
+        :type profile: str or dict
+        :param readonly: if True, open the database file read-only.
+        :type readonly: bool
         :param kwargs: arguments to be passed to the sqlite3 connect class at
                        creation.
         :type kwargs: list
         """
         self.log = logging.getLogger(".sqlite")
-        self.__connection = sqlite3.connect(*args, **kwargs)
+        self.path = path
+        if isinstance(profile, dict):
+            self.profile = profile
+        else:
+            self.profile = PROFILES.get(profile, PROFILES['default'])
+        self.readonly = readonly
+        kwargs.setdefault('cached_statements', CACHED_STATEMENTS)
+        if readonly and path != ':memory:':
+            self.__connection = sqlite3.connect(
+                'file:%s?mode=ro' % quote(path), uri=True, **kwargs)
+        else:
+            self.__connection = sqlite3.connect(path, **kwargs)
+        # the log level is set before the database is opened
+        self.__debug = self.log.isEnabledFor(logging.DEBUG)
+        self.__statistics = None
+        self.__set_pragmas()
         self.__cursor = self.__connection.cursor()
         self.__connection.create_function("regexp", 2, regexp)
         self.__collations = []
         self.check_collation(glocale)
+        self.__readers = []
+        self.__lock = threading.Lock()
+
+    def __set_pragmas(self):
+        """
+        Set the pragmas of the profile on the connection.
+        """
+        for pragma in ('journal_mode', 'synchronous', 'cache_size',
+                       'mmap_size'):
+            if pragma not in self.profile:
+                continue
+            if pragma == 'journal_mode' and self.readonly:
+                continue
+            try:
+                self.__connection.execute('PRAGMA %s = %s;' %
+                                          (pragma, self.profile[pragma]))
+            except sqlite3.DatabaseError as msg:
+                self.log.warning("Cannot set %s: %s", pragma, msg)
+
+    def pragma(self, name):
+        """
+        Return the current value of a pragma of the connection.
+
+        :param name: name of the pragma.
+        :type name: str
+        """
+        return self.__connection.execute('PRAGMA %s;' % name).fetchone()[0]
+
+    @contextmanager
+    def reader(self):
+        """
+        Context manager giving a read-only connection to the same database,
+        taken from a pool of idle connections or created if the pool is
+        empty, and returned to the pool on exit.
+
+        A connection is only used by one thread at a time, but may be used
+        by different threads over its lifetime.
+        """
+        if self.path == ':memory:':
+            raise NotImplementedError
+        with self.__lock:
+            connection = self.__readers.pop() if self.__readers else None
+        if connection is None:
+            connection = Connection(self.path, self.profile, readonly=True,
+                                    check_same_thread=False)
+        connection.__statistics = self.__statistics
+        try:
+            yield connection
+        finally:
+            connection.rollback()
+            with self.__lock:
+                self.__readers.append(connection)
 
     def check_collation(self, locale):
         """
@@ -123,8 +244,37 @@ class Connection:
         :param kwargs: arguments to be passed to the sqlite3 execute statement
         :type kwargs: list
         """
-        self.log.debug(args)
-        self.__cursor.execute(*args, **kwargs)
+        if self.__debug:
+            self.log.debug(args)
+        if self.__statistics is None:
+            self.__cursor.execute(*args, **kwargs)
+        else:
+            execute_timed(self.__cursor, self.__statistics, args, kwargs)
+
+    def enable_statistics(self, enable=True):
+        """
+        Start or stop counting the calls of each statement and the time
+        spent executing them. Starting clears the previous counts.
+
+        :param enable: True to start counting, False to stop.
+        :type enable: bool
+        """
+        self.__statistics = {} if enable else None
+
+    def get_statistics(self):
+        """
+        Return a list of (statement, number of calls, cumulative seconds)
+        tuples, most expensive first, or None if the statistics are not
+        enabled.
+
+        The read-only connections given by :meth:`reader` while counting
+        add their statements to the same statistics.
+        """
+        if self.__statistics is None:
+            return None
+        return sorted(((sql, calls, seconds) for sql, (calls, seconds)
+                       in self.__statistics.items()),
+                      key=lambda item: item[2], reverse=True)
 
     def fetchone(self):
         """
@@ -140,6 +290,13 @@ class Connection:
         """
         return self.__cursor.fetchall()
 
+    def fetchmany(self):
+        """
+        Fetches the next ARRAYSIZE rows of a query result, returning a list.
+        An empty list is returned when no more rows are available.
+        """
+        return self.__cursor.fetchmany(ARRAYSIZE)
+
     def begin(self):
         """
         Start a transaction manually. This transactions usually persist until
@@ -181,13 +338,17 @@ class Connection:
         Close the current database.
         """
         self.log.debug("closing database...")
+        with self.__lock:
+            for connection in self.__readers:
+                connection.close()
+            self.__readers = []
         self.__connection.close()
 
     def cursor(self):
         """
         Return a new cursor.
         """
-        return Cursor(self.__connection)
+        return Cursor(self.__connection, self.__statistics)
 
 
 #-------------------------------------------------------------------------
@@ -196,8 +357,9 @@ class Connection:
 #
 #-------------------------------------------------------------------------
 class Cursor:
-    def __init__(self, connection):
+    def __init__(self, connection, statistics=None):
         self.__connection = connection
+        self.__statistics = statistics
 
     def __enter__(self):
         self.__cursor = self.__connection.cursor()
@@ -216,7 +378,10 @@ class Cursor:
         :param kwargs: arguments to be passed to the sqlite3 execute statement
         :type kwargs: list
         """
-        self.__cursor.execute(*args, **kwargs)
+        if self.__statistics is None:
+            self.__cursor.execute(*args, **kwargs)
+        else:
+            execute_timed(self.__cursor, self.__statistics, args, kwargs)
 
     def fetchmany(self):
         """
@@ -226,6 +391,20 @@ class Cursor:
         return self.__cursor.fetchmany()
 
 
+def execute_timed(cursor, statistics, args, kwargs):
+    """
+    Execute a statement on a sqlite3 cursor, adding the call and its
+    duration to the statistics of the statement.
+    """
+    start = perf_counter()
+    try:
+        cursor.execute(*args, **kwargs)
+    finally:
+        counts = statistics.setdefault(args[0], [0, 0.0])
+        counts[0] += 1
+        counts[1] += perf_counter() - start
+
+
 def regexp(expr, value):
     """
     A user defined function that can be called from within an SQL statement.
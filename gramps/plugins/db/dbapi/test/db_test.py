@@ -23,6 +23,9 @@
 # Standard python modules
 #
 #-------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
 import unittest
 
 #-------------------------------------------------------------------------
@@ -30,8 +33,10 @@ import unittest
 # Gramps modules
 #
 #-------------------------------------------------------------------------
+from gramps.gen.config import config
 from gramps.gen.db import DbTxn
-from gramps.gen.db.utils import make_database
+from gramps.gen.db.dbconst import DBMODE_R
+from gramps.gen.db.utils import make_database, read_summary
 from gramps.gen.lib import (Person, Family, Event, Place, Repository, Source,
                             Citation, Media, Note, Tag, Researcher, Surname)
 
@@ -786,6 +791,12 @@ class DbEmptyTest(unittest.TestCase):
         mapping = self.db.get_name_group_mapping('Clark')
         self.assertEqual(mapping, 'Clarke')
 
+        self.db.set_name_group_mapping('Clark', 'Clerk')
+        self.assertEqual(self.db.get_name_group_mapping('Clark'), 'Clerk')
+        self.db.set_name_group_mapping('Clark', None)
+        self.assertFalse(self.db.has_name_group_key('Clark'))
+        self.assertEqual(self.db.get_name_group_mapping('Clark'), 'Clark')
+
     ################################################################
     #
     # Test get_total method
@@ -850,6 +861,24 @@ class DbPersonTest(unittest.TestCase):
         for surname in surname_list:
             self.assertIn(surname, self.all_surnames)
 
+    def test_surname_list_update(self):
+        self.assertEqual(self.db.get_surname_list(),
+                         ['Allen', 'Baker', 'Clark', 'Davis', 'Evans'])
+        handles = [person.handle for person in self.db.iter_people()
+                   if person.primary_name.get_surname() == 'Allen']
+        # removed with the last person having it
+        with DbTxn('Remove person', self.db) as trans:
+            self.db.remove_person(handles[0], trans)
+        self.assertIn('Allen', self.db.get_surname_list())
+        with DbTxn('Remove person', self.db) as trans:
+            self.db.remove_person(handles[1], trans)
+        self.assertNotIn('Allen', self.db.get_surname_list())
+        # read again after a batch transaction
+        with DbTxn('Add person', self.db, batch=True) as trans:
+            self.__add_person(Person.MALE, 'Paul', 'Adams', trans)
+        self.assertEqual(self.db.get_surname_list(),
+                         ['Adams', 'Baker', 'Clark', 'Davis', 'Evans'])
+
     ################################################################
     #
     # Test gender stats
@@ -865,6 +894,375 @@ class DbPersonTest(unittest.TestCase):
         self.assertEqual(saved['John'], (3, 1, 1))
         self.assertEqual(saved['Mary'], (1, 4, 0))
 
+    def test_gender_stats_update(self):
+        # saved with each transaction
+        self.assertEqual(self.db.get_gender_stats()['John'], (3, 1, 1))
+        handle = [person.handle for person in self.db.iter_people()
+                  if person.primary_name.first_name == 'John'][0]
+        with DbTxn('Remove person', self.db) as trans:
+            self.db.remove_person(handle, trans)
+        self.assertEqual(self.db.genderStats.name_stats('John'), (2, 1, 1))
+        self.assertEqual(self.db.get_gender_stats()['John'], (2, 1, 1))
+
+    def test_rebuild_secondary(self):
+        self.db.dbapi.begin()
+        self.db.dbapi.execute("DELETE FROM gender_stats")
+        self.db.dbapi.execute("UPDATE person SET surname = ''")
+        self.db.dbapi.commit()
+        self.db.rebuild_secondary()
+        self.assertEqual(self.db.get_gender_stats()['John'], (3, 1, 1))
+        self.assertEqual(self.db.genderStats.name_stats('Mary'), (1, 4, 0))
+        self.assertEqual(self.db.get_surname_list(),
+                         ['Allen', 'Baker', 'Clark', 'Davis', 'Evans'])
+
+    ################################################################
+    #
+    # Test soundex table
+    #
+    ################################################################
+
+    def test_soundex(self):
+        allen = self.db.find_person_handles_by_soundex('A450')
+        self.assertEqual(len(allen), 2)
+        person = self.db.get_person_from_handle(allen[0])
+        person.primary_name.set_call_name('Alan')
+        person.primary_name.get_surname_list()[0].set_surname('Zielinski')
+        with DbTxn('Rename', self.db) as trans:
+            self.db.commit_person(person, trans)
+        # Allen and Alan have the same code
+        self.assertEqual(set(self.db.find_person_handles_by_soundex('A450')),
+                         set(allen))
+        self.assertEqual(self.db.find_person_handles_by_soundex('Z452'),
+                         [person.handle])
+        self.assertEqual(len(self.db.find_person_handles_by_soundex('J500')),
+                         5)
+        self.assertEqual(self.db.find_person_handles_by_soundex('Z000'), [])
+
+#-------------------------------------------------------------------------
+#
+# DbReferenceTest class
+#
+#-------------------------------------------------------------------------
+class DbReferenceTest(unittest.TestCase):
+    '''
+    Tests of the reference map after batch transactions.
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = make_database("sqlite")
+        cls.db.load(":memory:")
+
+    def __backlinks(self, handle):
+        return set(self.db.find_backlink_handles(handle))
+
+    def test_batch_references(self):
+        note = Note()
+        with DbTxn('Add note', self.db) as trans:
+            self.db.add_note(note, trans)
+        person = Person()
+        person.add_note(note.handle)
+        with DbTxn('Batch add', self.db, batch=True) as trans:
+            self.db.add_person(person, trans)
+        self.assertEqual(self.__backlinks(note.handle),
+                         {('Person', person.handle)})
+
+        # the references of objects changed in a batch are replaced
+        event = Event()
+        event.add_note(note.handle)
+        person.set_note_list([])
+        with DbTxn('Batch update', self.db, batch=True) as trans:
+            self.db.add_event(event, trans)
+            self.db.commit_person(person, trans)
+        self.assertEqual(self.__backlinks(note.handle),
+                         {('Event', event.handle)})
+
+        # objects added then removed in a batch leave no references
+        family = Family()
+        family.add_note(note.handle)
+        with DbTxn('Batch remove', self.db, batch=True) as trans:
+            self.db.add_family(family, trans)
+            self.db.remove_event(event.handle, trans)
+            self.db.remove_family(family.handle, trans)
+        self.assertEqual(self.__backlinks(note.handle), set())
+
+        # a full reindex gives the same result
+        with DbTxn('Batch reindex', self.db, batch=True,
+                   reindex=True) as trans:
+            person.add_note(note.handle)
+            self.db.commit_person(person, trans)
+        self.assertEqual(self.__backlinks(note.handle),
+                         {('Person', person.handle)})
+
+    def test_iter_references(self):
+        note = Note()
+        person = Person()
+        with DbTxn('Add objects', self.db) as trans:
+            self.db.add_note(note, trans)
+            person.add_note(note.handle)
+            self.db.add_person(person, trans)
+        references = set(self.db.iter_references())
+        self.assertIn(('Person', person.handle, 'Note', note.handle),
+                      references)
+        for obj_class, obj_handle, ref_class, ref_handle in references:
+            self.assertIn((obj_class, obj_handle),
+                          set(self.db.find_backlink_handles(ref_handle)))
+
+#-------------------------------------------------------------------------
+#
+# DbUndoTest class
+#
+#-------------------------------------------------------------------------
+class DbUndoTest(unittest.TestCase):
+    '''
+    Tests of the undo log.
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db = make_database("sqlite")
+        self.db.load(self.directory)
+
+    def tearDown(self):
+        if self.db.is_open():
+            self.db.close()
+        shutil.rmtree(self.directory)
+
+    def __add_people(self, count):
+        handles = []
+        for i in range(count):
+            person = Person()
+            with DbTxn('Add person %d' % i, self.db) as trans:
+                self.db.add_person(person, trans)
+            handles.append(person.handle)
+        return handles
+
+    def test_undo_redo(self):
+        undodb = self.db.undodb
+        self.assertTrue(os.path.isfile(undodb.path))
+        handles = self.__add_people(3)
+        self.assertTrue(self.db.undo())
+        self.assertFalse(self.db.has_person_handle(handles[2]))
+        self.assertTrue(self.db.redo())
+        self.assertTrue(self.db.has_person_handle(handles[2]))
+        log_size, memory = undodb.get_memory_usage()
+        self.assertEqual(log_size, os.path.getsize(undodb.path))
+        self.assertLess(memory, log_size)
+
+    def test_retention(self):
+        undodb = self.db.undodb
+        undodb.max_transactions = 5
+        handles = self.__add_people(20)
+        self.assertEqual(undodb.undo_count, 5)
+        # the log was compacted, and the kept transactions still work
+        self.assertLess(len(undodb), 20 * 3)
+        while self.db.undo():
+            pass
+        self.assertEqual(self.db.get_number_of_people(), 15)
+        self.assertTrue(self.db.has_person_handle(handles[14]))
+        self.assertFalse(self.db.has_person_handle(handles[15]))
+        while self.db.redo():
+            pass
+        self.assertEqual(self.db.get_number_of_people(), 20)
+
+    def test_soundex(self):
+        person = Person()
+        person.primary_name.set_first_name('Garner')
+        with DbTxn('Add person', self.db) as trans:
+            self.db.add_person(person, trans)
+        with DbTxn('Remove person', self.db) as trans:
+            self.db.remove_person(person.handle, trans)
+        self.assertEqual(self.db.find_person_handles_by_soundex('G656'), [])
+        self.assertTrue(self.db.undo())
+        self.assertEqual(self.db.find_person_handles_by_soundex('G656'),
+                         [person.handle])
+        self.assertTrue(self.db.undo())
+        self.assertEqual(self.db.find_person_handles_by_soundex('G656'), [])
+
+    def test_gender_stats(self):
+        person = Person()
+        person.gender = Person.MALE
+        person.primary_name.set_first_name('Jean')
+        surname = Surname()
+        surname.set_surname('Martin')
+        person.primary_name.set_surname_list([surname])
+        with DbTxn('Add person', self.db) as trans:
+            self.db.add_person(person, trans)
+        self.assertEqual(self.db.get_surname_list(), ['Martin'])
+        with DbTxn('Remove person', self.db) as trans:
+            self.db.remove_person(person.handle, trans)
+        self.assertEqual(self.db.genderStats.name_stats('Jean'), (0, 0, 0))
+        self.assertEqual(self.db.get_surname_list(), [])
+        # undoing the removal counts the person again
+        self.assertTrue(self.db.undo())
+        self.assertEqual(self.db.genderStats.name_stats('Jean'), (1, 0, 0))
+        self.assertEqual(self.db.get_gender_stats()['Jean'], (1, 0, 0))
+        self.assertEqual(self.db.get_surname_list(), ['Martin'])
+        self.assertTrue(self.db.undo())
+        self.assertEqual(self.db.genderStats.name_stats('Jean'), (0, 0, 0))
+        self.assertNotIn('Jean', self.db.get_gender_stats())
+        self.assertEqual(self.db.get_surname_list(), [])
+        self.assertTrue(self.db.redo())
+        self.assertEqual(self.db.get_gender_stats()['Jean'], (1, 0, 0))
+        self.assertEqual(self.db.get_surname_list(), ['Martin'])
+
+    def test_soundex_upgrade(self):
+        person = Person()
+        person.primary_name.set_first_name('Garner')
+        with DbTxn('Add person', self.db) as trans:
+            self.db.add_person(person, trans)
+        # a database created before the soundex table
+        self.db.dbapi.execute('DROP TABLE person_soundex')
+        self.db.dbapi.commit()
+        self.db.close()
+        self.db = make_database("sqlite")
+        self.db.load(self.directory)
+        self.assertEqual(self.db.find_person_handles_by_soundex('G656'),
+                         [person.handle])
+
+    def test_close(self):
+        path = self.db.undodb.path
+        self.__add_people(1)
+        self.db.close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_readonly(self):
+        """
+        A read only session leaves the undo log of another session alone.
+        """
+        path = self.db.undodb.path
+        self.__add_people(1)
+        size = os.path.getsize(path)
+        readonly = make_database("sqlite")
+        readonly.load(self.directory, mode=DBMODE_R)
+        self.assertEqual(os.path.getsize(path), size)
+        readonly.close()
+        self.assertEqual(os.path.getsize(path), size)
+        self.assertTrue(self.db.undo())
+
+#-------------------------------------------------------------------------
+#
+# DbSummaryTest class
+#
+#-------------------------------------------------------------------------
+class DbSummaryTest(unittest.TestCase):
+    '''
+    Tests of the summary saved on close.
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db = make_database("sqlite")
+        self.db.load(self.directory)
+
+    def tearDown(self):
+        if self.db.is_open():
+            self.db.close()
+        shutil.rmtree(self.directory)
+
+    def __add_person(self):
+        with DbTxn('Add person', self.db) as trans:
+            self.db.add_person(Person(), trans)
+
+    def test_summary(self):
+        self.__add_person()
+        self.db.close()
+        summary = read_summary(self.directory)
+        self.assertEqual(summary['Number of people'], 1)
+        self.db.load(self.directory)
+        self.__add_person()
+        # the database changed since the summary was saved
+        self.assertIsNone(read_summary(self.directory))
+        self.db.close()
+        self.assertEqual(read_summary(self.directory)['Number of people'], 2)
+
+    def test_summary_only(self):
+        self.__add_person()
+        self.db.close()
+        self.db.load(self.directory, mode=DBMODE_R, update=False)
+        self.assertEqual(self.db.get_summary()['Number of people'], 1)
+        self.db.close(update=False)
+        self.assertEqual(read_summary(self.directory)['Number of people'], 1)
+
+class DbSignalTest(unittest.TestCase):
+    '''
+    Tests of the merged signals of the transactions.
+    '''
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.signals = []
+        for signal in ('person-add', 'person-update', 'person-delete'):
+            self.db.connect(signal, self.__make_callback(signal))
+        self.db.connect('person-rebuild', self.__make_callback(
+            'person-rebuild'))
+        self.scheduled = []
+        self.db.set_signal_scheduler(self.scheduled.append)
+
+    def tearDown(self):
+        self.db.close()
+
+    def __make_callback(self, signal):
+        return lambda *args: self.signals.append((signal,) + args)
+
+    def test_merge(self):
+        person1 = Person()
+        person2 = Person()
+        with DbTxn('Add', self.db) as trans:
+            self.db.add_person(person1, trans)
+            self.db.add_person(person2, trans)
+        with DbTxn('Update', self.db) as trans:
+            self.db.commit_person(person1, trans)
+        with DbTxn('Remove', self.db) as trans:
+            self.db.remove_person(person2.handle, trans)
+        self.assertEqual(self.signals, [])
+        self.assertEqual(len(self.scheduled), 1)
+        self.scheduled[0]()
+        # person2 was added and removed before the signals were emitted
+        self.assertEqual(self.signals, [('person-add', [person1.handle]),
+                                        ('person-update', [person1.handle])])
+
+    def test_rebuild(self):
+        threshold = config.get('database.signal-rebuild-threshold')
+        config.set('database.signal-rebuild-threshold', 2)
+        try:
+            with DbTxn('Add', self.db) as trans:
+                for i in range(3):
+                    self.db.add_person(Person(), trans)
+            self.db.emit_pending_signals()
+            with DbTxn('Remove', self.db) as trans:
+                for handle in self.db.get_person_handles()[:3]:
+                    self.db.remove_person(handle, trans)
+            self.db.emit_pending_signals()
+        finally:
+            config.set('database.signal-rebuild-threshold', threshold)
+        # deletes are not collapsed into the rebuild
+        self.assertEqual(self.signals[0], ('person-rebuild',))
+        self.assertEqual(len(self.signals), 2)
+        self.assertEqual(self.signals[1][0], 'person-delete')
+        self.assertEqual(len(self.signals[1][1]), 3)
+
+    def test_no_scheduler(self):
+        self.db.set_signal_scheduler(None)
+        person = Person()
+        with DbTxn('Add', self.db) as trans:
+            self.db.add_person(person, trans)
+        self.assertEqual(self.signals, [('person-add', [person.handle])])
+
+    def test_readd(self):
+        person = Person()
+        with DbTxn('Add', self.db) as trans:
+            self.db.add_person(person, trans)
+        self.scheduled[0]()
+        with DbTxn('Remove', self.db) as trans:
+            self.db.remove_person(person.handle, trans)
+        with DbTxn('Add again', self.db) as trans:
+            self.db.add_person(person, trans)
+        self.db.emit_pending_signals()
+        # the listeners never saw the removal
+        self.assertEqual(self.signals, [('person-add', [person.handle]),
+                                        ('person-update', [person.handle])])
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,257 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest of the SQLite connection profiles, read-only connections and
+statement statistics
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard python modules
+#
+#-------------------------------------------------------------------------
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from time import perf_counter
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from gramps.gen.config import config
+from gramps.gen.db import DbTxn
+from gramps.gen.db.dbconst import ARRAYSIZE, DBMODE_R, PERSON_KEY
+from gramps.gen.db.utils import make_database
+from gramps.gen.lib import Person, Name, Surname
+from ..dbapi import STATEMENTS
+from ..sqlite import PROFILES
+
+def make_person(number):
+    """
+    Return a new person with a name made from number.
+    """
+    person = Person()
+    name = Name()
+    name.set_first_name('Given%d' % number)
+    surname = Surname()
+    surname.set_surname('Surname%d' % (number % 100))
+    name.add_surname(surname)
+    person.set_primary_name(name)
+    return person
+
+#-------------------------------------------------------------------------
+#
+# SQLiteTest class
+#
+#-------------------------------------------------------------------------
+class SQLiteTest(unittest.TestCase):
+    '''
+    Tests of the connections to a database file.
+    '''
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db = make_database("sqlite")
+        self.db.load(self.directory)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.directory)
+
+    def test_profile(self):
+        profile = PROFILES[config.get('database.sqlite-profile')]
+        self.assertEqual(self.db.dbapi.pragma('journal_mode'),
+                         profile['journal_mode'].lower())
+        self.assertEqual(self.db.dbapi.pragma('cache_size'),
+                         profile['cache_size'])
+        with self.db.reader() as reader:
+            self.assertEqual(reader.pragma('journal_mode'),
+                             profile['journal_mode'].lower())
+            self.assertEqual(reader.pragma('cache_size'),
+                             profile['cache_size'])
+
+    def test_reader(self):
+        with DbTxn('Add person', self.db) as trans:
+            handle = self.db.add_person(make_person(1), trans)
+        with self.db.reader() as reader:
+            reader.execute("SELECT handle FROM person")
+            self.assertEqual(reader.fetchall(), [(handle,)])
+            # readers do not wait for, nor see, a pending transaction
+            with DbTxn('Add person', self.db) as trans:
+                self.db.add_person(make_person(2), trans)
+                reader.execute("SELECT COUNT(*) FROM person")
+                self.assertEqual(reader.fetchone()[0], 1)
+            reader.execute("SELECT COUNT(*) FROM person")
+            self.assertEqual(reader.fetchone()[0], 2)
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM person")
+
+    def test_pool(self):
+        with DbTxn('Add people', self.db) as trans:
+            for number in range(100):
+                self.db.add_person(make_person(number), trans)
+        with self.db.reader() as reader1:
+            with self.db.reader() as reader2:
+                self.assertIsNot(reader1, reader2)
+        with self.db.reader() as reader3:
+            self.assertIn(reader3, (reader1, reader2))
+
+        counts = []
+        def count():
+            with self.db.reader() as reader:
+                reader.execute("SELECT COUNT(*) FROM person")
+                counts.append(reader.fetchone()[0])
+        threads = [threading.Thread(target=count) for dummy in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counts, [100] * 4)
+
+    def test_statistics(self):
+        with DbTxn('Add people', self.db) as trans:
+            handles = [self.db.add_person(make_person(number), trans)
+                       for number in range(10)]
+        self.assertIsNone(self.db.dbapi.get_statistics())
+        self.db.dbapi.enable_statistics()
+        for handle in handles:
+            self.db.get_person_from_handle(handle)
+        with self.db.reader() as reader:
+            reader.execute("SELECT COUNT(*) FROM person")
+        statistics = {sql: calls for sql, calls, seconds
+                      in self.db.dbapi.get_statistics()}
+        self.assertEqual(statistics[STATEMENTS[PERSON_KEY]['get_raw']], 10)
+        self.assertEqual(statistics["SELECT COUNT(*) FROM person"], 1)
+        self.db.dbapi.enable_statistics(False)
+        self.assertIsNone(self.db.dbapi.get_statistics())
+
+    def test_iter_handles(self):
+        with DbTxn('Add people', self.db) as trans:
+            handles = [self.db.add_person(make_person(number), trans)
+                       for number in range(ARRAYSIZE + 10)]
+        # other queries do not disturb the iteration
+        found = [self.db.get_person_from_handle(handle).handle
+                 for handle in self.db.iter_person_handles()]
+        self.assertEqual(sorted(found), sorted(handles))
+        # the objects added while iterating are not given
+        count = 0
+        for handle in self.db.iter_person_handles():
+            with DbTxn('Add person', self.db) as trans:
+                self.db.add_person(make_person(count), trans)
+            count += 1
+            if count > 2 * len(handles):
+                break
+        self.assertEqual(count, len(handles))
+
+    def test_readonly(self):
+        with DbTxn('Add person', self.db) as trans:
+            handle = self.db.add_person(make_person(1), trans)
+        self.db.close()
+        profile = config.get('database.sqlite-profile')
+        config.set('database.sqlite-profile', 'compatible')
+        try:
+            self.db.load(self.directory)
+            self.db.close()
+        finally:
+            config.set('database.sqlite-profile', profile)
+        # the journal mode of the profile is not written to read-only trees
+        for update in (False, True):
+            self.db.load(self.directory, mode=DBMODE_R, update=update)
+            self.assertEqual(self.db.dbapi.pragma('journal_mode'), 'delete')
+            self.assertEqual(self.db.get_person_handles(), [handle])
+            with self.assertRaises(sqlite3.OperationalError):
+                self.db.dbapi.execute("DELETE FROM person")
+            self.db.close(update=update)
+        self.db.load(self.directory)
+
+    def test_memory(self):
+        db = make_database("sqlite")
+        db.load(":memory:")
+        with self.assertRaises(NotImplementedError):
+            with db.reader():
+                pass
+        db.close()
+
+#-------------------------------------------------------------------------
+#
+# ProfileBenchmark class
+#
+#-------------------------------------------------------------------------
+@unittest.skipUnless(os.environ.get('GRAMPS_BENCHMARK'),
+                     "Set GRAMPS_BENCHMARK to run the benchmarks")
+class ProfileBenchmark(unittest.TestCase):
+    '''
+    Compare the connection profiles on an import, a full scan and random
+    lookups.
+    '''
+    PEOPLE = 5000
+    BATCH = 50
+    LOOKUPS = 5000
+
+    def setUp(self):
+        self.profile = config.get('database.sqlite-profile')
+
+    def tearDown(self):
+        config.set('database.sqlite-profile', self.profile)
+
+    def run_profile(self, profile):
+        config.set('database.sqlite-profile', profile)
+        directory = tempfile.mkdtemp()
+        db = make_database("sqlite")
+        db.load(directory)
+        try:
+            times = []
+            stime = perf_counter()
+            handles = []
+            for batch in range(0, self.PEOPLE, self.BATCH):
+                with DbTxn('Add people', db) as trans:
+                    for number in range(batch, batch + self.BATCH):
+                        handles.append(db.add_person(make_person(number),
+                                                     trans))
+            times.append(perf_counter() - stime)
+
+            stime = perf_counter()
+            count = sum(1 for dummy in db.iter_people())
+            times.append(perf_counter() - stime)
+            self.assertEqual(count, self.PEOPLE)
+
+            rand = random.Random(0)
+            stime = perf_counter()
+            for dummy in range(self.LOOKUPS):
+                db.get_person_from_handle(rand.choice(handles))
+            times.append(perf_counter() - stime)
+        finally:
+            db.close()
+            shutil.rmtree(directory)
+        return times
+
+    def test_profiles(self):
+        for profile in sorted(PROFILES):
+            times = self.run_profile(profile)
+            if __debug__:
+                print("%-10s import %.2f s, scan %.2f s, lookups %.2f s" %
+                      ((profile,) + tuple(times)))
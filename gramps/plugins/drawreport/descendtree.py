@@ -77,14 +77,6 @@ class DescendantBoxBase(BoxBase):
         self.linked_box = None
         self.father = None
 
-    def calc_text(self, database, person, family):
-        """  A single place to calculate box text """
-
-        gui = GuiConnect()
-        calc = gui.calc_lines(database)
-        self.text = calc.calc_lines(person, family,
-                                    gui.working_lines(self))
-
 class PersonBox(DescendantBoxBase):
     """
     Calculates information about the box that will print on a page
@@ -120,10 +112,6 @@ class PlaceHolderBox(BoxBase):
         self.line_to = None
         self.linked_box = None
 
-    def calc_text(self, database, person, family):
-        """ move along.  Nothing to see here """
-        return
-
 
 #------------------------------------------------------------------------
 #
@@ -374,6 +362,8 @@ class RecurseDown:
         self.families_seen = set()
         self.cols = []
         self.__last_direct = []
+        self.__boxes = []
+        self.__texts = []
 
         gui = GuiConnect()
         self.do_parents = gui.get_val('show_parents')
@@ -384,6 +374,12 @@ class RecurseDown:
             self.inlc_marr = False
         self.spouse_indent = gui.get_val('ind_spouse')
 
+        #what to print in the boxes
+        self.calc = gui.calc_lines(dbase)
+        self.display = gui.get_val("descend_disp")
+        self.display_spou = gui.get_val("spouse_disp")
+        self.display_marr = [gui.get_val("marr_disp")]
+
         #is the option even available?
         self.bold_direct = gui.get_val('bolddirect')
         #can we bold direct descendants?
@@ -395,6 +391,38 @@ class RecurseDown:
         gui = None
 
     def add_to_col(self, box):
+        """
+        Add the box to the end of its column.  The boxes are placed by
+        place_boxes(), once their text is known.
+        """
+        self.__boxes.append((box, box.father))
+
+    def add_text(self, box, indi_handle, fams_handle):
+        """ Remember what to print in the box.  The text of all of the
+        boxes is calculated by place_boxes() """
+        if box.boxstr == "CG2-fam-box":
+            workinglines = self.display_marr
+        elif box.level[1] > 0 or (box.level[0] == 0 and box.father):
+            workinglines = self.display_spou
+        else:
+            workinglines = self.display
+        self.__texts.append((box, indi_handle, fams_handle, workinglines))
+
+    def place_boxes(self):
+        """
+        Calculate the text of all of the boxes in one pass, then place
+        the boxes in their columns in the order that they were added.
+        """
+        for box, indi_handle, fams_handle, workinglines in self.__texts:
+            box.text = self.calc.calc_lines(indi_handle, fams_handle,
+                                            workinglines)
+        self.__texts = []
+
+        for box, father in self.__boxes:
+            self.__place_box(box, father)
+        self.__boxes = []
+
+    def __place_box(self, box, father):
         """
         Add the box to a column on the canvas.  we will do these things:
           set the .linked_box attrib for the boxs in this col
@@ -429,8 +457,8 @@ class RecurseDown:
                 #print level, box.father is not None, \
                 # self.__last_direct[level].father is not None, box.text[0], \
                 # self.__last_direct[level].text[0]
-                if box.father != self.__last_direct[level].father and \
-                   box.father != self.__last_direct[level]:
+                if father != self.__last_direct[level].father and \
+                   father != self.__last_direct[level]:
                     box.y_cm += self.canvas.report_opts.box_pgap
 
         self.cols[level] = box
@@ -466,7 +494,7 @@ class RecurseDown:
             line.end.append(myself)
 
         #calculate the text.
-        myself.calc_text(self.database, indi_handle, fams_handle)
+        self.add_text(myself, indi_handle, fams_handle)
 
         if indi_handle:
             myself.add_mark(self.database,
@@ -485,7 +513,7 @@ class RecurseDown:
         #if father is not None:
         #    myself.father = father
         #calculate the text.
-        myself.calc_text(self.database, indi_handle, fams_handle)
+        self.add_text(myself, indi_handle, fams_handle)
 
         self.add_to_col(myself)
 
@@ -731,6 +759,8 @@ class MakePersonTree(RecurseDown):
         if mother2_h:
             self.recurse_if(mother2_h, 0)
 
+        self.place_boxes()
+
         return persons
 
 #------------------------------------------------------------------------
@@ -946,6 +976,8 @@ class MakeFamilyTree(RecurseDown):
         if father2_h:
             self.recurse_if(father2_h, 0)
 
+        self.place_boxes()
+
 
 #------------------------------------------------------------------------
 #
@@ -972,6 +1004,7 @@ class MakeReport:
         self.ind_spouse = ind_spouse
         self.compress_tree = compress_tree
         self.cols = [[]]
+        self.moves = None
         #self.max_generations = 0
 
     #already done in recurse,
@@ -996,23 +1029,12 @@ class MakeReport:
 
     def __move_col_from_here_down(self, box, amount):
         """Move me and everyone below me in this column only down"""
-        while box:
-            box.y_cm += amount
-            box = box.linked_box
+        self.moves.move_down(box, amount)
 
     def __move_next_cols_from_here_down(self, box, amount):
         """Move me, everyone below me in this column,
         and all of our children (and childrens children) down."""
-        col = [box]
-        while col:
-            if len(col) == 1 and col[0].line_to:
-                col.append(col[0].line_to.end[0])
-
-            col[0].y_cm += amount
-
-            col[0] = col[0].linked_box
-            if col[0] is None:
-                col.pop(0)
+        self.moves.move_down_tree(box, amount)
 
     def __next_family_group(self, box):
         """ a helper function.  Assume box is at the start of a family block.
@@ -1077,8 +1099,9 @@ class MakeReport:
         return a right y_cm and a left y_cm.  these points will be used
         to move parents/children down.
         """
-        left_up = left_group[0].y_cm
-        right_up = right_group[0].y_cm
+        y_cm = self.moves.y_cm
+        left_up = y_cm(left_group[0])
+        right_up = y_cm(right_group[0])
 
         left_center = left_up
         right_center = right_up
@@ -1088,14 +1111,14 @@ class MakeReport:
             for left_line in left_group:
                 if left_line.line_to:
                     break
-            left_center = left_line.y_cm + (left_line.height /2)
+            left_center = y_cm(left_line) + (left_line.height /2)
 
-            left_down = left_group[-1].y_cm + left_group[-1].height
-            right_down = right_group[-1].y_cm + right_group[-1].height
+            left_down = y_cm(left_group[-1]) + left_group[-1].height
+            right_down = y_cm(right_group[-1]) + right_group[-1].height
 
             #Lazy.  Move down either side only as much as we NEED to.
             if left_center < right_up:
-                right_center = right_group[0].y_cm
+                right_center = right_up
             elif left_up == right_up:
                 left_center = left_up #Lets keep it.  top line.
             elif left_center > right_down:
@@ -1112,7 +1135,11 @@ class MakeReport:
 
         We are going to go through everyone from right to left
         top to bottom moving everyone down as needed to make the report.
+        The moves are kept in self.moves and written into the boxes at
+        the end, so a move does not walk down the columns.
         """
+        self.moves = ColumnMoves(self.canvas.boxes)
+        y_cm = self.moves.y_cm
         seen_parents = False
 
         for left_group, right_group in self.__reverse_family_group():
@@ -1145,8 +1172,8 @@ class MakeReport:
                 #only do Dad and Mom.  len(left_line) > 1
                 seen_parents = True
 
-                mom_cm = left_group[-1].y_cm + left_group[-1].height/2
-                last_child_cm = right_group[-1].y_cm
+                mom_cm = y_cm(left_group[-1]) + left_group[-1].height/2
+                last_child_cm = y_cm(right_group[-1])
                 if not self.compress_tree:
                     last_child_cm += right_group[-1].height/2
                 move_amt = last_child_cm - mom_cm
@@ -1165,6 +1192,9 @@ class MakeReport:
                 if left_line.end[0].boxstr == 'None':
                     left_line.end = []
 
+        self.moves.apply()
+        self.moves = None
+
     def start(self):
         """Make the report"""
         #for person in self.persons.depth_first_gen():
@@ -1257,22 +1287,6 @@ class GuiConnect:
         #    str = "_____"
         return CalcLines(database, display_repl, self._locale, self._nd)
 
-    def working_lines(self, box):
-        display = self.get_val("descend_disp")
-        #if self.get_val('diffspouse'):
-        display_spou = self.get_val("spouse_disp")
-        #else:
-        #    display_spou = display
-        display_marr = [self.get_val("marr_disp")]
-
-        if box.boxstr == "CG2-fam-box":  #(((((
-            workinglines = display_marr
-        elif box.level[1] > 0 or (box.level[0] == 0 and box.father):
-            workinglines = display_spou
-        else:
-            workinglines = display
-        return workinglines
-
 
 #------------------------------------------------------------------------
 #
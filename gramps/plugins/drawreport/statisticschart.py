@@ -44,7 +44,7 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
 # Person and relation types
 from gramps.gen.lib import Person, FamilyRelType, EventType, EventRoleType
-from gramps.gen.lib.date import Date, gregorian
+from gramps.gen.lib.date import Date
 # gender and report type names
 from gramps.gen.plug.docgen import (FontStyle, ParagraphStyle, GraphicsStyle,
                                     FONT_SANS_SERIF, FONT_SERIF,
@@ -60,6 +60,7 @@ from gramps.gen.plug.report import stdoptions
 from gramps.gen.datehandler import parser
 from gramps.gen.display.place import displayer as _pd
 from gramps.gen.proxy import CacheProxyDb
+from gramps.plugins.lib.libstatistics import get_person_columns
 
 
 #------------------------------------------------------------------------
@@ -689,41 +690,32 @@ class Extract:
                 data.append((ext[name][1], {}, ext[name][2], ext[name][3]))
 
         # go through the people and collect data
-        for person_handle in people:
+        columns = get_person_columns(dbase)
+        for row in columns.rows(people):
             cb_progress()
-            person = dbase.get_person_from_handle(person_handle)
             # check whether person has suitable gender
-            if person.gender != genders and genders != Person.UNKNOWN:
+            if columns.gender[row] != genders and genders != Person.UNKNOWN:
                 continue
 
             # check whether birth year is within required range
-            birth = self.get_birth(person)
-            if birth:
-                birthdate = birth.get_date_object()
-                if birthdate.get_year_valid():
-                    birthdate = gregorian(birthdate)
-
-                    year = birthdate.get_year()
-                    if not (year >= year_from and year <= year_to):
-                        continue
-                else:
-                    # if death before range, person's out of range too...
-                    death = self.get_death(person)
-                    if death:
-                        deathdate = death.get_date_object()
-                        if deathdate.get_year_valid():
-                            deathdate = gregorian(deathdate)
-
-                            if deathdate.get_year() < year_from:
-                                continue
-                        if not no_years:
-                            # don't accept people not known to be in range
-                            continue
-                    else:
-                        continue
-            else:
+            year = columns.birth_gyear[row]
+            if year is None:
                 continue
-
+            if year:
+                if not (year >= year_from and year <= year_to):
+                    continue
+            else:
+                # if death before range, person's out of range too...
+                death_year = columns.death_gyear[row]
+                if death_year is None:
+                    continue
+                if death_year and death_year < year_from:
+                    continue
+                if not no_years:
+                    # don't accept people not known to be in range
+                    continue
+
+            person = dbase.get_person_from_handle(columns.handles[row])
             self.get_person_data(person, data)
         return data
 
@@ -187,12 +187,21 @@ class PackageWriter:
 
         # Write media files first, since the database may be modified
         # during the process (i.e. when removing object)
+        # Several media objects may share a file: add each file only once.
+        archived = set()
+        archived_bytes = 0
         for m_id in self.db.get_media_handles(sort_handles=True):
             mobject = self.db.get_media_from_handle(m_id)
             filename = media_path_full(self.db, mobject.get_path())
             archname = str(mobject.get_path())
+            if archname in archived:
+                continue
             if os.path.isfile(filename) and os.access(filename, os.R_OK):
                 archive.add(filename, archname, filter=fix_mtime)
+                archived.add(archname)
+                archived_bytes += os.path.getsize(filename)
+        log.info("%d media files archived (%d bytes)",
+                 len(archived), archived_bytes)
 
         # Write XML now
         g = BytesIO()
@@ -36,7 +36,7 @@ from collections import defaultdict
 #
 #------------------------------------------------------------------------
 from gramps.gen.plug import Gramplet
-from gramps.gen.lib import ChildRefType
+from gramps.plugins.lib.libstatistics import get_person_columns
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 
@@ -97,80 +97,36 @@ class AgeStatsGramplet(Gramplet):
         age_handles = [[] for i in range(self.max_age)]
         mother_handles = [[] for i in range(self.max_mother_diff)]
         father_handles = [[] for i in range(self.max_father_diff)]
-        text = ""
-        count = 0
-        for p in self.dbstate.db.iter_people():
-            if count % 300 == 0:
+        columns = get_person_columns(self.dbstate.db)
+        for row in columns.rows():
+            if row % 300 == 0:
                 yield True
+            handle = columns.handles[row]
             # if birth_date and death_date, compute age
-            birth_ref = p.get_birth_ref()
-            birth_date = None
-            if birth_ref:
-                birth_event = self.dbstate.db.get_event_from_handle(birth_ref.ref)
-                birth_date = birth_event.get_date_object()
-            death_ref = p.get_death_ref()
-            death_date = None
-            if death_ref:
-                death_event = self.dbstate.db.get_event_from_handle(death_ref.ref)
-                death_date = death_event.get_date_object()
-            if death_date and birth_date and birth_date.get_year() != 0:
-                age = death_date.get_year() - birth_date.get_year()
+            birth_year = columns.birth_year[row]
+            death_year = columns.death_year[row]
+            if death_year is not None and birth_year:
+                age = death_year - birth_year
                 if age >= 0 and age < self.max_age:
                     age_dict[age] += 1
-                    age_handles[age].append(p.handle)
-                #else:
-                #    print "Age out of range: %d for %s" % (age,
-                #                                           p.get_primary_name().get_first_name()
-                #                                           + " " + p.get_primary_name().get_surname())
+                    age_handles[age].append(handle)
             # for each parent m/f:
-            family_list = p.get_parent_family_handle_list()
-            for family_handle in family_list:
-                family = self.dbstate.db.get_family_from_handle(family_handle)
-                if family:
-                    childrel = [(ref.get_mother_relation(),
-                                 ref.get_father_relation()) for ref in
-                                family.get_child_ref_list()
-                                if ref.ref == p.handle] # get first, if more than one
-                    if childrel[0][0] == ChildRefType.BIRTH:
-                        m_handle = family.get_mother_handle()
-                    else:
-                        m_handle = None
-                    if childrel[0][1] == ChildRefType.BIRTH:
-                        f_handle = family.get_father_handle()
-                    else:
-                        f_handle = None
-                    # if they have a birth_date, compute difference each m/f
-                    if f_handle:
-                        f = self.dbstate.db.get_person_from_handle(f_handle)
-                        bref = f.get_birth_ref()
-                        if bref:
-                            bevent = self.dbstate.db.get_event_from_handle(bref.ref)
-                            bdate = bevent.get_date_object()
-                            if bdate and birth_date and birth_date.get_year() != 0:
-                                diff = birth_date.get_year() - bdate.get_year()
-                                if diff >= 0 and diff < self.max_father_diff:
-                                    father_dict[diff] += 1
-                                    father_handles[diff].append(f_handle)
-                                #else:
-                                #    print "Father diff out of range: %d for %s" % (diff,
-                                #                                                   p.get_primary_name().get_first_name()
-                                #                                                   + " " + p.get_primary_name().get_surname())
-                    if m_handle:
-                        m = self.dbstate.db.get_person_from_handle(m_handle)
-                        bref = m.get_birth_ref()
-                        if bref:
-                            bevent = self.dbstate.db.get_event_from_handle(bref.ref)
-                            bdate = bevent.get_date_object()
-                            if bdate and birth_date and birth_date.get_year() != 0:
-                                diff = birth_date.get_year() - bdate.get_year()
-                                if diff >= 0 and diff < self.max_mother_diff:
-                                    mother_dict[diff] += 1
-                                    mother_handles[diff].append(m_handle)
-                                #else:
-                                #    print "Mother diff out of range: %d for %s" % (diff,
-                                #                                                   p.get_primary_name().get_first_name()
-                                #                                                   + " " + p.get_primary_name().get_surname())
-            count += 1
+            for f_handle, m_handle in columns.birth_parents[row]:
+                # if they have a birth_date, compute difference each m/f
+                if f_handle in columns.index:
+                    bdate = columns.birth_year[columns.index[f_handle]]
+                    if bdate is not None and birth_year:
+                        diff = birth_year - bdate
+                        if diff >= 0 and diff < self.max_father_diff:
+                            father_dict[diff] += 1
+                            father_handles[diff].append(f_handle)
+                if m_handle in columns.index:
+                    bdate = columns.birth_year[columns.index[m_handle]]
+                    if bdate is not None and birth_year:
+                        diff = birth_year - bdate
+                        if diff >= 0 and diff < self.max_mother_diff:
+                            mother_dict[diff] += 1
+                            mother_handles[diff].append(m_handle)
         width = self.chart_width
         graph_width = width - 8
         self.create_bargraph(age_dict, age_handles, _("Lifespan Age Distribution"), _("Age"), graph_width, 5, self.max_age)
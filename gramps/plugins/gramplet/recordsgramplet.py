@@ -25,7 +25,7 @@
 # Gramps modules
 #
 #------------------------------------------------------------------------
-from gramps.plugins.lib.librecords import find_records, CALLNAME_DONTUSE
+from gramps.plugins.lib.librecords import Records, CALLNAME_DONTUSE
 from gramps.gen.plug import Gramplet
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
@@ -41,15 +41,41 @@ class RecordsGramplet(Gramplet):
         self.set_use_markup(True)
         self.set_tooltip(_("Double-click name for details"))
         self.set_text(_("No Family Tree loaded."))
+        self.records = None
 
     def db_changed(self):
-        self.connect(self.dbstate.db, 'person-rebuild', self.update)
-        self.connect(self.dbstate.db, 'family-rebuild', self.update)
+        self.records = Records(self.dbstate.db, None, 3, CALLNAME_DONTUSE)
+        self.connect(self.dbstate.db, 'person-rebuild', self.rebuild)
+        self.connect(self.dbstate.db, 'family-rebuild', self.rebuild)
+        for obj_type in ('Person', 'Family', 'Event'):
+            for action in ('add', 'update', 'delete'):
+                self.connect(self.dbstate.db,
+                             '%s-%s' % (obj_type.lower(), action),
+                             self.make_callback(obj_type))
+
+    def make_callback(self, obj_type):
+        """
+        Return a method that reports the changed objects of obj_type to the
+        records, before updating the gramplet.
+        """
+        def changed(handle_list):
+            self.records.changed(obj_type, handle_list)
+            self.update()
+        return changed
+
+    def rebuild(self):
+        """
+        Compute all the records again after a batch change.
+        """
+        self.records.reset()
+        self.update()
 
     def main(self):
         self.set_text(_("Processing...") + "\n")
         yield True
-        records = find_records(self.dbstate.db, None, 3, CALLNAME_DONTUSE)
+        if self.records is None:
+            self.records = Records(self.dbstate.db, None, 3, CALLNAME_DONTUSE)
+        records = self.records.get_records()
         self.set_text("")
         for (text, varname, top) in records:
             yield True
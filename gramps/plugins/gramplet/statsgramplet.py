@@ -30,19 +30,11 @@ import os
 #------------------------------------------------------------------------
 from gramps.gen.plug import Gramplet
 from gramps.gen.utils.file import media_path_full
-from gramps.gen.datehandler import get_date
 from gramps.gen.lib import Person
 from gramps.gen.const import COLON, GRAMPS_LOCALE as glocale
+from gramps.plugins.lib.libstatistics import get_person_columns
 _ = glocale.translation.sgettext
 
-#------------------------------------------------------------------------
-#
-# Constants
-#
-#------------------------------------------------------------------------
-
-_YIELD_INTERVAL = 200
-
 #------------------------------------------------------------------------
 #
 # StatsGramplet class
@@ -70,16 +62,6 @@ class StatsGramplet(Gramplet):
     def main(self):
         self.set_text(_("Processing..."))
         database = self.dbstate.db
-        personList = database.iter_people()
-
-        with_media = 0
-        total_media = 0
-        incomp_names = 0
-        disconnected = 0
-        missing_bday = 0
-        males = 0
-        females = 0
-        unknowns = 0
         bytes_cnt = 0
         notfound = []
 
@@ -97,45 +79,17 @@ class StatsGramplet(Gramplet):
             except OSError:
                 notfound.append(media.get_path())
 
-        for cnt, person in enumerate(personList):
-            length = len(person.get_media_list())
-            if length > 0:
-                with_media += 1
-                total_media += length
-
-            for name in ([person.get_primary_name()] +
-                         person.get_alternate_names()):
-
-                if name.get_first_name().strip() == "":
-                    incomp_names += 1
-                else:
-                    if name.get_surname_list():
-                        for surname in name.get_surname_list():
-                            if surname.get_surname().strip() == "":
-                                incomp_names += 1
-                    else:
-                        incomp_names += 1
-
-            if (not person.get_main_parents_family_handle() and
-                    not person.get_family_handle_list()):
-                disconnected += 1
-
-            birth_ref = person.get_birth_ref()
-            if birth_ref:
-                birth = database.get_event_from_handle(birth_ref.ref)
-                if not get_date(birth):
-                    missing_bday += 1
-            else:
-                missing_bday += 1
-
-            if person.get_gender() == Person.FEMALE:
-                females += 1
-            elif person.get_gender() == Person.MALE:
-                males += 1
-            else:
-                unknowns += 1
-            if not cnt % _YIELD_INTERVAL:
-                yield True
+        columns = get_person_columns(database)
+        yield True
+        with_media = sum(1 for count in columns.media_count if count > 0)
+        total_media = sum(columns.media_count)
+        incomp_names = sum(columns.incomplete_names)
+        disconnected = sum(columns.disconnected)
+        missing_bday = sum(columns.birth_empty)
+        genders = columns.histogram(columns.gender)
+        males = genders[Person.MALE]
+        females = genders[Person.FEMALE]
+        unknowns = len(columns) - males - females
         self.clear_text()
         self.append_text(_("Individuals") + "\n")
         self.append_text("----------------------------\n")
@@ -30,6 +30,7 @@ from collections import defaultdict
 #------------------------------------------------------------------------
 from gramps.gen.plug import Gramplet
 from gramps.gen.config import config
+from gramps.plugins.lib.libstatistics import get_person_columns
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
 
@@ -71,18 +72,15 @@ class TopSurnamesGramplet(Gramplet):
         surnames = defaultdict(int)
         representative_handle = {}
 
-        cnt = 0
-        for person in self.dbstate.db.iter_people():
-            allnames = [person.get_primary_name()] + person.get_alternate_names()
-            allnames = set([name.get_group_name().strip() for name in allnames])
-            for surname in allnames:
+        columns = get_person_columns(self.dbstate.db)
+        for row in columns.rows():
+            for surname in columns.group_names[row]:
                 surnames[surname] += 1
-                representative_handle[surname] = person.handle
-            cnt += 1
-            if not cnt % _YIELD_INTERVAL:
+                representative_handle[surname] = columns.handles[row]
+            if not row % _YIELD_INTERVAL:
                 yield True
 
-        total_people = cnt
+        total_people = len(columns)
         surname_sort = []
         total = 0
 
@@ -144,6 +144,8 @@ class CSVParser:
         self.pref = {} # person ref, internal to this sheet
         self.fref = {} # family ref, internal to this sheet
         self.placeref = {}
+        self.place_titles = None # place title to handle, built on first use
+        self.source_titles = None # source title to handle
         self.place_types = {}
         # Build reverse dictionary, name to type number
         for items in PlaceType().get_map().items(): # (0, 'Custom')
@@ -384,6 +386,8 @@ class CSVParser:
         self.pref = {} # person ref, internal to this sheet
         self.fref = {} # family ref, internal to this sheet
         self.placeref = {}
+        self.place_titles = None
+        self.source_titles = None
         header = None
         line_number = 0
         for row in data:
@@ -886,6 +890,9 @@ class CSVParser:
                 place.placeref_list.append(placeref)
         #########################################################
         self.db.commit_place(place, self.trans)
+        # the displayed titles of this place and the places it encloses
+        # may have changed
+        self.place_titles = None
 
     def get_place_type(self, place_type_str):
         if place_type_str in self.place_types:
@@ -1032,31 +1039,39 @@ class CSVParser:
             place = self.lookup("place", place_name)
             return (0, place)
         LOG.debug("get_or_create_place: looking for: %s", place_name)
-        for place_handle in self.db.iter_place_handles():
-            place = self.db.get_place_from_handle(place_handle)
-            place_title = place_displayer.display(self.db, place)
-            if place_title == place_name:
-                return (0, place)
+        if self.place_titles is None:
+            self.place_titles = {}
+            for place in self.db.iter_places():
+                place_title = place_displayer.display(self.db, place)
+                self.place_titles.setdefault(place_title, place.handle)
+        if place_name in self.place_titles:
+            return (0, self.db.get_place_from_handle(
+                self.place_titles[place_name]))
         place = Place()
         place.set_title(place_name)
         place.name = PlaceName(value=place_name)
         self.db.add_place(place, self.trans)
+        self.place_titles.setdefault(
+            place_displayer.display(self.db, place), place.handle)
         return (1, place)
 
     def get_or_create_source(self, source_text):
         "Return the requested source object tuple-packed with a new indicator."
-        source_list = self.db.get_source_handles(sort_handles=False)
-        LOG.debug("get_or_create_source: list: %s", source_list)
         LOG.debug("get_or_create_source: looking for: %s", source_text)
-        for source_handle in source_list:
-            source = self.db.get_source_from_handle(source_handle)
-            if source.get_title() == source_text:
-                LOG.debug("   returning existing source")
-                return (0, source)
+        if self.source_titles is None:
+            self.source_titles = {}
+            for source in self.db.iter_sources():
+                self.source_titles.setdefault(source.get_title(),
+                                              source.handle)
+        if source_text in self.source_titles:
+            LOG.debug("   returning existing source")
+            return (0, self.db.get_source_from_handle(
+                self.source_titles[source_text]))
         LOG.debug("   creating source")
         source = Source()
         source.set_title(source_text)
         self.db.add_source(source, self.trans)
+        self.source_titles[source_text] = source.handle
         return (1, source)
 
     def find_and_set_citation(self, obj, source):
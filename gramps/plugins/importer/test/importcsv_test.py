@@ -0,0 +1,116 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest of the place and source lookups of the CSV importer
+"""
+import unittest
+from io import StringIO
+from time import perf_counter
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.display.place import displayer as place_displayer
+from gramps.gen.lib import Place, PlaceName, Source
+from gramps.gen.user import User
+from ..importcsv import CSVParser
+
+def make_csv(rows, places, sources):
+    """
+    Return a CSV file of people, born in one of the given number of places
+    and citing one of the given number of sources.
+    """
+    lines = ["surname,given,birth place,birth source"]
+    for row in range(rows):
+        lines.append("Surname%d,Given%d,Place%d,Source%d" %
+                     (row, row, row % places, row % sources))
+    return StringIO("\n".join(lines) + "\n")
+
+class CSVLookupTest(unittest.TestCase):
+    """
+    Tests of the place and source lookups.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+
+    def tearDown(self):
+        self.db.close()
+
+    def import_csv(self, filehandle):
+        CSVParser(self.db, User()).parse(filehandle)
+
+    def test_existing(self):
+        """
+        Places and sources already in the database are reused.
+        """
+        with DbTxn('Add', self.db) as trans:
+            place = Place()
+            place.set_name(PlaceName(value='Place1'))
+            self.db.add_place(place, trans)
+            source = Source()
+            source.set_title('Source1')
+            self.db.add_source(source, trans)
+        self.import_csv(make_csv(10, 5, 2))
+        self.assertEqual(self.db.get_number_of_places(), 5)
+        self.assertEqual(self.db.get_number_of_sources(), 2)
+        titles = [place_displayer.display(self.db, place)
+                  for place in self.db.iter_places()]
+        self.assertEqual(sorted(titles), ['Place%d' % i for i in range(5)])
+        for person in self.db.iter_people():
+            event = self.db.get_event_from_handle(
+                person.get_birth_ref().ref)
+            row = int(person.get_primary_name().get_first_name()[5:])
+            place = self.db.get_place_from_handle(event.get_place_handle())
+            self.assertEqual(place_displayer.display(self.db, place),
+                             'Place%d' % (row % 5))
+            citation = self.db.get_citation_from_handle(
+                event.get_citation_list()[0])
+            source = self.db.get_source_from_handle(
+                citation.get_reference_handle())
+            self.assertEqual(source.get_title(), 'Source%d' % (row % 2))
+
+    def test_renamed_place(self):
+        """
+        A place renamed by a place table is found with its new title.
+        """
+        self.import_csv(StringIO("place,name\n[P0001],Old\n\n"
+                                 "place,name\n[P0001],New\n\n"
+                                 "surname,birth place\nSmith,New\n"))
+        self.assertEqual(self.db.get_number_of_places(), 1)
+
+    def test_scaling(self):
+        """
+        The time per row does not grow with the number of places.
+        """
+        for rows in (1000, 2000, 4000):
+            self.tearDown()
+            self.setUp()
+            stime = perf_counter()
+            self.import_csv(make_csv(rows, rows // 2, rows // 2))
+            if __debug__:
+                print("%d rows: %.2f seconds" % (rows, perf_counter() - stime))
+            self.assertEqual(self.db.get_number_of_places(), rows // 2)
+            self.assertEqual(self.db.get_number_of_sources(), rows // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
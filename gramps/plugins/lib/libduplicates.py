@@ -0,0 +1,538 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2000-2007  Donald N. Allingham
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Matching of possible duplicate people, used by the Find Possible Duplicate
+People tool.
+
+The data needed to compare two people is extracted once per person into a
+compact, picklable feature record. People are then split into blocks of the
+same gender and surname key, and each block is sorted by birth year: two
+people with different, exact birth years never match, so only people of the
+same birth year, or without an exact birth year, are compared. Large jobs
+are spread over a process pool.
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard Python modules
+#
+#-------------------------------------------------------------------------
+import os
+import time
+import logging
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from gramps.gen.lib import Date, Person
+from gramps.gen.soundex import soundex, compare
+
+LOG = logging.getLogger(".finddupes")
+
+# Below this number of comparisons, starting worker processes costs more
+# than it saves.
+POOL_THRESHOLD = 50000
+
+#-------------------------------------------------------------------------
+#
+# Helper functions
+#
+#-------------------------------------------------------------------------
+def is_initial(name):
+    if len(name) > 2:
+        return 0
+    elif len(name) == 2:
+        if name[0] == name[0].upper() and name[1] == '.':
+            return 1
+    else:
+        return name[0] == name[0].upper()
+
+def get_surnames(name):
+    """Construct a full surname of the surnames"""
+    return ' '.join([surn.get_surname() for surn in name.get_surname_list()])
+
+def _name_features(name):
+    """
+    Return the (surnames, suffix, first name) of a Name.
+    """
+    return (get_surnames(name), name.get_suffix(), name.get_first_name())
+
+def _year_key(date):
+    """
+    Return the year of the date, or None if the date can match dates of
+    any year (empty or compound dates).
+    """
+    if date.is_empty() or date.is_compound():
+        return None
+    return date.get_year()
+
+# The data of one person needed for the comparisons:
+#   index:    position of the person in the database iteration order
+#   name:     (surnames, suffix, first name) of the primary name
+#   birth, death: Date objects
+#   birth_place, death_place: (handle, title) tuples
+#   parents:  None, or the names of the father and mother of the main parent
+#             family (None if missing)
+#   spouses:  ((father handle, name), (mother handle, name)) of each
+#             family where the person is a parent
+PersonFeatures = namedtuple('PersonFeatures',
+                            ['index', 'handle', 'gender', 'name', 'birth',
+                             'death', 'birth_year', 'death_year',
+                             'birth_place', 'death_place', 'parents',
+                             'spouses'])
+
+#-------------------------------------------------------------------------
+#
+# Matcher
+#
+#-------------------------------------------------------------------------
+class Matcher:
+    """
+    Compute the chance that two people, given by their PersonFeatures, are
+    the same person. -1 means that they can not be the same person.
+    """
+    def __init__(self, use_soundex=True):
+        self.use_soundex = use_soundex
+
+    def gen_key(self, val):
+        if self.use_soundex:
+            try:
+                return soundex(val)
+            except UnicodeEncodeError:
+                return val
+        else:
+            return val
+
+    def compare_people(self, p1, p2):
+
+        chance = self.name_match(p1.name, p2.name)
+        if chance == -1  :
+            return -1
+
+        value = self.date_match(p1.birth, p2.birth)
+        if value == -1 :
+            return -1
+        chance += value
+
+        value = self.date_match(p1.death, p2.death)
+        if value == -1 :
+            return -1
+        chance += value
+
+        value = self.place_match(p1.birth_place, p2.birth_place)
+        if value == -1 :
+            return -1
+        chance += value
+
+        value = self.place_match(p1.death_place, p2.death_place)
+        if value == -1 :
+            return -1
+        chance += value
+
+        if p1.parents and p2.parents:
+            value = self.name_match(p1.parents[0], p2.parents[0])
+            if value == -1:
+                return -1
+            chance += value
+
+            value = self.name_match(p1.parents[1], p2.parents[1])
+            if value == -1:
+                return -1
+            chance += value
+
+        # the fathers for a female, the mothers otherwise
+        other = 0 if p1.gender == Person.FEMALE else 1
+        for family1 in p1.spouses:
+            spouse1_id, spouse1 = family1[other]
+            for family2 in p2.spouses:
+                spouse2_id, spouse2 = family2[other]
+                if spouse1_id and spouse2_id:
+                    if spouse1_id == spouse2_id:
+                        chance += 1
+                    else:
+                        value = self.name_match(spouse1, spouse2)
+                        if value != -1:
+                            chance += value
+        return chance
+
+    def name_compare(self, s1, s2):
+        if self.use_soundex:
+            try:
+                return compare(s1,s2)
+            except UnicodeEncodeError:
+                return s1 == s2
+        else:
+            return s1 == s2
+
+    def date_match(self, date1, date2):
+        if date1.is_empty() or date2.is_empty():
+            return 0
+        if date1.is_equal(date2):
+            return 1
+
+        if date1.is_compound() or date2.is_compound():
+            return self.range_compare(date1,date2)
+
+        if date1.get_year() == date2.get_year():
+            if date1.get_month() == date2.get_month():
+                return 0.75
+            if not date1.get_month_valid() or not date2.get_month_valid():
+                return 0.75
+            else:
+                return -1
+        else:
+            return -1
+
+    def range_compare(self, date1, date2):
+        start_date_1 = date1.get_start_date()[0:3]
+        start_date_2 = date2.get_start_date()[0:3]
+        stop_date_1 = date1.get_stop_date()[0:3]
+        stop_date_2 = date2.get_stop_date()[0:3]
+        if date1.is_compound() and date2.is_compound():
+            if (start_date_2 <= start_date_1 <= stop_date_2 or
+                start_date_1 <= start_date_2 <= stop_date_1 or
+                start_date_2 <= stop_date_1 <= stop_date_2 or
+                start_date_1 <= stop_date_2 <= stop_date_1):
+                return 0.5
+            else:
+                return -1
+        elif date2.is_compound():
+            if start_date_2 <= start_date_1 <= stop_date_2:
+                return 0.5
+            else:
+                return -1
+        else:
+            if start_date_1 <= start_date_2 <= stop_date_1:
+                return 0.5
+            else:
+                return -1
+
+    def name_match(self, name, name1):
+
+        if not name1 or not name:
+            return 0
+
+        srn1, sfx1, first1 = name
+        srn2, sfx2, first2 = name1
+
+        if not self.name_compare(srn1,srn2):
+            return -1
+        if sfx1 != sfx2:
+            if sfx1 != "" and sfx2 != "":
+                return -1
+
+        if first1 == first2:
+            return 1
+        else:
+            list1 = first1.split()
+            list2 = first2.split()
+
+            if len(list1) < len(list2):
+                return self.list_reduce(list1,list2)
+            else:
+                return self.list_reduce(list2,list1)
+
+    def place_match(self, place1, place2):
+        p1_id, name1 = place1
+        p2_id, name2 = place2
+        if p1_id == p2_id:
+            return 1
+
+        if not (name1 and name2):
+            return 0
+        if name1 == name2:
+            return 1
+
+        list1 = name1.replace(","," ").split()
+        list2 = name2.replace(","," ").split()
+
+        value = 0
+        for name in list1:
+            for name2 in list2:
+                if name == name2:
+                    value += 0.5
+                elif name[0] == name2[0] and self.name_compare(name, name2):
+                    value += 0.25
+        return min(value,1) if value else -1
+
+    def list_reduce(self, list1, list2):
+        value = 0
+        for name in list1:
+            for name2 in list2:
+                if is_initial(name) and name[0] == name2[0]:
+                    value += 0.25
+                elif is_initial(name2) and name2[0] == name[0]:
+                    value += 0.25
+                elif name == name2:
+                    value += 0.5
+                elif name[0] == name2[0] and self.name_compare(name, name2):
+                    value += 0.25
+        return min(value,1) if value else -1
+
+    def match_block(self, block, thresh):
+        """
+        Compare the people of a block, sorted by birth year, with each
+        other. Return the list of the (index1, index2, chance) of the
+        ordered pairs whose chance reaches thresh, and the number of pairs
+        compared.
+        """
+        results = []
+        compared = 0
+        wild = [p for p in block if p.birth_year is None]
+        for year, group in groupby(block, key=lambda p: p.birth_year):
+            group = list(group)
+            if year is None:
+                # already in wild
+                continue
+            for p1 in group:
+                for p2 in group + wild:
+                    if self.__cheap_mismatch(p1, p2):
+                        continue
+                    compared += 2
+                    self.__compare(p1, p2, thresh, results)
+                    self.__compare(p2, p1, thresh, results)
+        for p1 in wild:
+            for p2 in wild:
+                if self.__cheap_mismatch(p1, p2):
+                    continue
+                compared += 1
+                self.__compare(p1, p2, thresh, results)
+        return results, compared
+
+    def __cheap_mismatch(self, p1, p2):
+        """
+        Return True if the pair can be skipped without a full comparison.
+        Pairs of the same year group are seen twice, so keep one ordering.
+        """
+        if p1.index == p2.index:
+            return True
+        if (p1.birth_year is not None and p2.birth_year is not None and
+                p1.index > p2.index):
+            return True
+        return (p1.death_year is not None and p2.death_year is not None and
+                p1.death_year != p2.death_year)
+
+    def __compare(self, p1, p2, thresh, results):
+        chance = self.compare_people(p1, p2)
+        if chance >= thresh:
+            results.append((p1.index, p2.index, chance))
+
+def _match_blocks(matcher, blocks, thresh):
+    """
+    Match a list of blocks; run in the worker processes.
+    """
+    results = []
+    compared = 0
+    for block in blocks:
+        block_results, block_compared = matcher.match_block(block, thresh)
+        results.extend(block_results)
+        compared += block_compared
+    return results, compared
+
+#-------------------------------------------------------------------------
+#
+# DuplicateFinder
+#
+#-------------------------------------------------------------------------
+class DuplicateFinder:
+    """
+    Find the possible duplicate people of a database.
+    """
+    def __init__(self, db, use_soundex=True, workers=None):
+        """
+        :param workers: maximum number of worker processes; defaults to the
+                        number of processors
+        :type workers: int
+        """
+        self.db = db
+        self.matcher = Matcher(use_soundex)
+        self.workers = workers or os.cpu_count() or 1
+        self.people = []
+        self.parents = {}
+        self.compared = 0
+        self.elapsed = 0
+
+    def get_number_of_blocks(self):
+        """
+        Return the number of blocks, available after :meth:`extract`.
+        """
+        return len(self.__get_blocks())
+
+    def extract(self, step=None):
+        """
+        Extract the features of every person, calling step after each one.
+        """
+        db = self.db
+        places = {None: ""}
+        names = {}
+        raw = []
+        for person in db.iter_people():
+            if step:
+                step()
+            names[person.handle] = _name_features(person.get_primary_name())
+            events = []
+            for ref in (person.get_birth_ref(), person.get_death_ref()):
+                event = db.get_event_from_handle(ref.ref) if ref else None
+                if event:
+                    date = event.get_date_object()
+                    place = event.get_place_handle() or None
+                    if place not in places:
+                        places[place] = db.get_place_from_handle(
+                            place).get_title()
+                    events.append((date, (place, places[place])))
+                else:
+                    events.append((Date(), (None, "")))
+            raw.append((person, events))
+
+        families = {}
+        for family in db.iter_families():
+            families[family.handle] = (family.get_father_handle(),
+                                       family.get_mother_handle())
+
+        self.people = []
+        self.parents = {}
+        for index, (person, events) in enumerate(raw):
+            main_family = person.get_main_parents_family_handle()
+            parents = None
+            if main_family in families:
+                father, mother = families[main_family]
+                self.parents[person.handle] = (father, mother)
+                parents = (names.get(father), names.get(mother))
+            spouses = []
+            for family_handle in person.get_family_handle_list():
+                if family_handle not in families:
+                    continue
+                father, mother = families[family_handle]
+                spouses.append(((father, names.get(father)),
+                                (mother, names.get(mother))))
+            (birth, birth_place), (death, death_place) = events
+            self.people.append(PersonFeatures(
+                index, person.handle, person.get_gender(),
+                names[person.handle], birth, death, _year_key(birth),
+                _year_key(death), birth_place, death_place, parents,
+                spouses))
+
+    def __get_blocks(self):
+        """
+        Split the people into blocks of the same gender and surname key,
+        each sorted by birth year (people without one come first).
+        """
+        blocks = {}
+        for person in self.people:
+            key = (person.gender == Person.MALE,
+                   self.matcher.gen_key(person.name[0]))
+            blocks.setdefault(key, []).append(person)
+        for block in blocks.values():
+            block.sort(key=lambda p: (p.birth_year is not None,
+                                      p.birth_year or 0, p.index))
+        return [block for block in blocks.values() if len(block) > 1]
+
+    def ancestors_of(self, p1_id, id_list):
+        if (not p1_id) or (p1_id in id_list):
+            return
+        id_list.append(p1_id)
+        if p1_id in self.parents:
+            father, mother = self.parents[p1_id]
+            self.ancestors_of(father, id_list)
+            self.ancestors_of(mother, id_list)
+
+    def find(self, thresh, step=None):
+        """
+        Return a dictionary mapping the handle of each person with a
+        possible duplicate to the (handle, chance) of that duplicate.
+        step is called after each block.
+        """
+        start = time.perf_counter()
+        blocks = self.__get_blocks()
+        estimate = sum(len(block) ** 2 for block in blocks)
+        results = []
+        self.compared = 0
+        if self.workers > 1 and estimate > POOL_THRESHOLD:
+            # about four tasks per worker, so that they finish together
+            size = estimate // (self.workers * 4) + 1
+            tasks = []
+            task = []
+            task_size = 0
+            for block in blocks:
+                task.append(block)
+                task_size += len(block) ** 2
+                if task_size >= size:
+                    tasks.append(task)
+                    task = []
+                    task_size = 0
+            if task:
+                tasks.append(task)
+            with ProcessPoolExecutor(self.workers) as executor:
+                futures = [executor.submit(_match_blocks, self.matcher,
+                                           task, thresh) for task in tasks]
+                for task, future in zip(tasks, futures):
+                    task_results, compared = future.result()
+                    results.extend(task_results)
+                    self.compared += compared
+                    if step:
+                        for block in task:
+                            step()
+        else:
+            for block in blocks:
+                block_results, compared = self.matcher.match_block(block,
+                                                                   thresh)
+                results.extend(block_results)
+                self.compared += compared
+                if step:
+                    step()
+
+        # replay the matches in the order of the pairwise loops, so that
+        # the result does not depend on the blocking
+        results.sort(key=lambda result: (result[0], result[1]))
+        the_map = {}
+        for index1, index2, chance in results:
+            p1key = self.people[index1].handle
+            p2key = self.people[index2].handle
+            if p2key in the_map:
+                (v,c) = the_map[p2key]
+                if v == p1key:
+                    continue
+            ancestors = []
+            self.ancestors_of(p1key, ancestors)
+            if p2key in ancestors:
+                continue
+            ancestors = []
+            self.ancestors_of(p2key, ancestors)
+            if p1key in ancestors:
+                continue
+            if p1key in the_map:
+                val = the_map[p1key]
+                if val[1] > chance:
+                    the_map[p1key] = (p2key,chance)
+            else:
+                the_map[p1key] = (p2key,chance)
+
+        self.elapsed = time.perf_counter() - start
+        LOG.info("%d people, %d blocks, %d comparisons in %.2fs (%.0f/s)",
+                 len(self.people), len(blocks), self.compared, self.elapsed,
+                 self.compared / self.elapsed if self.elapsed else 0)
+        return the_map
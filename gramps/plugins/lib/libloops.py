@@ -0,0 +1,120 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2007-2009   Stephane Charette
+# Copyright (C) 2016-       Serge Noiraud
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Search of the loops in the descendance of people, used by the Find database
+loop tool.
+"""
+
+#------------------------------------------------------------------------
+#
+# Python modules
+#
+#------------------------------------------------------------------------
+from collections import defaultdict
+
+#-------------------------------------------------------------------------
+#
+# Constants
+#
+#-------------------------------------------------------------------------
+# indexes in the raw family and child reference data
+_FATHER_HANDLE = 2
+_MOTHER_HANDLE = 3
+_CHILD_REF_LIST = 4
+_CHILD_REF_HANDLE = 3
+
+# states of the people during the search
+_ON_PATH = 1
+_DONE = 2
+
+#------------------------------------------------------------------------
+#
+# find_loops
+#
+#------------------------------------------------------------------------
+def find_loops(db, step=None):
+    """
+    Find the loops in the descendance of the people of the database.
+
+    A parent -> child adjacency is built once from the raw family data,
+    then searched with an iterative depth first search, so that every person
+    and every link is visited only once.
+
+    :param db: The database to search
+    :param step: Optional function called each time a person is done
+    :returns: A list of loops, each of them a list of
+              (parent handle, child handle, family handle) links, starting
+              with the link that closes the loop.
+    """
+    children = defaultdict(list)
+    with db.get_family_cursor() as cursor:
+        for family_handle, data in cursor:
+            child_handles = [child_ref[_CHILD_REF_HANDLE]
+                             for child_ref in data[_CHILD_REF_LIST]]
+            for parent_handle in (data[_FATHER_HANDLE],
+                                  data[_MOTHER_HANDLE]):
+                if parent_handle:
+                    children[parent_handle].extend(
+                        (child_handle, family_handle)
+                        for child_handle in child_handles)
+
+    state = {}
+    loops = []
+    found = set()
+    for start in db.iter_person_handles():
+        if start in state:
+            continue
+        state[start] = _ON_PATH
+        # path is the list of people from start to the current person,
+        # links[i] is the link from path[i-1] to path[i], and position
+        # gives the index in path of the people on it.
+        path = [start]
+        links = [None]
+        position = {start: 0}
+        todo = [iter(children.get(start, ()))]
+        while todo:
+            for child_handle, family_handle in todo[-1]:
+                parent_handle = path[-1]
+                child_state = state.get(child_handle)
+                if child_state is None:
+                    state[child_handle] = _ON_PATH
+                    position[child_handle] = len(path)
+                    path.append(child_handle)
+                    links.append((parent_handle, child_handle,
+                                  family_handle))
+                    todo.append(iter(children.get(child_handle, ())))
+                    break
+                if child_state == _ON_PATH:
+                    link = (parent_handle, child_handle, family_handle)
+                    if link not in found:
+                        found.add(link)
+                        loops.append(
+                            [link] + links[position[child_handle] + 1:])
+            else:
+                handle = path.pop()
+                del position[handle]
+                state[handle] = _DONE
+                links.pop()
+                todo.pop()
+                if step:
+                    step()
+    return loops
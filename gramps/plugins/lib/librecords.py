@@ -27,6 +27,7 @@
 #
 #------------------------------------------------------------------------
 import datetime
+import heapq
 
 #------------------------------------------------------------------------
 #
@@ -109,58 +110,277 @@ def find_records(db, filter, top_size, callname,
     :param living_mode: enable optional control of living people's records
     :type living_mode: int
     """
+    return Records(db, filter, top_size, callname, trans_text=trans_text,
+                   name_format=name_format, living_mode=living_mode,
+                   user=user).get_records()
 
-    def get_unfiltered_person_from_handle(person_handle):
-        if living_mode == LivingProxyDb.MODE_INCLUDE_ALL:
-            return db.get_person_from_handle(person_handle)
+#------------------------------------------------------------------------
+#
+# Records
+#
+#------------------------------------------------------------------------
+class Records:
+    """
+    Find the records of a database.
+
+    The values of each person and family are computed with one pass over the
+    people and one over the families, and kept per handle. The top lists are
+    then built from them with bounded heaps.
+
+    The result is kept for as long as the revision of the database does not
+    change. Callers that follow the database signals can report the changed
+    objects with :meth:`changed`, so that only the people and families
+    affected by them are computed again.
+    """
+    def __init__(self, db, filter, top_size, callname,
+                 trans_text=glocale.translation.sgettext, name_format=None,
+                 living_mode=LivingProxyDb.MODE_INCLUDE_ALL, user=None):
+        self.db = db
+        self.filter = filter
+        self.top_size = top_size
+        self.callname = callname
+        self.trans_text = trans_text
+        self.name_format = name_format
+        self.living_mode = living_mode
+        self.user = user
+        self.today_date = None
+        self.included = None        # handles of the filtered people
+        self.children = {}          # handle -> birth children handles
+        self.person_values = {}     # handle -> (name, [(low, high, value)])
+        self.family_values = {}
+        self.pending = set()        # (class name, handle) of changed objects
+        self.revision = None
+        self.records = None
+
+    def reset(self):
+        """
+        Forget the computed values, so that the next call to
+        :meth:`get_records` scans the whole database again.
+        """
+        self.pending.clear()
+        self.records = None
+
+    def changed(self, obj_type, handle_list):
+        """
+        Report objects changed in the database.
+
+        :param obj_type: 'Person', 'Family' or 'Event'
+        :type obj_type: str
+        :param handle_list: handles of the added, updated or deleted objects
+        :type handle_list: list
+
+        The values of a deleted person or family are dropped. The people
+        related to them are found through the families which referred to
+        them, so the updates of these families must be reported too, as the
+        database signals do.
+        """
+        for handle in handle_list:
+            self.pending.add((obj_type, handle))
+
+    def get_records(self):
+        """
+        Return the records, as a list of (text, varname, top list) tuples
+        in the order of RECORDS.
+        """
+        try:
+            revision = self.db.get_revision()
+        except (AttributeError, NotImplementedError):
+            revision = None
+        if (self.records is not None and revision is not None
+                and revision == self.revision):
+            self.pending.clear()
+            return self.records
+
+        today = datetime.date.today()
+        self.today_date = Date(today.year, today.month, today.day)
+        self.children = {}
+        if self.records is not None and self.pending:
+            self.__update()
+        else:
+            self.__scan()
+        self.pending.clear()
+        self.children = {}
+        self.revision = revision
+        self.records = self.__build()
+        return self.records
+
+    def __get_unfiltered_person(self, person_handle):
+        if self.living_mode == LivingProxyDb.MODE_INCLUDE_ALL:
+            return self.db.get_person_from_handle(person_handle)
         else: # we are in the proxy so get the person before proxy changes
-            return db.get_unfiltered_person(person_handle)
-
-    today = datetime.date.today()
-    today_date = Date(today.year, today.month, today.day)
-
-    # Person records
-    person_youngestliving = []
-    person_oldestliving = []
-    person_youngestdied = []
-    person_oldestdied = []
-    person_youngestmarried = []
-    person_oldestmarried = []
-    person_youngestdivorced = []
-    person_oldestdivorced = []
-    person_youngestfather = []
-    person_youngestmother = []
-    person_oldestfather = []
-    person_oldestmother = []
-    person_mostkidsfather = []
-    person_mostkidsmother = []
-    person_mostgrandkidsfather = []
-    person_mostgrandkidsmother = []
-
-    person_handle_list = db.iter_person_handles()
-
-    # the next "if" will turn person_handle_list from a generator into a
-    # list, but only when this code is called from a report (which has a
-    # filter) and not when called from a gramplet (which has no filter);
-    # so the next line drains the generator and turns it into a list
-    # always, so the gramplet can use it later, in the second loop
-    person_handle_list = list(person_handle_list)
-
-    if filter:
-        person_handle_list = filter.apply(db, person_handle_list, user=user)
-
-    for person_handle in person_handle_list:
-        person = db.get_person_from_handle(person_handle)
-        unfil_person = get_unfiltered_person_from_handle(person_handle)
+            return self.db.get_unfiltered_person(person_handle)
+
+    def __get_person(self, person_handle):
+        """
+        Return the person with the given handle, or None if it was deleted.
+        """
+        if not self.db.has_person_handle(person_handle):
+            return None
+        return self.db.get_person_from_handle(person_handle)
+
+    def __get_family(self, family_handle):
+        """
+        Return the family with the given handle, or None if it was deleted.
+        """
+        if not self.db.has_family_handle(family_handle):
+            return None
+        return self.db.get_family_from_handle(family_handle)
+
+    def __get_name(self, person):
+        return _get_styled_primary_name(person, self.callname,
+                                        trans_text=self.trans_text,
+                                        name_format=self.name_format)
+
+    def __scan(self):
+        """
+        Compute the values of all the people and families.
+        """
+        person_handle_list = list(self.db.iter_person_handles())
+        if self.filter:
+            person_handle_list = self.filter.apply(self.db, person_handle_list,
+                                                   user=self.user)
+            self.included = set(person_handle_list)
+
+        self.person_values = {}
+        for person_handle in person_handle_list:
+            values = self.__get_person_values(person_handle)
+            if values:
+                self.person_values[person_handle] = values
+
+        self.family_values = {}
+        for family in self.db.iter_families():
+            if self.living_mode != LivingProxyDb.MODE_INCLUDE_ALL:
+                # FIXME no iter_families method in LivingProxyDb so do it this way
+                family = self.db.get_family_from_handle(family.get_handle())
+            values = self.__get_family_values(family)
+            if values:
+                self.family_values[family.handle] = values
+
+    def __update(self):
+        """
+        Compute again the values of the people and families affected by the
+        pending changes.
+        """
+        db = self.db
+        people = set()
+        families = set()
+        pending = list(self.pending)
+        while pending:
+            obj_type, handle = pending.pop()
+            if obj_type == 'Event':
+                pending.extend(db.find_backlink_handles(
+                    handle, include_classes=['Person', 'Family']))
+            elif obj_type == 'Person':
+                people.add(handle)
+                person = self.__get_person(handle)
+                if person:
+                    # the person's own families, and the parents and
+                    # grandparents whose children records count the person
+                    families.update(person.get_family_handle_list())
+                    for parent in self.__get_parents(person):
+                        people.add(parent.handle)
+                        people.update(grandparent.handle for grandparent
+                                      in self.__get_parents(parent))
+            elif obj_type == 'Family':
+                families.add(handle)
+                family = self.__get_family(handle)
+                if family:
+                    for parent_handle in (family.get_father_handle(),
+                                          family.get_mother_handle()):
+                        parent = (self.__get_person(parent_handle)
+                                  if parent_handle else None)
+                        if parent:
+                            people.add(parent_handle)
+                            people.update(grandparent.handle for grandparent
+                                          in self.__get_parents(parent))
+
+        if self.filter:
+            for handle in people:
+                self.included.discard(handle)
+            self.included.update(self.filter.apply(
+                db, [handle for handle in people
+                     if db.has_person_handle(handle)]))
+
+        for person_handle in people:
+            values = None
+            if not self.filter or person_handle in self.included:
+                values = self.__get_person_values(person_handle)
+            if values:
+                self.person_values[person_handle] = values
+            else:
+                self.person_values.pop(person_handle, None)
+
+        for family_handle in families:
+            family = self.__get_family(family_handle)
+            values = self.__get_family_values(family) if family else None
+            if values:
+                self.family_values[family_handle] = values
+            else:
+                self.family_values.pop(family_handle, None)
+
+    def __get_parents(self, person):
+        """
+        Return the parents of the person in all the parent families.
+        """
+        parents = []
+        for family_handle in person.get_parent_family_handle_list():
+            family = self.__get_family(family_handle)
+            if family is None:
+                continue
+            for parent_handle in (family.get_father_handle(),
+                                  family.get_mother_handle()):
+                if parent_handle:
+                    parent = self.__get_person(parent_handle)
+                    if parent:
+                        parents.append(parent)
+        return parents
+
+    def __get_birth_children(self, person):
+        """
+        Return the handles of the birth children of the person, remembering
+        them for the rest of the pass.
+        """
+        if person.handle not in self.children:
+            self.children[person.handle] = [
+                child.handle for child in get_birth_children(self.db, person)
+                if child is not None]
+        return self.children[person.handle]
+
+    def __get_person_values(self, person_handle):
+        """
+        Return the name of the person and the list of the (lowest varname,
+        highest varname, value) person records they are a candidate for.
+        """
+        db = self.db
+        person = self.__get_person(person_handle)
         if person is None:
-            continue
+            return None
+        name = self.__get_name(person)
+        values = []
+
+        # Records which don't care about a person's birth or death
+        person_child_list = self.__get_birth_children(person)
+        grandchildren = 0
+        for child_handle in person_child_list:
+            child = db.get_person_from_handle(child_handle)
+            grandchildren += len(self.__get_birth_children(child))
+        if person.get_gender() == person.MALE:
+            values.append((None, 'person_mostkidsfather',
+                           len(person_child_list)))
+            values.append((None, 'person_mostgrandkidsfather',
+                           grandchildren))
+        elif person.get_gender() == person.FEMALE:
+            values.append((None, 'person_mostkidsmother',
+                           len(person_child_list)))
+            values.append((None, 'person_mostgrandkidsmother',
+                           grandchildren))
 
         # FIXME this should check for a "fallback" birth also/instead
         birth_ref = person.get_birth_ref()
 
         if not birth_ref:
             # No birth event, so we can't calculate any age.
-            continue
+            return name, values
 
         birth = db.get_event_from_handle(birth_ref.ref)
         birth_date = birth.get_date_object()
@@ -169,26 +389,23 @@ def find_records(db, filter, top_size, callname,
 
         if not _good_date(birth_date):
             # Birth date unknown or incomplete, so we can't calculate any age.
-            continue
-
-        name = _get_styled_primary_name(person, callname,
-                                        trans_text=trans_text,
-                                        name_format=name_format)
+            return name, values
 
         if death_date is None:
+            unfil_person = self.__get_unfiltered_person(person_handle)
             if probably_alive(unfil_person, db):
                 # Still living, look for age records
-                _record(person_youngestliving, person_oldestliving,
-                        today_date - birth_date, name, 'Person', person_handle,
-                        top_size)
+                values.append(('person_youngestliving', 'person_oldestliving',
+                               self.today_date - birth_date))
         elif _good_date(death_date):
             # Already died, look for age records
-            _record(person_youngestdied, person_oldestdied,
-                    death_date - birth_date, name, 'Person', person_handle,
-                    top_size)
+            values.append(('person_youngestdied', 'person_oldestdied',
+                           death_date - birth_date))
 
         for family_handle in person.get_family_handle_list():
-            family = db.get_family_from_handle(family_handle)
+            family = self.__get_family(family_handle)
+            if family is None:
+                continue
 
             marriage_date = None
             divorce_date = None
@@ -204,14 +421,14 @@ def find_records(db, filter, top_size, callname,
                     divorce_date = event.get_date_object()
 
             if _good_date(marriage_date):
-                _record(person_youngestmarried, person_oldestmarried,
-                        marriage_date - birth_date,
-                        name, 'Person', person_handle, top_size)
+                values.append(('person_youngestmarried',
+                               'person_oldestmarried',
+                               marriage_date - birth_date))
 
             if _good_date(divorce_date):
-                _record(person_youngestdivorced, person_oldestdivorced,
-                        divorce_date - birth_date,
-                        name, 'Person', person_handle, top_size)
+                values.append(('person_youngestdivorced',
+                               'person_oldestdivorced',
+                               divorce_date - birth_date))
 
             for child_ref in family.get_child_ref_list():
                 if person.get_gender() == person.MALE:
@@ -223,7 +440,9 @@ def find_records(db, filter, top_size, callname,
                 if relation != ChildRefType.BIRTH:
                     continue
 
-                child = db.get_person_from_handle(child_ref.ref)
+                child = self.__get_person(child_ref.ref)
+                if child is None:
+                    continue
 
                 # FIXME this should check for a "fallback" birth also/instead
                 child_birth_ref = child.get_birth_ref()
@@ -237,97 +456,57 @@ def find_records(db, filter, top_size, callname,
                     continue
 
                 if person.get_gender() == person.MALE:
-                    _record(person_youngestfather, person_oldestfather,
-                            child_birth_date - birth_date,
-                            name, 'Person', person_handle, top_size)
+                    values.append(('person_youngestfather',
+                                   'person_oldestfather',
+                                   child_birth_date - birth_date))
                 elif person.get_gender() == person.FEMALE:
-                    _record(person_youngestmother, person_oldestmother,
-                            child_birth_date - birth_date,
-                            name, 'Person', person_handle, top_size)
-
-    for person_handle in person_handle_list:
-        # this "person loop" doesn't care about a person's birth or death
-        person = db.get_person_from_handle(person_handle)
-        if person is None:
-            continue
-
-        name = _get_styled_primary_name(person, callname,
-                                        trans_text=trans_text,
-                                        name_format=name_format)
+                    values.append(('person_youngestmother',
+                                   'person_oldestmother',
+                                   child_birth_date - birth_date))
 
-        person_child_list = get_birth_children(db, person)
-        if person.get_gender() == person.MALE:
-            _record(None, person_mostkidsfather,
-                    len(person_child_list),
-                    name, 'Person', person_handle, top_size)
-        elif person.get_gender() == person.FEMALE:
-            _record(None, person_mostkidsmother,
-                    len(person_child_list),
-                    name, 'Person', person_handle, top_size)
+        return name, values
 
-        person_grandchild_list = []
-        for child in person_child_list:
-            person_grandchild_list += get_birth_children(db, child)
-        if person.get_gender() == person.MALE:
-            _record(None, person_mostgrandkidsfather,
-                    len(person_grandchild_list),
-                    name, 'Person', person_handle, top_size)
-        elif person.get_gender() == person.FEMALE:
-            _record(None, person_mostgrandkidsmother,
-                    len(person_grandchild_list),
-                    name, 'Person', person_handle, top_size)
-
-    # Family records
-    family_mostchildren = []
-    family_youngestmarried = []
-    family_oldestmarried = []
-    family_shortest = []
-    family_longest = []
-    family_smallestagediff = []
-    family_biggestagediff = []
-
-    for family in db.iter_families():
-        #family = db.get_family_from_handle(family_handle)
-        if living_mode != LivingProxyDb.MODE_INCLUDE_ALL:
-            # FIXME no iter_families method in LivingProxyDb so do it this way
-            family = db.get_family_from_handle(family.get_handle())
+    def __get_family_values(self, family):
+        """
+        Return the name of the couple and the list of the (lowest varname,
+        highest varname, value) family records the family is a candidate
+        for, or None if the family is not included.
+        """
+        db = self.db
+        trans_text = self.trans_text
 
         father_handle = family.get_father_handle()
         if not father_handle:
-            continue
+            return None
         mother_handle = family.get_mother_handle()
         if not mother_handle:
-            continue
+            return None
 
         # Test if either father or mother are in filter
-        if filter:
-            # we don't want many progress reports popping up, so no user=user
-            if not filter.apply(db, [father_handle, mother_handle]):
-                continue
+        if self.filter:
+            if (father_handle not in self.included and
+                    mother_handle not in self.included):
+                return None
 
-        father = db.get_person_from_handle(father_handle)
-        unfil_father = get_unfiltered_person_from_handle(father_handle)
+        father = self.__get_person(father_handle)
         if father is None:
-            continue
-        mother = db.get_person_from_handle(mother_handle)
-        unfil_mother = get_unfiltered_person_from_handle(mother_handle)
+            return None
+        unfil_father = self.__get_unfiltered_person(father_handle)
+        mother = self.__get_person(mother_handle)
         if mother is None:
-            continue
+            return None
+        unfil_mother = self.__get_unfiltered_person(mother_handle)
 
         name = StyledText(trans_text("%(father)s and %(mother)s")) % {
-                'father': _get_styled_primary_name(father, callname,
-                                                   trans_text=trans_text,
-                                                   name_format=name_format),
-                'mother': _get_styled_primary_name(mother, callname,
-                                                   trans_text=trans_text,
-                                                   name_format=name_format)}
-
-        if (living_mode == LivingProxyDb.MODE_INCLUDE_ALL
+                'father': self.__get_name(father),
+                'mother': self.__get_name(mother)}
+        values = []
+
+        if (self.living_mode == LivingProxyDb.MODE_INCLUDE_ALL
             or (not probably_alive(unfil_father, db) and
                 not probably_alive(unfil_mother, db))):
-            _record(None, family_mostchildren,
-                    len(family.get_child_ref_list()),
-                    name, 'Family', family.handle, top_size)
+            values.append((None, 'family_mostchildren',
+                           len(family.get_child_ref_list())))
 
         father_birth_ref = father.get_birth_ref()
         if father_birth_ref:
@@ -343,13 +522,13 @@ def find_records(db, filter, top_size, callname,
 
         if _good_date(father_birth_date) and _good_date(mother_birth_date):
             if father_birth_date >> mother_birth_date:
-                _record(family_smallestagediff, family_biggestagediff,
-                        father_birth_date - mother_birth_date,
-                        name, 'Family', family.handle, top_size)
+                values.append(('family_smallestagediff',
+                               'family_biggestagediff',
+                               father_birth_date - mother_birth_date))
             elif mother_birth_date >> father_birth_date:
-                _record(family_smallestagediff, family_biggestagediff,
-                        mother_birth_date - father_birth_date,
-                        name, 'Family', family.handle, top_size)
+                values.append(('family_smallestagediff',
+                               'family_biggestagediff',
+                               mother_birth_date - father_birth_date))
 
         marriage_date = None
         divorce = None
@@ -371,21 +550,21 @@ def find_records(db, filter, top_size, callname,
 
         if not _good_date(marriage_date):
             # Not married or marriage date unknown
-            continue
+            return name, values
 
         if divorce is not None and not _good_date(divorce_date):
             # Divorced but date unknown or inexact
-            continue
+            return name, values
 
         if (not probably_alive(unfil_father, db)
                 and not _good_date(father_death_date)):
             # Father died but death date unknown or inexact
-            continue
+            return name, values
 
         if (not probably_alive(unfil_mother, db)
                 and not _good_date(mother_death_date)):
             # Mother died but death date unknown or inexact
-            continue
+            return name, values
 
         if (divorce_date is None
             and father_death_date is None
@@ -393,9 +572,9 @@ def find_records(db, filter, top_size, callname,
             # Still married and alive
             if (probably_alive(unfil_father, db)
                     and probably_alive(unfil_mother, db)):
-                _record(family_youngestmarried, family_oldestmarried,
-                        today_date - marriage_date,
-                        name, 'Family', family.handle, top_size)
+                values.append(('family_youngestmarried',
+                               'family_oldestmarried',
+                               self.today_date - marriage_date))
         elif (_good_date(divorce_date) or
               _good_date(father_death_date) or
               _good_date(mother_death_date)):
@@ -413,14 +592,85 @@ def find_records(db, filter, top_size, callname,
                     end = divorce_date
             duration = end - marriage_date
 
-            _record(family_shortest, family_longest,
-                    duration, name, 'Family', family.handle, top_size)
-    #python 3 workaround: assign locals to tmp so we work with runtime version
-    tmp = locals()
-    return [(trans_text(text), varname, tmp[varname])
+            values.append(('family_shortest', 'family_longest', duration))
+
+        return name, values
+
+    def __build(self):
+        """
+        Build the top lists from the values of the people and families.
+        """
+        tops = {}
+        for (text, varname, default) in RECORDS:
+            tops[varname] = _TopList(self.top_size,
+                                     highest=varname not in _LOWEST)
+        for handle_type, all_values in (('Person', self.person_values),
+                                        ('Family', self.family_values)):
+            for handle, (name, values) in all_values.items():
+                for (lowest, highest, value) in values:
+                    _record(tops.get(lowest), tops.get(highest), value,
+                            name, handle_type, handle)
+        return [(self.trans_text(text), varname, tops[varname].get_list())
                 for (text, varname, default) in RECORDS]
 
-def _record(lowest, highest, value, text, handle_type, handle, top_size):
+# records where the smallest values are the best ones
+_LOWEST = ('person_youngestliving', 'person_youngestdied',
+           'person_youngestmarried', 'person_youngestdivorced',
+           'person_youngestfather', 'person_youngestmother',
+           'family_youngestmarried', 'family_shortest',
+           'family_smallestagediff')
+
+class _TopList:
+    """
+    The top_size best entries of one record, kept in a bounded heap whose
+    first item is the worst entry kept.
+
+    Entries tying with the last of the top_size best ones are kept too, so
+    the list can be longer than top_size.
+    """
+    def __init__(self, top_size, highest=True):
+        self.top_size = top_size
+        self.sign = 1 if highest else -1
+        self.heap = []
+        self.count = 0
+
+    def add(self, key, entry):
+        """
+        Add the entry, sorted by the integer key, unless it is worse than
+        all the entries already kept.
+        """
+        item = (self.sign * key, self.count, entry)
+        self.count += 1
+        heap = self.heap
+        if len(heap) < self.top_size:
+            heapq.heappush(heap, item)
+            return
+        if item[0] < heap[0][0]:
+            return
+        heapq.heappush(heap, item)
+        # drop the worst entries, unless there are not enough without them
+        while True:
+            worst = []
+            key = heap[0][0]
+            while heap and heap[0][0] == key:
+                worst.append(heapq.heappop(heap))
+            if len(heap) < self.top_size:
+                for item in worst:
+                    heapq.heappush(heap, item)
+                return
+
+    def get_list(self):
+        """
+        Return the kept entries, best first.
+        """
+        if self.sign > 0:
+            # ties are sorted by value and text, as they always were
+            return sorted((entry for (key, count, entry) in self.heap),
+                          reverse=True)
+        return [entry for (key, count, entry)
+                in sorted(self.heap, key=lambda item: (-item[0], item[1]))]
+
+def _record(lowest, highest, value, text, handle_type, handle):
 
     if value < 0: # ignore erroneous data
         return # (since the data-verification tool already finds it)
@@ -433,20 +683,10 @@ def _record(lowest, highest, value, text, handle_type, handle, top_size):
         high_value = value
 
     if lowest is not None:
-        lowest.append((high_value, value, text, handle_type, handle))
-        lowest.sort(key=lambda a: a[0])   # FIXME: Ist das lambda notwendig?
-        for i in range(top_size, len(lowest)):
-            if lowest[i-1][0] < lowest[i][0]:
-                del lowest[i:]
-                break
+        lowest.add(high_value, (high_value, value, text, handle_type, handle))
 
     if highest is not None:
-        highest.append((low_value, value, text, handle_type, handle))
-        highest.sort(reverse=True)
-        for i in range(top_size, len(highest)):
-            if highest[i-1][0] > highest[i][0]:
-                del highest[i:]
-                break
+        highest.add(low_value, (low_value, value, text, handle_type, handle))
 
 def get_birth_children(db, person):
     """ return all the birth children of a person, in a list """
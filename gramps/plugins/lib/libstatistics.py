@@ -0,0 +1,218 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Columnar extraction of the personal data used by the statistics reports and
+gramplets.
+
+The data is extracted with one sequential pass over the events, the families
+and the people of the database, instead of fetching the events and families
+of each person one by one. It is kept in parallel lists (one entry per
+person, in the same order as :attr:`PersonColumns.handles`), so that
+histograms can be computed with a single pass over a column.
+
+The result is cached per database and reused for as long as the revision
+counter of the database does not change.
+"""
+
+#------------------------------------------------------------------------
+#
+# Standard Python modules
+#
+#------------------------------------------------------------------------
+from collections import Counter
+from weakref import WeakKeyDictionary
+
+#------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#------------------------------------------------------------------------
+from gramps.gen.lib import ChildRefType
+from gramps.gen.lib.date import gregorian
+
+#------------------------------------------------------------------------
+#
+# PersonColumns
+#
+#------------------------------------------------------------------------
+class PersonColumns:
+    """
+    Personal data of all the people of a database, one list per column.
+
+    For the birth and death columns, None means that the person has no such
+    event, and a year of 0 means that the date of the event has no valid
+    year.
+    """
+    def __init__(self, db):
+        self.handles = []
+        self.gender = []
+        self.birth_year = []        # year in the calendar of the date
+        self.birth_gyear = []       # year converted to the gregorian calendar
+        self.birth_empty = []       # True if no birth or no birth date
+        self.birth_place = []
+        self.death_year = []
+        self.death_gyear = []
+        self.death_place = []
+        self.event_types = []       # list of EventType per person
+        self.family_count = []
+        self.child_count = []
+        self.media_count = []
+        self.incomplete_names = []  # number of incomplete names per person
+        self.disconnected = []
+        self.surnames = []          # set of stripped surnames per person
+        self.group_names = []       # set of stripped group names per person
+        self.birth_parents = []     # list of (father, mother) per person
+        self.index = {}
+        self.__extract(db)
+
+    def __len__(self):
+        return len(self.handles)
+
+    def __extract(self, db):
+        """
+        Fill the columns with one pass over each of the needed tables.
+        """
+        events = {}
+        for event in db.iter_events():
+            date = event.get_date_object()
+            if date.get_year_valid():
+                gyear = gregorian(date).get_year()
+            else:
+                gyear = 0
+            events[event.handle] = (date.get_year(), gyear, date.is_empty(),
+                                    event.get_place_handle(), event.get_type())
+
+        families = {}
+        for family in db.iter_families():
+            families[family.handle] = (family.get_father_handle(),
+                                       family.get_mother_handle(),
+                                       family.get_child_ref_list())
+
+        for person in db.iter_people():
+            self.index[person.handle] = len(self.handles)
+            self.handles.append(person.handle)
+            self.gender.append(person.get_gender())
+
+            for ref, year_col, gyear_col, place_col in (
+                    (person.get_birth_ref(), self.birth_year,
+                     self.birth_gyear, self.birth_place),
+                    (person.get_death_ref(), self.death_year,
+                     self.death_gyear, self.death_place)):
+                event = events.get(ref.ref) if ref else None
+                if event:
+                    year_col.append(event[0])
+                    gyear_col.append(event[1])
+                    place_col.append(event[3])
+                else:
+                    year_col.append(None)
+                    gyear_col.append(None)
+                    place_col.append(None)
+            birth_ref = person.get_birth_ref()
+            birth = events.get(birth_ref.ref) if birth_ref else None
+            self.birth_empty.append(birth is None or birth[2])
+
+            self.event_types.append(
+                [events[ref.ref][4] for ref in person.get_event_ref_list()
+                 if ref.ref in events])
+
+            family_list = person.get_family_handle_list()
+            self.family_count.append(len(family_list))
+            self.child_count.append(
+                sum(len(families[handle][2]) for handle in family_list
+                    if handle in families))
+            self.media_count.append(len(person.get_media_list()))
+
+            names = [person.get_primary_name()] + person.get_alternate_names()
+            incomplete = 0
+            for name in names:
+                if name.get_first_name().strip() == "":
+                    incomplete += 1
+                elif name.get_surname_list():
+                    for surname in name.get_surname_list():
+                        if surname.get_surname().strip() == "":
+                            incomplete += 1
+                else:
+                    incomplete += 1
+            self.incomplete_names.append(incomplete)
+            self.surnames.append(set(name.get_surname().strip()
+                                     for name in names))
+            self.group_names.append(set(name.get_group_name().strip()
+                                        for name in names))
+
+            parent_list = person.get_parent_family_handle_list()
+            self.disconnected.append(not parent_list and not family_list)
+            parents = []
+            for handle in parent_list:
+                if handle not in families:
+                    continue
+                father, mother, child_refs = families[handle]
+                for child_ref in child_refs:
+                    if child_ref.ref == person.handle:
+                        if child_ref.get_father_relation() != \
+                                ChildRefType.BIRTH:
+                            father = None
+                        if child_ref.get_mother_relation() != \
+                                ChildRefType.BIRTH:
+                            mother = None
+                        parents.append((father, mother))
+                        break
+            self.birth_parents.append(parents)
+
+    def rows(self, handles=None):
+        """
+        Return the row numbers of the given person handles, or of all the
+        people if handles is None.
+        """
+        if handles is None:
+            return range(len(self.handles))
+        return [self.index[handle] for handle in handles
+                if handle in self.index]
+
+    def histogram(self, column, rows=None):
+        """
+        Return a Counter of the values of column, optionally restricted to
+        the given row numbers.
+        """
+        if rows is None:
+            return Counter(column)
+        return Counter(column[row] for row in rows)
+
+#------------------------------------------------------------------------
+#
+# Cache
+#
+#------------------------------------------------------------------------
+_CACHE = WeakKeyDictionary()
+
+def get_person_columns(db):
+    """
+    Return the :class:`PersonColumns` of the database, extracting them only
+    if the database changed since the last call.
+    """
+    try:
+        revision = db.get_revision()
+    except NotImplementedError:
+        return PersonColumns(db)
+    cached = _CACHE.get(db)
+    if cached is None or cached[0] != revision:
+        cached = (revision, PersonColumns(db))
+        _CACHE[db] = cached
+    return cached[1]
@@ -45,6 +45,10 @@ class CalcLines:
 
     Receive:  Individual and family handle, and display format [string]
     return: [Text] ready for a box.
+
+    The text is remembered for each handle pair and display format, so
+    people and blank boxes that are shown more than once are only
+    calculated once.
     """
     def __init__(self, dbase, repl, locale, name_displayer):
         self.database = dbase
@@ -52,6 +56,7 @@ class CalcLines:
         #self.default_string = default_str
         self._locale = locale
         self._nd = name_displayer
+        self.__cache = {}
 
     def calc_lines(self, _indi_handle, _fams_handle, workinglines):
         """
@@ -59,6 +64,9 @@ class CalcLines:
         1. make our text and do our replacements
         2. remove any extra (unwanted) lines with the compres option
         """
+        key = (_indi_handle, _fams_handle, tuple(workinglines))
+        if key in self.__cache:
+            return self.__cache[key]
 
         ####################
         #1.1  Get our line information here
@@ -76,6 +84,7 @@ class CalcLines:
                     line = line.replace(repl[0], repl[1])
             lns.append(line)
 
+        self.__cache[key] = lns
         return lns
 
 
@@ -158,6 +167,7 @@ class Canvas(Page):
         self.y_pages = 1
         self.__pages = {(0, 0): self}  #set page 0,0 to me.
         self.__fonts = {}  #keep a list of fonts so we don't have to lookup.
+        self.__widths = {}  #and the width of the lines seen in each font.
         self.title = None
         self.note = None
 
@@ -238,8 +248,11 @@ class Canvas(Page):
         #####################
         #Get the width
         for line in box.text:
-            width = self.doc.string_width(font, line)
-            width = PT2CM(width)
+            key = (box.boxstr, line)
+            width = self.__widths.get(key)
+            if width is None:
+                width = PT2CM(self.doc.string_width(font, line))
+                self.__widths[key] = width
             if width > box.width:
                 box.width = width
 
@@ -896,6 +909,109 @@ class LineBase:
                 doc.draw_line(linestr, x34, yme, xend, yme)
 
 
+#------------------------------------------------------------------------
+#
+# Class ColumnMoves
+#
+#------------------------------------------------------------------------
+class ColumnMoves:
+    """
+    Moves boxes down their columns without walking the columns.
+
+    A column is a chain of boxes linked top down through .linked_box.
+    Moving a box down moves every box below it in its column too.  The
+    amounts are kept in a Fenwick tree for each column, so a move and a
+    look up of the current .y_cm each take O(log n) time.  apply() writes
+    the final .y_cm into the boxes.
+    """
+    def __init__(self, boxes):
+        """ boxes are the boxes on the canvas.  Boxes that are not on the
+        canvas but are linked to, like place holders, are found too. """
+        found = []
+        seen = set()
+        for box in boxes:
+            todo = [box]
+            if box.line_to:
+                todo.extend(box.line_to.end)
+            for link in todo:
+                while link is not None and link not in seen:
+                    seen.add(link)
+                    found.append(link)
+                    link = link.linked_box
+        below = set(box.linked_box for box in found)
+
+        self.__cols = []
+        self.__index = {}
+        for box in found:
+            if box in below:
+                continue
+            col = []
+            while box is not None:
+                self.__index[box] = (len(self.__cols), len(col))
+                col.append(box)
+                box = box.linked_box
+            self.__cols.append(col)
+
+        self.__trees = [[0.0] * (len(col) + 1) for col in self.__cols]
+        self.__moves = [[0.0] * len(col) for col in self.__cols]
+
+        #The first box with a line to its children at or below each box
+        self.__parents = []
+        for col in self.__cols:
+            parents = [None] * len(col)
+            parent = None
+            for indx in range(len(col)-1, -1, -1):
+                if col[indx].line_to:
+                    parent = indx
+                parents[indx] = parent
+            self.__parents.append(parents)
+
+    def __add(self, box, amount):
+        col, indx = self.__index[box]
+        self.__moves[col][indx] += amount
+        tree = self.__trees[col]
+        indx += 1
+        while indx < len(tree):
+            tree[indx] += amount
+            indx += indx & -indx
+
+    def y_cm(self, box):
+        """ The .y_cm of box with all of the moves so far """
+        col, indx = self.__index[box]
+        tree = self.__trees[col]
+        y_cm = box.y_cm
+        indx += 1
+        while indx:
+            y_cm += tree[indx]
+            indx -= indx & -indx
+        return y_cm
+
+    def move_down(self, box, amount):
+        """ Move box and everyone below it in this column down """
+        self.__add(box, amount)
+
+    def move_down_tree(self, box, amount):
+        """ Move box, everyone below it in this column and the children
+        (and childrens children) of the first of them that has any down """
+        while box is not None:
+            self.__add(box, amount)
+            col, indx = self.__index[box]
+            parent = self.__parents[col][indx]
+            if parent is None:
+                break
+            box = self.__cols[col][parent].line_to.end[0]
+
+    def apply(self):
+        """ Write the moves into the .y_cm of the boxes """
+        for col, moves in zip(self.__cols, self.__moves):
+            amount = 0.0
+            for indx, box in enumerate(col):
+                amount += moves[indx]
+                box.y_cm += amount
+        self.__trees = [[0.0] * (len(col) + 1) for col in self.__cols]
+        self.__moves = [[0.0] * len(col) for col in self.__cols]
+
+
 #------------------------------------------------------------------------
 #
 # Class report_options
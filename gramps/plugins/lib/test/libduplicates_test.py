@@ -0,0 +1,90 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the duplicate people matching
+"""
+import os
+import unittest
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import import_as_dict
+from gramps.gen.const import DATA_DIR
+from gramps.gen.lib import Person
+from gramps.gen.user import User
+from .. import libduplicates
+from ..libduplicates import DuplicateFinder
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+class DuplicateFinderTest(unittest.TestCase):
+    """
+    DuplicateFinder tests.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Import example database, with a copy of one person.
+        """
+        cls.db = import_as_dict(EXAMPLE, User())
+        person = cls.db.get_person_from_gramps_id('I0044')
+        cls.original = person.handle
+        copy = Person()
+        copy.set_primary_name(person.get_primary_name())
+        copy.set_gender(person.get_gender())
+        copy.set_birth_ref(person.get_birth_ref())
+        copy.add_event_ref(person.get_birth_ref())
+        with DbTxn("Add copy", cls.db) as trans:
+            cls.db.add_person(copy, trans)
+        cls.copy = copy.handle
+
+    def find(self, workers):
+        finder = DuplicateFinder(self.db, True, workers=workers)
+        finder.extract()
+        the_map = finder.find(0.25)
+        if __debug__:
+            print("%d workers: %d comparisons in %.2fs" %
+                  (workers, finder.compared, finder.elapsed))
+        return the_map
+
+    def test_copy_found(self):
+        """
+        The copy of a person is found as a possible duplicate.
+        """
+        the_map = self.find(1)
+        self.assertIn(self.original, the_map)
+        self.assertEqual(the_map[self.original][0], self.copy)
+
+    def test_pool(self):
+        """
+        The process pool gives the same matches as a single process.
+        """
+        old_threshold = libduplicates.POOL_THRESHOLD
+        libduplicates.POOL_THRESHOLD = 0
+        try:
+            self.assertEqual(self.find(1), self.find(2))
+        finally:
+            libduplicates.POOL_THRESHOLD = old_threshold
+
+
+if __name__ == "__main__":
+    unittest.main()
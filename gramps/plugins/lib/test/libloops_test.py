@@ -0,0 +1,115 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the search of descendance loops
+"""
+import unittest
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.lib import ChildRef, Family, Person
+from ..libloops import find_loops
+
+class FindLoopsTest(unittest.TestCase):
+    """
+    find_loops tests on small trees.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_people(self, count):
+        """ Add count people, return their handles. """
+        with DbTxn('Add people', self.db) as trans:
+            return [self.db.add_person(Person(), trans)
+                    for dummy in range(count)]
+
+    def add_family(self, father, mother, children):
+        """ Add a family, return its handle. """
+        family = Family()
+        family.set_father_handle(father)
+        family.set_mother_handle(mother)
+        for child in children:
+            child_ref = ChildRef()
+            child_ref.set_reference_handle(child)
+            family.add_child_ref(child_ref)
+        with DbTxn('Add family', self.db) as trans:
+            return self.db.add_family(family, trans)
+
+    def assert_loops(self, loops, expected):
+        """
+        Check that each loop is a closed chain of links starting with the
+        closing link, and that loops holds exactly the expected links.
+        """
+        for loop in loops:
+            for link, next_link in zip(loop, loop[1:] + loop[:1]):
+                self.assertEqual(link[1], next_link[0])
+            self.assertEqual(len(loop), len(set(loop)))
+        self.assertEqual(sorted(sorted(loop) for loop in loops),
+                         sorted(sorted(loop) for loop in expected))
+
+    def test_self_parent(self):
+        """
+        A person who is the father of himself.
+        """
+        [person] = self.add_people(1)
+        family = self.add_family(person, None, [person])
+        self.assertEqual(find_loops(self.db), [[(person, person, family)]])
+
+    def test_two_families(self):
+        """
+        Two people who are the father of each other.
+        """
+        father, son = self.add_people(2)
+        family1 = self.add_family(father, None, [son])
+        family2 = self.add_family(son, None, [father])
+        self.assert_loops(find_loops(self.db),
+                          [[(father, son, family1), (son, father, family2)]])
+
+    def test_diamond(self):
+        """
+        Cousins who have a child together make no loop.
+        """
+        father, mother, son, daughter, child = self.add_people(5)
+        self.add_family(father, mother, [son, daughter])
+        self.add_family(son, daughter, [child])
+        steps = []
+        self.assertEqual(find_loops(self.db, lambda: steps.append(1)), [])
+        self.assertEqual(len(steps), 5)
+
+    def test_duplicate_links(self):
+        """
+        The same link, from both parents and with two child references,
+        is reported once.
+        """
+        father, son = self.add_people(2)
+        family1 = self.add_family(father, None, [son])
+        family2 = self.add_family(son, son, [father, father])
+        self.assert_loops(find_loops(self.db),
+                          [[(father, son, family1), (son, father, family2)]])
+
+
+if __name__ == "__main__":
+    unittest.main()
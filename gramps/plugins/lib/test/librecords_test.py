@@ -0,0 +1,158 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the records computation
+"""
+import os
+import unittest
+from functools import partial
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import import_as_dict
+from gramps.gen.const import DATA_DIR
+from gramps.gen.lib import Date
+from gramps.gen.user import User
+from ..librecords import (Records, find_records, _TopList,
+                          CALLNAME_DONTUSE)
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+def _flatten(records):
+    """
+    Return the records in a form that can be compared.
+    """
+    return [(varname, [(sort, str(value), str(name), handle_type, handle)
+                       for (sort, value, name, handle_type, handle) in top])
+            for (text, varname, top) in records]
+
+class TopListTest(unittest.TestCase):
+    """
+    _TopList tests.
+    """
+
+    def test_ties(self):
+        """
+        Entries tying with the last kept one are kept too.
+        """
+        top = _TopList(2, highest=True)
+        for key in (1, 5, 3, 3, 0, 4, 3):
+            top.add(key, key)
+        self.assertEqual(top.get_list(), [5, 4])
+        top = _TopList(2, highest=False)
+        for key in (1, 5, 3, 3, 0, 4, 3):
+            top.add(key, key)
+        self.assertEqual(top.get_list(), [0, 1])
+        top = _TopList(3, highest=False)
+        for key in (1, 5, 3, 3, 0, 4, 3):
+            top.add(key, key)
+        self.assertEqual(top.get_list(), [0, 1, 3, 3, 3])
+
+class RecordsTest(unittest.TestCase):
+    """
+    Records tests.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Import example database.
+        """
+        cls.db = import_as_dict(EXAMPLE, User())
+
+    def test_cache(self):
+        """
+        The records are reused while the database does not change.
+        """
+        records = Records(self.db, None, 3, CALLNAME_DONTUSE)
+        result = records.get_records()
+        self.assertIs(result, records.get_records())
+
+    def test_incremental(self):
+        """
+        Updating the changed objects gives the same records as a full scan.
+        """
+        records = Records(self.db, None, 3, CALLNAME_DONTUSE)
+        records.get_records()
+
+        person = self.db.get_person_from_gramps_id('I0044')
+        birth = self.db.get_event_from_handle(person.get_birth_ref().ref)
+        old_date = Date(birth.get_date_object())
+        birth.set_date_object(Date(1700, 1, 1))
+        with DbTxn("Change birth", self.db) as trans:
+            self.db.commit_event(birth, trans)
+        try:
+            records.changed('Event', [birth.handle])
+            self.assertEqual(
+                _flatten(records.get_records()),
+                _flatten(find_records(self.db, None, 3, CALLNAME_DONTUSE)))
+        finally:
+            birth.set_date_object(old_date)
+            with DbTxn("Restore birth", self.db) as trans:
+                self.db.commit_event(birth, trans)
+        records.changed('Event', [birth.handle])
+        self.assertEqual(
+            _flatten(records.get_records()),
+            _flatten(find_records(self.db, None, 3, CALLNAME_DONTUSE)))
+
+    def test_delete(self):
+        """
+        Deleted people and families are dropped from the records.
+        """
+        db = import_as_dict(EXAMPLE, User())
+        records = Records(db, None, 3, CALLNAME_DONTUSE)
+        result = records.get_records()
+        for obj_type in ('Person', 'Family', 'Event'):
+            for action in ('add', 'update', 'delete'):
+                db.connect('%s-%s' % (obj_type.lower(), action),
+                           partial(records.changed, obj_type))
+        holders = {handle_type: handle
+                   for (text, varname, top) in result
+                   for (sort, value, name, handle_type, handle) in top}
+
+        person = db.get_person_from_handle(holders['Person'])
+        with DbTxn("Remove person", db) as trans:
+            db.delete_person_from_database(person, trans)
+        with DbTxn("Remove family", db) as trans:
+            db.remove_family_relationships(holders['Family'], trans)
+        result = records.get_records()
+        self.assertEqual(_flatten(result),
+                         _flatten(find_records(db, None, 3, CALLNAME_DONTUSE)))
+        handles = [handle for (text, varname, top) in result
+                   for (sort, value, name, handle_type, handle) in top]
+        self.assertNotIn(holders['Person'], handles)
+        self.assertNotIn(holders['Family'], handles)
+
+        # a person removed without updating the families referring to them
+        db.disconnect_all()
+        handle = [handle for (sort, value, name, handle_type, handle)
+                  in result[0][2]][0]
+        with DbTxn("Remove person", db) as trans:
+            db.remove_person(handle, trans)
+        records.changed('Person', [handle])
+        self.assertNotIn(handle, [handle for (text, varname, top)
+                                  in records.get_records()
+                                  for (sort, value, name, handle_type, handle)
+                                  in top])
+
+
+if __name__ == "__main__":
+    unittest.main()
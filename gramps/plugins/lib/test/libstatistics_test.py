@@ -0,0 +1,93 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the columnar statistics extraction
+"""
+import os
+import unittest
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import import_as_dict
+from gramps.gen.const import DATA_DIR
+from gramps.gen.lib import Person
+from gramps.gen.user import User
+from ..libstatistics import get_person_columns
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+class PersonColumnsTest(unittest.TestCase):
+    """
+    PersonColumns tests.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Import example database.
+        """
+        cls.db = import_as_dict(EXAMPLE, User())
+
+    def test_columns(self):
+        """
+        The columns hold the same data as the person objects.
+        """
+        columns = get_person_columns(self.db)
+        self.assertEqual(len(columns), self.db.get_number_of_people())
+        for person in self.db.iter_people():
+            row = columns.index[person.handle]
+            self.assertEqual(columns.gender[row], person.get_gender())
+            birth_ref = person.get_birth_ref()
+            if birth_ref:
+                birth = self.db.get_event_from_handle(birth_ref.ref)
+                self.assertEqual(columns.birth_year[row],
+                                 birth.get_date_object().get_year())
+                self.assertEqual(columns.birth_place[row],
+                                 birth.get_place_handle())
+            else:
+                self.assertIsNone(columns.birth_year[row])
+                self.assertTrue(columns.birth_empty[row])
+            self.assertEqual(columns.family_count[row],
+                             len(person.get_family_handle_list()))
+            self.assertEqual(columns.media_count[row],
+                             len(person.get_media_list()))
+        genders = columns.histogram(columns.gender)
+        self.assertEqual(genders[Person.MALE] + genders[Person.FEMALE] +
+                         genders[Person.UNKNOWN], len(columns))
+
+    def test_cache(self):
+        """
+        The columns are extracted again only when the database changes.
+        """
+        columns = get_person_columns(self.db)
+        self.assertIs(columns, get_person_columns(self.db))
+        person = Person()
+        with DbTxn("Add person", self.db) as trans:
+            self.db.add_person(person, trans)
+        new_columns = get_person_columns(self.db)
+        self.assertIsNot(columns, new_columns)
+        self.assertEqual(len(new_columns), len(columns) + 1)
+        with DbTxn("Remove person", self.db) as trans:
+            self.db.remove_person(person.handle, trans)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026  Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the tree report column moves
+"""
+import random
+import unittest
+from time import perf_counter
+
+from ..libtreebase import BoxBase, LineBase, ColumnMoves
+
+def make_tree(generations, seed, children=(0, 1, 2, 3)):
+    """
+    Make the columns of a synthetic descendant chart.  Each box is linked
+    to the box below it, and parents have a line to their children.
+    """
+    rnd = random.Random(seed)
+    cols = [[BoxBase()]]
+    for dummy in range(generations):
+        col = []
+        for parent in cols[-1]:
+            for dummy in range(rnd.choice(children)):
+                child = BoxBase()
+                if parent.line_to is None:
+                    parent.line_to = LineBase(parent)
+                parent.line_to.add_to(child)
+                col.append(child)
+        if not col:
+            break
+        cols.append(col)
+    for col in cols:
+        for indx, box in enumerate(col):
+            box.y_cm = float(indx)
+            box.linked_box = col[indx+1] if indx+1 < len(col) else None
+    return cols
+
+def move_col(box, amount):
+    """ Move down by walking the column. """
+    while box:
+        box.y_cm += amount
+        box = box.linked_box
+
+def move_tree(box, amount):
+    """ Move down by walking the column and the children. """
+    col = [box]
+    while col:
+        if len(col) == 1 and col[0].line_to:
+            col.append(col[0].line_to.end[0])
+        col[0].y_cm += amount
+        col[0] = col[0].linked_box
+        if col[0] is None:
+            col.pop(0)
+
+def make_moves(cols, seed):
+    """
+    Moves from right to left, top to bottom, as the descendant chart
+    makes them.
+    """
+    rnd = random.Random(seed)
+    moves = []
+    for col in reversed(cols):
+        for box in col:
+            if rnd.random() < 0.3:
+                moves.append((box, rnd.random(), rnd.random() < 0.5))
+    return moves
+
+class ColumnMovesTest(unittest.TestCase):
+    """
+    ColumnMoves tests.
+    """
+
+    def test_same_as_walking(self):
+        """
+        The moves give the same .y_cm as walking down the columns.
+        """
+        walked = make_tree(8, 1)
+        moved = make_tree(8, 1)
+        boxes = [box for col in moved for box in col]
+        column_moves = ColumnMoves(boxes)
+        pairs = list(zip([box for col in walked for box in col], boxes))
+        for (box, amount, tree), (other, dummy, dummy) in zip(
+                make_moves(walked, 2), make_moves(moved, 2)):
+            if tree:
+                move_tree(box, amount)
+                column_moves.move_down_tree(other, amount)
+            else:
+                move_col(box, amount)
+                column_moves.move_down(other, amount)
+            self.assertAlmostEqual(column_moves.y_cm(other), box.y_cm)
+        column_moves.apply()
+        for box, other in pairs:
+            self.assertAlmostEqual(other.y_cm, box.y_cm)
+
+    def test_linked_boxes_found(self):
+        """
+        Boxes that are only linked to, like place holders, are moved too.
+        """
+        cols = make_tree(3, 3)
+        last = cols[-1][-1]
+        holder = BoxBase()
+        holder.y_cm = last.y_cm + 1
+        holder.linked_box = None
+        last.linked_box = holder
+        boxes = [box for col in cols for box in col]
+        column_moves = ColumnMoves(boxes)
+        column_moves.move_down(cols[-1][0], 2.0)
+        self.assertEqual(column_moves.y_cm(holder), last.y_cm + 3)
+        column_moves.apply()
+        self.assertEqual(holder.y_cm, last.y_cm + 1)
+
+    def test_deep_tree(self):
+        """
+        Time the moves on a deep tree.
+        """
+        cols = make_tree(16, 4, (1, 2, 2, 2))
+        boxes = [box for col in cols for box in col]
+        moves = make_moves(cols, 5)
+        stime = perf_counter()
+        column_moves = ColumnMoves(boxes)
+        for box, amount, tree in moves:
+            if tree:
+                column_moves.move_down_tree(box, amount)
+            else:
+                column_moves.move_down(box, amount)
+        column_moves.apply()
+        if __debug__:
+            print("%d boxes, %d moves in %.2fs" %
+                  (len(boxes), len(moves), perf_counter() - stime))
+        self.assertGreater(cols[-1][-1].y_cm, len(cols[-1]) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,7 +48,7 @@ from gramps.gen.plug.docgen import (IndexMark, FontStyle, ParagraphStyle,
                                     FONT_SANS_SERIF, INDEX_TYPE_TOC,
                                     PARA_ALIGN_CENTER)
 from gramps.gen.utils.file import media_path_full
-from gramps.gen.datehandler import get_date
+from gramps.plugins.lib.libstatistics import get_person_columns
 from gramps.gen.proxy import CacheProxyDb
 
 #------------------------------------------------------------------------
@@ -100,68 +100,24 @@ class SummaryReport(Report):
         """
         Write a summary of all the people in the database.
         """
-        with_media = 0
-        incomp_names = 0
-        disconnected = 0
-        missing_bday = 0
-        males = 0
-        females = 0
-        unknowns = 0
-        namelist = []
-
         self.doc.start_paragraph("SR-Heading")
         self.doc.write_text(self._("Individuals"))
         self.doc.end_paragraph()
 
-        num_people = 0
-        for person in self.__db.iter_people():
-            num_people += 1
-            primary_names = [person.get_primary_name()]
-
-            # Count people with media.
-            length = len(person.get_media_list())
-            if length > 0:
-                with_media += 1
-
-            # Count people with incomplete names.
-            for name in primary_names + person.get_alternate_names():
-                if name.get_first_name().strip() == "":
-                    incomp_names += 1
-                else:
-                    if name.get_surname_list():
-                        for surname in name.get_surname_list():
-                            if surname.get_surname().strip() == "":
-                                incomp_names += 1
-                    else:
-                        incomp_names += 1
-
-            # Count people without families.
-            if (not person.get_main_parents_family_handle() and
-                    not len(person.get_family_handle_list())):
-                disconnected += 1
-
-            # Count missing birthdays.
-            birth_ref = person.get_birth_ref()
-            if birth_ref:
-                birth = self.__db.get_event_from_handle(birth_ref.ref)
-                if not get_date(birth):
-                    missing_bday += 1
-            else:
-                missing_bday += 1
-
-            # Count genders.
-            if person.get_gender() == Person.FEMALE:
-                females += 1
-            elif person.get_gender() == Person.MALE:
-                males += 1
-            else:
-                unknowns += 1
-
-            # Count unique surnames
-            for name in primary_names + person.get_alternate_names():
-                if (not name.get_surname().strip() in namelist
-                        and not name.get_surname().strip() == ""):
-                    namelist.append(name.get_surname().strip())
+        columns = get_person_columns(self.__db)
+        num_people = len(columns)
+        with_media = sum(1 for count in columns.media_count if count > 0)
+        incomp_names = sum(columns.incomplete_names)
+        disconnected = sum(columns.disconnected)
+        missing_bday = sum(columns.birth_empty)
+        genders = columns.histogram(columns.gender)
+        males = genders[Person.MALE]
+        females = genders[Person.FEMALE]
+        unknowns = num_people - males - females
+        namelist = set()
+        for surnames in columns.surnames:
+            namelist.update(surnames)
+        namelist.discard("")
 
         self.doc.start_paragraph("SR-Normal")
         self.doc.write_text(self._("Number of individuals: %d") % num_people)
@@ -80,6 +80,12 @@ from gramps.gen.errors import HandleError
 strip_dict = dict.fromkeys(list(range(9)) + list(range(11, 13)) +
                            list(range(14, 32)), " ")
 
+# classes of the primary objects, by class name
+PRIMARY_CLASSES = {'Person': Person, 'Family': Family, 'Event': Event,
+                   'Place': Place, 'Source': Source, 'Citation': Citation,
+                   'Repository': Repository, 'Media': Media, 'Note': Note,
+                   'Tag': Tag}
+
 
 class ProgressMeter:
     def __init__(self, *args, **kwargs):
@@ -191,12 +197,12 @@ class Check(tool.BatchTool):
             # then. This is done before fixing encoding and missing photos,
             # since otherwise we will be trying to fix empty records which are
             # then going to be deleted.
-            checker.cleanup_empty_objects()
-            checker.fix_encoding()
-            checker.fix_alt_place_names()
-            checker.fix_ctrlchars_in_notes()
-            checker.cleanup_missing_photos(cli)
-            checker.cleanup_deleted_name_formats()
+            checker.timed_pass(checker.cleanup_empty_objects)
+            checker.timed_pass(checker.fix_encoding)
+            checker.timed_pass(checker.fix_alt_place_names)
+            checker.timed_pass(checker.fix_ctrlchars_in_notes)
+            checker.timed_pass(checker.cleanup_missing_photos, cli)
+            checker.timed_pass(checker.cleanup_deleted_name_formats)
 
             prev_total = -1
             total = 0
@@ -204,32 +210,32 @@ class Check(tool.BatchTool):
             while prev_total != total:
                 prev_total = total
 
-                checker.check_for_broken_family_links()
-                checker.check_parent_relationships()
-                checker.cleanup_empty_families(cli)
-                checker.cleanup_duplicate_spouses()
+                checker.timed_pass(checker.check_for_broken_family_links)
+                checker.timed_pass(checker.check_parent_relationships)
+                checker.timed_pass(checker.cleanup_empty_families, cli)
+                checker.timed_pass(checker.cleanup_duplicate_spouses)
 
                 total = checker.family_errors()
 
-            checker.fix_duplicated_grampsid()
-            checker.check_events()
-            checker.check_person_references()
-            checker.check_family_references()
-            checker.check_place_references()
-            checker.check_source_references()
-            checker.check_citation_references()
-            checker.check_media_references()
-            checker.check_repo_references()
-            checker.check_note_references()
-            checker.check_tag_references()
-            checker.check_checksum()
-            checker.check_media_sourceref()
+            checker.timed_pass(checker.fix_duplicated_grampsid)
+            checker.timed_pass(checker.check_events)
+            checker.timed_pass(checker.check_person_references)
+            checker.timed_pass(checker.check_family_references)
+            checker.timed_pass(checker.check_place_references)
+            checker.timed_pass(checker.check_source_references)
+            checker.timed_pass(checker.check_citation_references)
+            checker.timed_pass(checker.check_media_references)
+            checker.timed_pass(checker.check_repo_references)
+            checker.timed_pass(checker.check_note_references)
+            checker.timed_pass(checker.check_tag_references)
+            checker.timed_pass(checker.check_checksum)
+            checker.timed_pass(checker.check_media_sourceref)
 
         # for bsddb the check_backlinks doesn't work in 'batch' mode because
         # the table used for backlinks is closed.
         with DbTxn(_("Check Backlink Integrity"), self.db,
                    batch=False) as checker.trans:
-            checker.check_backlinks()
+            checker.timed_pass(checker.check_backlinks)
 
         # rebuilding reference maps needs to be done outside of a transaction
         # to avoid nesting transactions.
@@ -1241,284 +1247,294 @@ class CheckIntegrity:
                                ' (1)', total)
         logging.info('Looking for backlink reference problems')
 
-        # dict of object handles indexed by forward link created here
-        my_blinks = defaultdict(list)
-        my_items = 0  # count of my backlinks for progress meter
-        # dict of object handles indexed by forward link from db
-        db_blinks = {}
-        db_items = 0  # count of db backlinks for progress meter
-
-        # first we assemble our own backlinks table, and while we have the
-        # handle, gather up a second table with the db's backlinks
+        # set of (referenced object, referencing object) pairs, built from
+        # the objects themselves, and set of all the objects
+        my_links = set()
+        objects = set()
         for obj_class in CLASS_TO_KEY_MAP.keys():
-            for handle in self.db.method("iter_%s_handles", obj_class)():
-                self.progress.step()
-                blinks = list(self.db.find_backlink_handles(handle))
-                db_blinks[(obj_class, handle)] = blinks
-                db_items += len(blinks)
-                pri_obj = self.db.method('get_%s_from_handle',
-                                         obj_class)(handle)
-                handle_list = pri_obj.get_referenced_handles_recursively()
-                my_items += len(handle_list)
-
-                for item in handle_list:
-                    my_blinks[item].append((obj_class, handle))
-
-        # Now we go through our backlinks and the dbs table comparing them
-        # check that each real reference has a backlink in the db table
+            for obj in self._iter_objects(obj_class):
+                item = (obj_class, obj.handle)
+                objects.add(item)
+                for key in obj.get_referenced_handles_recursively():
+                    my_links.add((key, item))
+
+        # the same pairs, as stored in the reference table of the db
         self.progress.set_pass(_('Looking for backlink reference problems') +
-                               ' (2)', my_items)
-        for key, blinks in my_blinks.items():
-            for item in blinks:
+                               ' (2)', len(objects))
+        try:
+            db_links = set()
+            for (obj_class, obj_handle,
+                 ref_class, ref_handle) in self.db.iter_references():
+                db_links.add(((ref_class, ref_handle), (obj_class, obj_handle)))
+        except NotImplementedError:
+            db_links = set()
+            for key in objects:
                 self.progress.step()
-                if key not in db_blinks:
-                    # object has reference to something not in db;
-                    # should have been found in previous checks
-                    logging.warning('    Fail: reference to an object %(obj)s'
-                                    ' not in the db by %(ref)s!',
-                                    {'obj': key, 'ref': item})
-                    continue
-                if item not in db_blinks[key]:
-                    # Object has reference with no cooresponding backlink
-                    self.bad_backlinks += 1
-                    pri_obj = self.db.method('get_%s_from_handle',
-                                             key[0])(key[1])
-                    logging.warning('    FAIL: the "%(cls)s" [%(gid)s] '
-                                    'has a "%(cls2)s" reference'
-                                    ' with no corresponding backlink.',
-                                    {'gid': pri_obj.gramps_id,
-                                     'cls': key[0], 'cls2': item[0]})
-
-        # Now we go through the db table and make checks against ours
+                for item in self.db.find_backlink_handles(key[1]):
+                    db_links.add((key, item))
+
+        # check that each real reference has a backlink in the db table
+        for key, item in my_links:
+            if key not in objects:
+                # object has reference to something not in db;
+                # should have been found in previous checks
+                logging.warning('    Fail: reference to an object %(obj)s'
+                                ' not in the db by %(ref)s!',
+                                {'obj': key, 'ref': item})
+        for key, item in my_links - db_links:
+            if key not in objects:
+                continue
+            # Object has reference with no cooresponding backlink
+            self.bad_backlinks += 1
+            pri_obj = self.db.method('get_%s_from_handle', key[0])(key[1])
+            logging.warning('    FAIL: the "%(cls)s" [%(gid)s] '
+                            'has a "%(cls2)s" reference'
+                            ' with no corresponding backlink.',
+                            {'gid': pri_obj.gramps_id,
+                             'cls': key[0], 'cls2': item[0]})
+
         # Check for db backlinks that don't have a reference object at all
-        self.progress.set_pass(_('Looking for backlink reference problems') +
-                               ' (3)', db_items)
-        for key, blinks in db_blinks.items():
-            for item in blinks:
-                self.progress.step()
-                if item not in db_blinks:
-                    # backlink to object entirely missing
-                    self.bad_backlinks += 1
-                    pri_obj = self.db.method('get_%s_from_handle',
-                                             key[0])(key[1])
-                    logging.warning('    FAIL: the "%(cls)s" [%(gid)s] '
-                                    'has a backlink to a missing'
-                                    ' "%(cls2)s" object.',
-                                    {'gid': pri_obj.gramps_id,
-                                     'cls': key[0], 'cls2': item[0]})
-                    continue
-                # Check if the object has a reference to the backlinked one
-                if key not in my_blinks or item not in my_blinks[key]:
-                    # backlink to object which doesn't have reference
-                    self.bad_backlinks += 1
-                    pri_obj = self.db.method('get_%s_from_handle',
-                                             key[0])(key[1])
-                    logging.warning('    FAIL: the "%(cls)s" [%(gid)s] '
-                                    'has a backlink to a "%(cls2)s"'
-                                    ' with no corresponding reference.',
-                                    {'gid': pri_obj.gramps_id,
-                                     'cls': key[0], 'cls2': item[0]})
+        for key, item in db_links - my_links:
+            if key not in objects:
+                continue
+            self.bad_backlinks += 1
+            pri_obj = self.db.method('get_%s_from_handle', key[0])(key[1])
+            if item not in objects:
+                # backlink to object entirely missing
+                logging.warning('    FAIL: the "%(cls)s" [%(gid)s] '
+                                'has a backlink to a missing'
+                                ' "%(cls2)s" object.',
+                                {'gid': pri_obj.gramps_id,
+                                 'cls': key[0], 'cls2': item[0]})
+            else:
+                # backlink to object which doesn't have reference
+                logging.warning('    FAIL: the "%(cls)s" [%(gid)s] '
+                                'has a backlink to a "%(cls2)s"'
+                                ' with no corresponding reference.',
+                                {'gid': pri_obj.gramps_id,
+                                 'cls': key[0], 'cls2': item[0]})
 
     def callback(self, *args):
         self.progress.step()
 
+    def timed_pass(self, check, *args):
+        """
+        Run one of the checks, and log the time it took.
+        """
+        start = time.perf_counter()
+        result = check(*args)
+        logging.info('    %(name)s: %(time).2f seconds',
+                     {'name': check.__name__,
+                      'time': time.perf_counter() - start})
+        return result
+
+    def _iter_objects(self, obj_class):
+        """
+        Return an iterator over all the objects of obj_class, read with one
+        cursor. The progress meter is stepped for each object.
+
+        The objects must not be committed while the cursor is open, the
+        passes collect the objects to change and commit them afterwards.
+        """
+        cls = PRIMARY_CLASSES[obj_class]
+        with self.db.method('get_%s_cursor', obj_class)() as cursor:
+            for dummy, data in cursor:
+                self.progress.step()
+                yield cls.create(data)
+
+    def _check_handle_references(self, ref_class, known_handles, obj_classes,
+                                 invalid):
+        """
+        Look for references to objects of ref_class which are not in the set
+        known_handles, in all the objects of obj_classes. Null references are
+        replaced by new handles. The handles of the missing objects are added
+        to the set invalid.
+        """
+        replace = 'replace_%s_references' % ref_class.lower()
+        for obj_class in obj_classes:
+            fixed = []
+            for obj in self._iter_objects(obj_class):
+                for item in obj.get_referenced_handles_recursively():
+                    if item[0] == ref_class:
+                        if not item[1]:
+                            new_handle = create_id()
+                            getattr(obj, replace)(None, new_handle)
+                            if not fixed or fixed[-1] is not obj:
+                                fixed.append(obj)
+                            invalid.add(new_handle)
+                        elif item[1] not in known_handles:
+                            invalid.add(item[1])
+            commit = self.db.method('commit_%s', obj_class)
+            for obj in fixed:
+                commit(obj, self.trans)
+
     def check_person_references(self):
         '''Looking for person reference problems'''
-        plist = self.db.get_person_handles()
+        known_handles = set(self.db.iter_person_handles())
 
         self.progress.set_pass(_('Looking for person reference problems'),
-                               len(plist))
+                               len(known_handles))
         logging.info('Looking for person reference problems')
 
-        for key in plist:
-            self.progress.step()
+        fixed = []
+        missing = []
+        for person in self._iter_objects('Person'):
             none_handle = False
-            newlist = []
-            person = self.db.get_person_from_handle(key)
             for pref in person.get_person_ref_list():
-                newlist.append(pref)
                 if not pref.ref:
                     none_handle = True
                     pref.ref = create_id()
-                try:
-                    self.db.get_person_from_handle(pref.ref)
-                except HandleError:
+                if pref.ref not in known_handles:
                     # The referenced person does not exist in the database
-                    make_unknown(pref.ref, self.explanation.handle,
-                                 self.class_person, self.commit_person,
-                                 self.trans)
-                    self.invalid_person_references.add(key)
+                    known_handles.add(pref.ref)
+                    missing.append(pref.ref)
+                    self.invalid_person_references.add(person.handle)
             if none_handle:
-                person.set_person_ref_list(newlist)
-                self.db.commit_person(person, self.trans)
+                fixed.append(person)
+        for person in fixed:
+            self.db.commit_person(person, self.trans)
+        for handle in missing:
+            make_unknown(handle, self.explanation.handle,
+                         self.class_person, self.commit_person, self.trans)
 
         if len(self.invalid_person_references) == 0:
             logging.info('    OK: no event problems found')
 
     def check_family_references(self):
         '''Looking for family reference problems'''
-        plist = self.db.get_person_handles()
+        known_handles = set(self.db.iter_family_handles())
 
         self.progress.set_pass(_('Looking for family reference problems'),
-                               len(plist))
+                               self.db.get_number_of_people())
         logging.info('Looking for family reference problems')
 
-        for key in plist:
-            self.progress.step()
-            person = self.db.get_person_from_handle(key)
+        missing = []
+        for person in self._iter_objects('Person'):
             for ordinance in person.get_lds_ord_list():
                 family_handle = ordinance.get_family_handle()
-                if family_handle:
-                    try:
-                        self.db.get_family_from_handle(family_handle)
-                    except HandleError:
-                        # The referenced family does not exist in the database
-                        make_unknown(family_handle, self.explanation.handle,
-                                     self.class_family, self.commit_family,
-                                     self.trans, db=self.db)
-                        self.invalid_family_references.add(key)
+                if family_handle and family_handle not in known_handles:
+                    # The referenced family does not exist in the database
+                    known_handles.add(family_handle)
+                    missing.append(family_handle)
+                    self.invalid_family_references.add(person.handle)
+        for handle in missing:
+            make_unknown(handle, self.explanation.handle,
+                         self.class_family, self.commit_family,
+                         self.trans, db=self.db)
 
         if len(self.invalid_family_references) == 0:
             logging.info('    OK: no event problems found')
 
     def check_repo_references(self):
         '''Looking for repository reference problems'''
-        slist = self.db.get_source_handles()
+        known_handles = set(self.db.iter_repository_handles())
 
         self.progress.set_pass(_('Looking for repository reference problems'),
-                               len(slist))
+                               self.db.get_number_of_sources())
         logging.info('Looking for repository reference problems')
 
-        for key in slist:
-            self.progress.step()
+        fixed = []
+        missing = []
+        for source in self._iter_objects('Source'):
             none_handle = False
-            newlist = []
-            source = self.db.get_source_from_handle(key)
             for reporef in source.get_reporef_list():
-                newlist.append(reporef)
                 if not reporef.ref:
                     none_handle = True
                     reporef.ref = create_id()
-                try:
-                    self.db.get_repository_from_handle(reporef.ref)
-                except HandleError:
+                if reporef.ref not in known_handles:
                     # The referenced repository does not exist in the database
-                    make_unknown(reporef.ref, self.explanation.handle,
-                                 self.class_repo, self.commit_repo, self.trans)
-                    self.invalid_repo_references.add(key)
+                    known_handles.add(reporef.ref)
+                    missing.append(reporef.ref)
+                    self.invalid_repo_references.add(source.handle)
             if none_handle:
-                source.set_reporef_list(newlist)
-                self.db.commit_source(source, self.trans)
+                fixed.append(source)
+        for source in fixed:
+            self.db.commit_source(source, self.trans)
+        for handle in missing:
+            make_unknown(handle, self.explanation.handle,
+                         self.class_repo, self.commit_repo, self.trans)
 
         if len(self.invalid_repo_references) == 0:
             logging.info('    OK: no repository reference problems found')
 
     def check_place_references(self):
         '''Looking for place reference problems'''
-        plist = self.db.get_person_handles()
-        flist = self.db.get_family_handles()
-        elist = self.db.get_event_handles()
-        llist = self.db.get_place_handles()
+        known_handles = set(self.db.iter_place_handles())
         self.progress.set_pass(
             _('Looking for place reference problems'),
-            len(elist) + len(plist) + len(flist) + len(llist))
+            self.db.get_number_of_events() + self.db.get_number_of_people() +
+            self.db.get_number_of_families() + len(known_handles))
         logging.info('Looking for place reference problems')
 
-        for key in llist:
-            self.progress.step()
+        missing = []
+
+        def check(obj, place_handle, message):
+            """
+            Record the place handle if it is missing.
+            """
+            if place_handle not in known_handles:
+                # The referenced place does not exist in the database
+                known_handles.add(place_handle)
+                missing.append(place_handle)
+                logging.warning(message, {'gid': obj.gramps_id,
+                                          'hand': place_handle})
+                self.invalid_place_references.add(obj.handle)
+
+        fixed = []
+        for place in self._iter_objects('Place'):
             none_handle = False
-            newlist = []
-            place = self.db.get_place_from_handle(key)
             for placeref in place.get_placeref_list():
-                newlist.append(placeref)
                 if not placeref.ref:
                     none_handle = True
                     placeref.ref = create_id()
-                try:
-                    self.db.get_place_from_handle(placeref.ref)
-                except HandleError:
-                    # The referenced place does not exist in the database
-                    make_unknown(placeref.ref, self.explanation.handle,
-                                 self.class_place, self.commit_place,
-                                 self.trans)
-                    logging.warning('    FAIL: the place "%(gid)s" refers '
-                                    'to a parent place "%(hand)s" which '
-                                    'does not exist in the database',
-                                    {'gid': place.gramps_id,
-                                     'hand': placeref.ref})
-                    self.invalid_place_references.add(key)
+                check(place, placeref.ref,
+                      '    FAIL: the place "%(gid)s" refers '
+                      'to a parent place "%(hand)s" which '
+                      'does not exist in the database')
             if none_handle:
-                place.set_placeref_list(newlist)
-                self.db.commit_place(place, self.trans)
+                fixed.append(place)
+        for place in fixed:
+            self.db.commit_place(place, self.trans)
 
         # check persons -> the LdsOrd references a place
-        for key in plist:
-            self.progress.step()
-            person = self.db.get_person_from_handle(key)
+        for person in self._iter_objects('Person'):
             for ordinance in person.lds_ord_list:
                 place_handle = ordinance.get_place_handle()
                 if place_handle:
-                    try:
-                        place = self.db.get_place_from_handle(place_handle)
-                    except HandleError:
-                        # The referenced place does not exist in the database
-                        # This is tested by TestcaseGenerator person "Broken17"
-                        # This is tested by TestcaseGenerator person "Broken18"
-                        make_unknown(place_handle, self.explanation.handle,
-                                     self.class_place, self.commit_place,
-                                     self.trans)
-                        logging.warning('    FAIL: the person "%(gid)s" refers'
-                                        ' to an LdsOrd place "%(hand)s" which '
-                                        'does not exist in the database',
-                                        {'gid': person.gramps_id,
-                                         'hand': place_handle})
-                        self.invalid_place_references.add(key)
+                    # This is tested by TestcaseGenerator person "Broken17"
+                    # This is tested by TestcaseGenerator person "Broken18"
+                    check(person, place_handle,
+                          '    FAIL: the person "%(gid)s" refers'
+                          ' to an LdsOrd place "%(hand)s" which '
+                          'does not exist in the database')
         # check families -> the LdsOrd references a place
-        for key in flist:
-            self.progress.step()
-            family = self.db.get_family_from_handle(key)
+        for family in self._iter_objects('Family'):
             for ordinance in family.lds_ord_list:
                 place_handle = ordinance.get_place_handle()
                 if place_handle:
-                    try:
-                        place = self.db.get_place_from_handle(place_handle)
-                    except HandleError:
-                        # The referenced place does not exist in the database
-                        make_unknown(place_handle, self.explanation.handle,
-                                     self.class_place, self.commit_place,
-                                     self.trans)
-                        logging.warning('    FAIL: the family "%(gid)s" refers'
-                                        ' to an LdsOrd place "%(hand)s" which '
-                                        'does not exist in the database',
-                                        {'gid': family.gramps_id,
-                                         'hand': place_handle})
-                        self.invalid_place_references.add(key)
+                    check(family, place_handle,
+                          '    FAIL: the family "%(gid)s" refers'
+                          ' to an LdsOrd place "%(hand)s" which '
+                          'does not exist in the database')
         # check events
-        for key in elist:
-            self.progress.step()
-            event = self.db.get_event_from_handle(key)
+        for event in self._iter_objects('Event'):
             place_handle = event.get_place_handle()
             if place_handle:
-                try:
-                    place = self.db.get_place_from_handle(place_handle)
-                except HandleError:
-                    # The referenced place does not exist in the database
-                    make_unknown(place_handle, self.explanation.handle,
-                                 self.class_place, self.commit_place,
-                                 self.trans)
-                    logging.warning('    FAIL: the event "%(gid)s" refers '
-                                    'to an LdsOrd place "%(hand)s" which '
-                                    'does not exist in the database',
-                                    {'gid': event.gramps_id,
-                                     'hand': place_handle})
-                    self.invalid_place_references.add(key)
+                check(event, place_handle,
+                      '    FAIL: the event "%(gid)s" refers '
+                      'to an LdsOrd place "%(hand)s" which '
+                      'does not exist in the database')
+
+        for handle in missing:
+            make_unknown(handle, self.explanation.handle,
+                         self.class_place, self.commit_place, self.trans)
 
         if len(self.invalid_place_references) == 0:
             logging.info('    OK: no place reference problems found')
 
     def check_citation_references(self):
         '''Looking for citation reference problems'''
-        known_handles = self.db.get_citation_handles()
+        known_handles = set(self.db.iter_citation_handles())
 
         total = (
             self.db.get_number_of_people() +
@@ -1535,104 +1551,11 @@ class CheckIntegrity:
                                total)
         logging.info('Looking for citation reference problems')
 
-        for handle in self.db.get_person_handles():
-            self.progress.step()
-            person = self.db.get_person_from_handle(handle)
-            handle_list = person.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Citation':
-                    if not item[1]:
-                        new_handle = create_id()
-                        person.replace_citation_references(None, new_handle)
-                        self.db.commit_person(person, self.trans)
-                        self.invalid_citation_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_citation_references.add(item[1])
-
-        for handle in self.db.get_family_handles():
-            self.progress.step()
-            family = self.db.get_family_from_handle(handle)
-            handle_list = family.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Citation':
-                    if not item[1]:
-                        new_handle = create_id()
-                        family.replace_citation_references(None, new_handle)
-                        self.db.commit_family(family, self.trans)
-                        self.invalid_citation_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_citation_references.add(item[1])
-
-        for handle in self.db.get_place_handles():
-            self.progress.step()
-            place = self.db.get_place_from_handle(handle)
-            handle_list = place.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Citation':
-                    if not item[1]:
-                        new_handle = create_id()
-                        place.replace_citation_references(None, new_handle)
-                        self.db.commit_place(place, self.trans)
-                        self.invalid_citation_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_citation_references.add(item[1])
-
-        for handle in self.db.get_citation_handles():
-            self.progress.step()
-            citation = self.db.get_citation_from_handle(handle)
-            handle_list = citation.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Citation':
-                    if not item[1]:
-                        new_handle = create_id()
-                        citation.replace_citation_references(None, new_handle)
-                        self.db.commit_citation(citation, self.trans)
-                        self.invalid_citation_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_citation_references.add(item[1])
-
-        for handle in self.db.get_repository_handles():
-            self.progress.step()
-            repository = self.db.get_repository_from_handle(handle)
-            handle_list = repository.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Citation':
-                    if not item[1]:
-                        new_handle = create_id()
-                        repository.replace_citation_references(None,
-                                                               new_handle)
-                        self.db.commit_repository(repository, self.trans)
-                        self.invalid_citation_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_citation_references.add(item[1])
-
-        for handle in self.db.get_media_handles():
-            self.progress.step()
-            obj = self.db.get_media_from_handle(handle)
-            handle_list = obj.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Citation':
-                    if not item[1]:
-                        new_handle = create_id()
-                        obj.replace_citation_references(None, new_handle)
-                        self.db.commit_media(obj, self.trans)
-                        self.invalid_citation_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_citation_references.add(item[1])
-
-        for handle in self.db.get_event_handles():
-            self.progress.step()
-            event = self.db.get_event_from_handle(handle)
-            handle_list = event.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Citation':
-                    if not item[1]:
-                        new_handle = create_id()
-                        event.replace_citation_references(None, new_handle)
-                        self.db.commit_event(event, self.trans)
-                        self.invalid_citation_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_citation_references.add(item[1])
+        self._check_handle_references(
+            'Citation', known_handles,
+            ('Person', 'Family', 'Place', 'Citation', 'Repository', 'Media',
+             'Event'),
+            self.invalid_citation_references)
 
         for bad_handle in self.invalid_citation_references:
             created = make_unknown(bad_handle, self.explanation.handle,
@@ -1648,39 +1571,40 @@ class CheckIntegrity:
 
     def check_source_references(self):
         '''Looking for source reference problems'''
-        clist = self.db.get_citation_handles()
+        known_handles = set(self.db.iter_source_handles())
         self.progress.set_pass(_('Looking for source reference problems'),
-                               len(clist))
+                               self.db.get_number_of_citations())
         logging.info('Looking for source reference problems')
 
-        for key in clist:
-            self.progress.step()
-            citation = self.db.get_citation_from_handle(key)
+        fixed = []
+        missing = []
+        for citation in self._iter_objects('Citation'):
             source_handle = citation.get_reference_handle()
             if not source_handle:
                 source_handle = create_id()
                 citation.set_reference_handle(source_handle)
-                self.db.commit_citation(citation, self.trans)
-            if source_handle:
-                try:
-                    self.db.get_source_from_handle(source_handle)
-                except HandleError:
-                    # The referenced source does not exist in the database
-                    make_unknown(source_handle, self.explanation.handle,
-                                 self.class_source, self.commit_source,
-                                 self.trans)
-                    logging.warning('    FAIL: the citation "%(gid)s" refers '
-                                    'to source "%(hand)s" which does not exist'
-                                    ' in the database',
-                                    {'gid': citation.gramps_id,
-                                     'hand': source_handle})
-                    self.invalid_source_references.add(key)
+                fixed.append(citation)
+            if source_handle not in known_handles:
+                # The referenced source does not exist in the database
+                known_handles.add(source_handle)
+                missing.append(source_handle)
+                logging.warning('    FAIL: the citation "%(gid)s" refers '
+                                'to source "%(hand)s" which does not exist'
+                                ' in the database',
+                                {'gid': citation.gramps_id,
+                                 'hand': source_handle})
+                self.invalid_source_references.add(citation.handle)
+        for citation in fixed:
+            self.db.commit_citation(citation, self.trans)
+        for handle in missing:
+            make_unknown(handle, self.explanation.handle,
+                         self.class_source, self.commit_source, self.trans)
         if len(self.invalid_source_references) == 0:
             logging.info('   OK: no source reference problems found')
 
     def check_media_references(self):
         '''Looking for media object reference problems'''
-        known_handles = self.db.get_media_handles(False)
+        known_handles = set(self.db.iter_media_handles())
 
         total = (
             self.db.get_number_of_people() +
@@ -1695,89 +1619,10 @@ class CheckIntegrity:
                                  'problems'), total)
         logging.info('Looking for media object reference problems')
 
-        for handle in self.db.get_person_handles():
-            self.progress.step()
-            person = self.db.get_person_from_handle(handle)
-            handle_list = person.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Media':
-                    if not item[1]:
-                        new_handle = create_id()
-                        person.replace_media_references(None, new_handle)
-                        self.db.commit_person(person, self.trans)
-                        self.invalid_media_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_media_references.add(item[1])
-
-        for handle in self.db.get_family_handles():
-            self.progress.step()
-            family = self.db.get_family_from_handle(handle)
-            handle_list = family.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Media':
-                    if not item[1]:
-                        new_handle = create_id()
-                        family.replace_media_references(None, new_handle)
-                        self.db.commit_family(family, self.trans)
-                        self.invalid_media_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_media_references.add(item[1])
-
-        for handle in self.db.get_place_handles():
-            self.progress.step()
-            place = self.db.get_place_from_handle(handle)
-            handle_list = place.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Media':
-                    if not item[1]:
-                        new_handle = create_id()
-                        place.replace_media_references(None, new_handle)
-                        self.db.commit_place(place, self.trans)
-                        self.invalid_media_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_media_references.add(item[1])
-
-        for handle in self.db.get_event_handles():
-            self.progress.step()
-            event = self.db.get_event_from_handle(handle)
-            handle_list = event.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Media':
-                    if not item[1]:
-                        new_handle = create_id()
-                        event.replace_media_references(None, new_handle)
-                        self.db.commit_event(event, self.trans)
-                        self.invalid_media_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_media_references.add(item[1])
-
-        for handle in self.db.get_citation_handles():
-            self.progress.step()
-            citation = self.db.get_citation_from_handle(handle)
-            handle_list = citation.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Media':
-                    if not item[1]:
-                        new_handle = create_id()
-                        citation.replace_media_references(None, new_handle)
-                        self.db.commit_citation(citation, self.trans)
-                        self.invalid_media_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_media_references.add(item[1])
-
-        for handle in self.db.get_source_handles():
-            self.progress.step()
-            source = self.db.get_source_from_handle(handle)
-            handle_list = source.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Media':
-                    if not item[1]:
-                        new_handle = create_id()
-                        source.replace_media_references(None, new_handle)
-                        self.db.commit_source(source, self.trans)
-                        self.invalid_media_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_media_references.add(item[1])
+        self._check_handle_references(
+            'Media', known_handles,
+            ('Person', 'Family', 'Place', 'Event', 'Citation', 'Source'),
+            self.invalid_media_references)
 
         for bad_handle in self.invalid_media_references:
             make_unknown(bad_handle, self.explanation.handle, self.class_media,
@@ -1802,7 +1647,7 @@ class CheckIntegrity:
         if missing_references:
             self.db.add_note(self.explanation, self.trans, set_gid=True)
 
-        known_handles = self.db.get_note_handles()
+        known_handles = set(self.db.iter_note_handles())
 
         total = (self.db.get_number_of_people() +
                  self.db.get_number_of_families() +
@@ -1817,117 +1662,11 @@ class CheckIntegrity:
                                total)
         logging.info('Looking for note reference problems')
 
-        for handle in self.db.get_person_handles():
-            self.progress.step()
-            person = self.db.get_person_from_handle(handle)
-            handle_list = person.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        person.replace_note_references(None, new_handle)
-                        self.db.commit_person(person, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
-
-        for handle in self.db.get_family_handles():
-            self.progress.step()
-            family = self.db.get_family_from_handle(handle)
-            handle_list = family.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        family.replace_note_references(None, new_handle)
-                        self.db.commit_family(family, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
-
-        for handle in self.db.get_place_handles():
-            self.progress.step()
-            place = self.db.get_place_from_handle(handle)
-            handle_list = place.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        place.replace_note_references(None, new_handle)
-                        self.db.commit_place(place, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
-
-        for handle in self.db.get_citation_handles():
-            self.progress.step()
-            citation = self.db.get_citation_from_handle(handle)
-            handle_list = citation.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        citation.replace_note_references(None, new_handle)
-                        self.db.commit_citation(citation, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
-
-        for handle in self.db.get_source_handles():
-            self.progress.step()
-            source = self.db.get_source_from_handle(handle)
-            handle_list = source.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        source.replace_note_references(None, new_handle)
-                        self.db.commit_source(source, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
-
-        for handle in self.db.get_media_handles():
-            self.progress.step()
-            obj = self.db.get_media_from_handle(handle)
-            handle_list = obj.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        obj.replace_note_references(None, new_handle)
-                        self.db.commit_media(obj, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
-
-        for handle in self.db.get_event_handles():
-            self.progress.step()
-            event = self.db.get_event_from_handle(handle)
-            handle_list = event.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        event.replace_note_references(None, new_handle)
-                        self.db.commit_event(event, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
-
-        for handle in self.db.get_repository_handles():
-            self.progress.step()
-            repo = self.db.get_repository_from_handle(handle)
-            handle_list = repo.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Note':
-                    if not item[1]:
-                        new_handle = create_id()
-                        repo.replace_note_references(None, new_handle)
-                        self.db.commit_repository(repo, self.trans)
-                        self.invalid_note_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_note_references.add(item[1])
+        self._check_handle_references(
+            'Note', known_handles,
+            ('Person', 'Family', 'Place', 'Citation', 'Source', 'Media',
+             'Event', 'Repository'),
+            self.invalid_note_references)
 
         for bad_handle in self.invalid_note_references:
             make_unknown(bad_handle, self.explanation.handle,
@@ -1955,7 +1694,7 @@ class CheckIntegrity:
 
     def check_tag_references(self):
         '''Looking for tag reference problems'''
-        known_handles = self.db.get_tag_handles()
+        known_handles = set(self.db.iter_tag_handles())
 
         total = (self.db.get_number_of_people() +
                  self.db.get_number_of_families() +
@@ -1971,131 +1710,11 @@ class CheckIntegrity:
                                total)
         logging.info('Looking for tag reference problems')
 
-        for handle in self.db.get_person_handles():
-            self.progress.step()
-            person = self.db.get_person_from_handle(handle)
-            handle_list = person.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        person.replace_tag_references(None, new_handle)
-                        self.db.commit_person(person, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_family_handles():
-            self.progress.step()
-            family = self.db.get_family_from_handle(handle)
-            handle_list = family.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        family.replace_tag_references(None, new_handle)
-                        self.db.commit_family(family, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_media_handles():
-            self.progress.step()
-            obj = self.db.get_media_from_handle(handle)
-            handle_list = obj.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        obj.replace_tag_references(None, new_handle)
-                        self.db.commit_media(obj, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_note_handles():
-            self.progress.step()
-            note = self.db.get_note_from_handle(handle)
-            handle_list = note.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        note.replace_tag_references(None, new_handle)
-                        self.db.commit_note(note, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_event_handles():
-            self.progress.step()
-            event = self.db.get_event_from_handle(handle)
-            handle_list = event.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        event.replace_tag_references(None, new_handle)
-                        self.db.commit_event(event, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_citation_handles():
-            self.progress.step()
-            citation = self.db.get_citation_from_handle(handle)
-            handle_list = citation.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        citation.replace_tag_references(None, new_handle)
-                        self.db.commit_citation(citation, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_source_handles():
-            self.progress.step()
-            source = self.db.get_source_from_handle(handle)
-            handle_list = source.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        source.replace_tag_references(None, new_handle)
-                        self.db.commit_source(source, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_place_handles():
-            self.progress.step()
-            place = self.db.get_place_from_handle(handle)
-            handle_list = place.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        place.replace_tag_references(None, new_handle)
-                        self.db.commit_place(place, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
-
-        for handle in self.db.get_repository_handles():
-            self.progress.step()
-            repository = self.db.get_repository_from_handle(handle)
-            handle_list = repository.get_referenced_handles_recursively()
-            for item in handle_list:
-                if item[0] == 'Tag':
-                    if not item[1]:
-                        new_handle = create_id()
-                        repository.replace_tag_references(None, new_handle)
-                        self.db.commit_repository(repository, self.trans)
-                        self.invalid_tag_references.add(new_handle)
-                    elif item[1] not in known_handles:
-                        self.invalid_tag_references.add(item[1])
+        self._check_handle_references(
+            'Tag', known_handles,
+            ('Person', 'Family', 'Media', 'Note', 'Event', 'Citation',
+             'Source', 'Place', 'Repository'),
+            self.invalid_tag_references)
 
         for bad_handle in self.invalid_tag_references:
             make_unknown(bad_handle, None, self.class_tag,
@@ -18,7 +18,6 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 #
-from collections import OrderedDict
 
 "Find possible loop in a people descendance"
 
@@ -45,6 +44,7 @@ from gramps.gui.display import display_help
 from gramps.gui.glade import Glade
 from gramps.gen.display.name import displayer as _nd
 from gramps.gen.proxy import CacheProxyDb
+from gramps.plugins.lib.libloops import find_loops
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
 ngettext = glocale.translation.ngettext  # else "nearby" comments are ignored
@@ -76,7 +76,20 @@ class FindLoop(ManagedWindow):
         self.uistate = uistate
         #self.db = CacheProxyDb(dbstate.db)
         self.db = dbstate.db
+        self.loop = 0  # Number of loops found
 
+        if uistate:
+            self.init_gui()
+            self.run_tool()
+            self.show()
+        else:
+            self.add_row = self.add_row_cli
+            self.run_tool()
+
+    def init_gui(self):
+        """
+        Create the window and the model of the loops.
+        """
         top_dialog = Glade()
 
         top_dialog.connect_signals({
@@ -89,12 +102,6 @@ class FindLoop(ManagedWindow):
         title = top_dialog.get_object("title")
         self.set_window(window, title, self.title)
 
-        # start the progress indicator
-        self.progress = ProgressMeter(self.title, _('Starting'),
-                                      parent=uistate.window)
-        self.progress.set_pass(_('Looking for possible loop for each person'),
-                               self.db.get_number_of_people())
-
         self.model = Gtk.ListStore(
             GObject.TYPE_STRING,    # 0==father id
             GObject.TYPE_STRING,    # 1==father
@@ -138,122 +145,48 @@ class FindLoop(ManagedWindow):
         self.treeselection = self.treeview.get_selection()
         self.treeview.connect('row-activated', self.rowactivated_cb)
 
-        self.curr_fam = None
-        people = self.db.get_person_handles()
-        self.total = len(people)  # total number of people to process.
-        self.count = 0  # current number of people completely processed
-        self.loop = 0  # Number of loops found for GUI
-
-        pset = OrderedDict()
-        # pset is the handle list of persons from the current start of
-        # exploration path to the current limit.  The use of OrderedDict
-        # allows us to use it as a LIFO during recursion, as well as makes for
-        # quick lookup.  If we find a loop, pset provides a nice way to get
-        # the loop path.
-        self.done = set()
-        # self.done is the handle set of people that have been fully explored
-        # and do NOT have loops in the decendent tree.  We use this to avoid
-        # repeating work when we encounter one of these during the search.
-        for person_handle in people:
-            person = self.db.get_person_from_handle(person_handle)
-            self.current = person
-            self.parent = None
-            self.descendants(person_handle, pset)
-
-        # close the progress bar
-        self.progress.close()
-
-        self.show()
-
-    def descendants(self, person_handle, pset):
+    def run_tool(self):
         """
-        Find the descendants of a given person.
-        Returns False if a loop for the person is NOT found, True if loop found
-        We use the return value to ensure a person is not put on done list if
-        part of a loop
+        Find the loops and display them.
         """
-        if person_handle in self.done:
-            return False  # We have already verified no loops for this one
-        if person_handle in pset:
-            # We found one loop.
-            # person_handle is child, self.parent, self.curr_fam valid
-            # see if it has already been put into display
-            person = self.db.get_person_from_handle(person_handle)
-            pers_id = person.get_gramps_id()
-            pers_name = _nd.display(person)
-            parent_id = self.parent.get_gramps_id()
-            parent_name = _nd.display(self.parent)
-            value = (parent_id, parent_name, pers_id, pers_name, self.curr_fam)
-            found = False
-            for pth in range(len(self.model)):
-                path = Gtk.TreePath(pth)
-                treeiter = self.model.get_iter(path)
-                find = (self.model.get_value(treeiter, 0),
-                        self.model.get_value(treeiter, 1),
-                        self.model.get_value(treeiter, 2),
-                        self.model.get_value(treeiter, 3),
-                        self.model.get_value(treeiter, 4))
-                if find == value:
-                    found = True  # This loop is in display model
-                    break
-            if not found:
-                # Need to put loop in display model.
-                self.loop += 1
-                # place first node
-                self.model.append(value + (str(self.loop),))
-                state = 0
-                # Now search for loop beginning.
-                for hndl in pset.keys():
-                    if hndl != person_handle and state == 0:
-                        continue  # beginning not found
-                    if state == 0:
-                        state = 1  # found beginning, get first item to display
-                        continue
-                    # we have a good handle, now put item on display list
-                    self.parent = person
-                    person = self.db.get_person_from_handle(hndl)
-                    # Get the family that is both parent/person
-                    for fam_h in person.get_parent_family_handle_list():
-                        if fam_h in self.parent.get_family_handle_list():
-                            break
-                    family = self.db.get_family_from_handle(fam_h)
-                    fam_id = family.get_gramps_id()
-                    pers_id = person.get_gramps_id()
-                    pers_name = _nd.display(person)
-                    parent_id = self.parent.get_gramps_id()
-                    parent_name = _nd.display(self.parent)
-                    value = (parent_id, parent_name, pers_id, pers_name,
-                             fam_id, str(self.loop))
-                    self.model.append(value)
-            return True
-        # We are not part of loop (yet) so search descendents
-        person = self.db.get_person_from_handle(person_handle)
-        # put in the pset path list for recursive calls to find
-        pset[person_handle] = None
-        loop = False
-        for family_handle in person.get_family_handle_list():
-            family = self.db.get_family_from_handle(family_handle)
-            if not family:
-                # can happen with LivingProxyDb(PrivateProxyDb(db))
-                continue
-            for child_ref in family.get_child_ref_list():
-                child_handle = child_ref.ref
-                self.curr_fam = family.get_gramps_id()
-                self.parent = person
-                # if any descendants are part of loop, so is search person
-                loop |= self.descendants(child_handle, pset)
-        # we have completed search, we can pop the person off pset list
-        person_handle, dummy = pset.popitem(last=True)
+        if self.uistate:
+            # start the progress indicator
+            self.progress = ProgressMeter(self.title, _('Starting'),
+                                          parent=self.uistate.window)
+            self.progress.set_pass(
+                _('Looking for possible loop for each person'),
+                self.db.get_number_of_people())
+            loops = find_loops(self.db, self.progress.step)
+            # close the progress bar
+            self.progress.close()
+        else:
+            loops = find_loops(self.db)
+
+        for loop in loops:
+            self.loop += 1
+            for parent_handle, child_handle, family_handle in loop:
+                parent = self.db.get_person_from_handle(parent_handle)
+                child = self.db.get_person_from_handle(child_handle)
+                family = self.db.get_family_from_handle(family_handle)
+                self.add_row((parent.get_gramps_id(), _nd.display(parent),
+                              child.get_gramps_id(), _nd.display(child),
+                              family.get_gramps_id(), str(self.loop)))
+
+    def add_row(self, value):
+        """
+        Add a link of a loop to the display.
+        """
+        self.model.append(value)
 
-        if not loop:
-            # person was not in loop, so add to done list and update progress
-            self.done.add(person_handle)
-            self.count += 1
-            self.progress.set_header("%d/%d" % (self.count, self.total))
-            self.progress.step()
-            return False
-        # person was in loop...
-        return True
+    def add_row_cli(self, value):
+        """
+        Print a link of a loop, no GUI.
+        """
+        print(_("%(loop)s: %(parent_id)s %(parent)s, "
+                "%(child_id)s %(child)s, %(family_id)s") % {
+                    'parent_id': value[0], 'parent': value[1],
+                    'child_id': value[2], 'child': value[3],
+                    'family_id': value[4], 'loop': value[5]})
 
     def rowactivated_cb(self, treeview, path, column):
         """
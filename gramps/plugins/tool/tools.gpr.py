@@ -474,5 +474,5 @@ authors_email = ["serge.noiraud@free.fr"],
 category = TOOL_UTILS,
 toolclass = 'FindLoop',
 optionclass = 'FindLoopOptions',
-tool_modes = [TOOL_MODE_GUI]
+tool_modes = [TOOL_MODE_GUI, TOOL_MODE_CLI]
   )
@@ -44,7 +44,6 @@ Classe:
 #------------------------------------------------
 import gc
 import os
-import shutil
 import tempfile
 from collections import defaultdict
 from decimal import getcontext
@@ -487,8 +486,12 @@ class MediaPages(BasePage):
                                     "preview", media.get_handle())
                                 npath = os.path.join(path, media.get_handle())
                                 npath += ".png"
-                                self.report.copy_file(thmb_path, npath)
-                                path = npath
+                                if self.report.copy_file(thmb_path, npath,
+                                                         wait=True):
+                                    path = npath
+                                else:
+                                    path = os.path.join("images",
+                                                        "document.png")
                                 os.unlink(thmb_path)
                             except EnvironmentError:
                                 path = os.path.join("images", "document.png")
@@ -640,7 +643,6 @@ class MediaPages(BasePage):
             _WRONGMEDIAPATH.append([photo.get_gramps_id(), fullpath])
             return None
         try:
-            mtime = os.stat(fullpath).st_mtime
             if self.report.archive:
                 self.report.archive.add(fullpath, str(newpath))
             else:
@@ -648,8 +650,10 @@ class MediaPages(BasePage):
                 if not os.path.isdir(to_dir):
                     os.makedirs(to_dir)
                 new_file = os.path.join(self.html_dir, newpath)
-                shutil.copyfile(fullpath, new_file)
-                os.utime(new_file, (mtime, mtime))
+                # the failed copies are reported at the end of the report
+                if not self.report.copier.copy(fullpath, new_file,
+                                               photo.get_gramps_id()):
+                    return None
             return newpath
         except (IOError, OSError) as msg:
             error = _("Missing media object:"
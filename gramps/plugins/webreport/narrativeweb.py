@@ -49,9 +49,7 @@ Classes:
 import logging
 from functools import partial
 import os
-import sys
 import time
-import shutil
 import tarfile
 from io import BytesIO, TextIOWrapper
 from collections import defaultdict
@@ -78,6 +76,7 @@ from gramps.gen.config import config
 from gramps.gen.display.name import displayer as _nd
 from gramps.gen.display.place import displayer as _pd
 from gramps.gen.proxy import CacheProxyDb
+from gramps.gen.utils.file import FileCopier, COPY_STRATEGIES, COPY_CHANGED
 from gramps.plugins.lib.libhtmlconst import _CHARACTER_SETS, _CC, _COPY_OPTIONS
 from gramps.gen.relationship import get_relationship_calculator
 
@@ -163,6 +162,8 @@ class NavWebReport(Report):
         self.inc_gallery = self.options['gallery']
         self.inc_unused_gallery = self.options['unused']
         self.create_thumbs_only = self.options['create_thumbs_only']
+        self.copier = FileCopier(self.options['copystrategy'],
+                                 self.options['copyworkers'])
 
         self.opts = self.options
         self.inc_contact = self.opts['contactnote'] or self.opts['contactimg']
@@ -453,6 +454,19 @@ class NavWebReport(Report):
         # copy all of the neccessary files
         self.copy_narrated_files()
 
+        # wait for the pending media copies
+        self.copier.close()
+        LOG.info("media files: %s", self.copier.get_summary())
+        if self.copier.errors:
+            error = '\n'.join([
+                (_('ID=%(grampsid)s, path=%(dir)s') % {
+                    'grampsid' : x[0],
+                    'dir'      : x[1]} if x[0] else x[1]) + ': ' + x[2]
+                for x in self.copier.errors[:10]])
+            if len(self.copier.errors) > 10:
+                error += '\n ...'
+            self.user.warn(_("Copying error"), error)
+
         # if an archive is being used, close it?
         if self.archive:
             self.archive.close()
@@ -1466,7 +1480,7 @@ class NavWebReport(Report):
                                   handle + '.png')
         return real_path, thumb_path
 
-    def copy_file(self, from_fname, to_fname, to_dir=''):
+    def copy_file(self, from_fname, to_fname, to_dir='', wait=False):
         """
         Copy a file from a source to a (report) destination.
         If to_dir is not present and if the target is not an archive,
@@ -1476,6 +1490,10 @@ class NavWebReport(Report):
         @param: to_fname   -- Will be just a filename, without directory path.
         @param: to_dir     -- Is the relative path name in the destination root.
                               It will be prepended before 'to_fname'.
+        @param: wait       -- If True, the file is copied before returning,
+                              so that a temporary file can then be removed.
+
+        Return False if the copy failed.
         """
         if self.usecms:
             to_dir = "/" + self.target_uri + "/" + to_dir
@@ -1504,13 +1522,7 @@ class NavWebReport(Report):
                 os.makedirs(destdir)
 
             if from_fname != dest:
-                try:
-                    shutil.copyfile(from_fname, dest)
-                    os.utime(dest, (mtime, mtime))
-                except Exception as exception:
-                    LOG.exception(exception)
-                    print("Copying error: %s" % sys.exc_info()[1])
-                    print("Continuing...")
+                return self.copier.copy(from_fname, dest, wait=wait)
             elif self.warn_dir:
                 self.user.warn(
                     _("Possible destination error") + "\n" +
@@ -1521,6 +1533,7 @@ class NavWebReport(Report):
                       "a different directory to store your generated "
                       "web pages."))
                 self.warn_dir = False
+        return True
 
     def person_in_webreport(self, person_handle):
         """
@@ -1875,6 +1888,22 @@ class NavWebOptions(MenuReportOptions):
         self.__create_thumbs_only.connect("value-changed",
                                           self.__gallery_changed)
 
+        copystrategy = EnumeratedListOption(_("Copying of media files"),
+                                            COPY_CHANGED)
+        for strategy, description in COPY_STRATEGIES:
+            copystrategy.add_item(strategy, description)
+        copystrategy.set_help(
+            _("Whether to copy every media file again, to skip the files "
+              "which are unchanged in the destination (same size and "
+              "modification time) or also to link them instead of copying "
+              "them when possible."))
+        addopt("copystrategy", copystrategy)
+
+        copyworkers = NumberOption(_("Number of parallel copies"), 1, 1, 16)
+        copyworkers.set_help(
+            _("The number of media files copied at the same time"))
+        addopt("copyworkers", copyworkers)
+
         self.__maxinitialimagewidth = NumberOption(
             _("Max width of initial image"), _DEFAULT_MAX_IMG_WIDTH, 0, 2000)
         self.__maxinitialimagewidth.set_help(